@@ -15,7 +15,7 @@ from vibetuner.rendering import (
     render_template_stream,
     render_template_string,
 )
-from vibetuner.sse import broadcast, sse_endpoint
+from vibetuner.sse import broadcast, broadcast_many, sse_endpoint
 from vibetuner.theming import register_tenant_theme_provider
 
 
@@ -35,6 +35,7 @@ __all__ = [
     "AsyncTyper",
     "VibetunerApp",
     "broadcast",
+    "broadcast_many",
     "create_crud_routes",
     "register_context_provider",
     "register_globals",
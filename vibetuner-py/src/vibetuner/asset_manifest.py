@@ -0,0 +1,152 @@
+# ABOUTME: Per-file content hashes for static assets and the static_url() template global.
+# ABOUTME: Unchanged assets keep their fingerprinted URL, and their browser cache, across deploys.
+import hashlib
+import json
+import threading
+from functools import cache
+from pathlib import Path
+
+from vibetuner.compression import ENCODING_SUFFIXES
+from vibetuner.logging import logger
+
+
+# Static directories covered by the manifest, keyed by their URL segment.
+ASSET_KINDS: tuple[str, ...] = ("css", "img", "js")
+
+# Written next to the css/img/js directories by `vibetuner assets manifest`.
+MANIFEST_FILENAME = "asset-manifest.json"
+
+# Fingerprinted assets are served from /static/h/{kind}/{hash}/{path}.
+FINGERPRINT_PREFIX = "/static/h"
+
+_SIBLING_SUFFIXES = frozenset(ENCODING_SUFFIXES.values())
+
+
+def hash_file(path: Path) -> str:
+    """Short content hash used as an asset's fingerprint."""
+    digest = hashlib.blake2b(digest_size=8)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(directories: dict[str, Path]) -> dict[str, str]:
+    """Map every asset under ``directories`` to its content hash.
+
+    Keys are ``{kind}/{relative path}`` (e.g. ``css/bundle.css``). Dotfiles
+    and precompressed ``.zst``/``.br``/``.gz`` siblings are skipped; the
+    siblings are served under their source file's fingerprint.
+    """
+    manifest: dict[str, str] = {}
+    for kind, directory in directories.items():
+        if not directory.is_dir():
+            continue
+        for path in sorted(directory.rglob("*")):
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            if path.suffix in _SIBLING_SUFFIXES:
+                continue
+            key = f"{kind}/{path.relative_to(directory).as_posix()}"
+            manifest[key] = hash_file(path)
+    return manifest
+
+
+def write_manifest(path: Path, manifest: dict[str, str]) -> None:
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+class AssetManifest:
+    """Content hashes for the static assets, loaded once per process.
+
+    Hashes come from the build-time manifest when one exists. Assets missing
+    from it (or every asset, when no manifest was built) are hashed on first
+    use and remembered, so ``static_url()`` still emits stable per-file URLs.
+    """
+
+    def __init__(
+        self, directories: dict[str, Path], manifest_path: Path | None = None
+    ) -> None:
+        self.directories = directories
+        self.manifest_path = manifest_path
+        self._hashes: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, str]:
+        if self._hashes is None:
+            hashes: dict[str, str] = {}
+            if self.manifest_path is not None and self.manifest_path.is_file():
+                try:
+                    hashes = json.loads(self.manifest_path.read_text())
+                except (OSError, ValueError) as exc:
+                    logger.warning(
+                        "Ignoring unreadable asset manifest {}: {}",
+                        self.manifest_path,
+                        exc,
+                    )
+            else:
+                logger.debug(
+                    "No asset manifest found; hashing static assets on first use. "
+                    "Run `vibetuner assets manifest` at build time to avoid this."
+                )
+            self._hashes = hashes
+        return self._hashes
+
+    def hash_for(self, asset: str) -> str | None:
+        """Content hash of ``{kind}/{path}``, or None if there is no such file."""
+        hashes = self._load()
+        if (found := hashes.get(asset)) is not None:
+            return found
+
+        kind, _, relative = asset.partition("/")
+        directory = self.directories.get(kind)
+        if directory is None or not relative:
+            return None
+        path = directory / relative
+        # Refuse to hash anything outside the static directory.
+        if not path.resolve().is_relative_to(directory.resolve()):
+            return None
+        if not path.is_file():
+            return None
+        with self._lock:
+            return hashes.setdefault(asset, hash_file(path))
+
+    def url(self, asset: str) -> str | None:
+        """Fingerprinted URL of ``{kind}/{path}``, or None if it does not exist."""
+        file_hash = self.hash_for(asset)
+        if file_hash is None:
+            return None
+        kind, _, relative = asset.partition("/")
+        return f"{FINGERPRINT_PREFIX}/{kind}/{file_hash}/{relative}"
+
+
+@cache
+def get_asset_manifest() -> AssetManifest:
+    """Process-wide manifest for the project's css/img/js directories."""
+    from vibetuner.paths import paths
+
+    directories = {kind: getattr(paths, kind) for kind in ASSET_KINDS}
+    manifest_path = paths.statics / MANIFEST_FILENAME if paths.statics else None
+    return AssetManifest(directories, manifest_path)
+
+
+def static_url(asset: str) -> str:
+    """URL for a static asset, fingerprinted with the file's own content hash.
+
+    Usage in templates::
+
+        <link rel="stylesheet" href="{{ static_url('css/bundle.css') }}">
+
+    Unlike ``url_for('css', ...)``, which versions every asset with the global
+    ``v_hash``, the URL only changes when the file does, so unchanged assets
+    stay cached across deploys. In debug mode, where assets are rebuilt in
+    place, the ``v_hash`` URL is returned instead.
+    """
+    from vibetuner.config import settings
+
+    asset = asset.lstrip("/")
+    if not settings.debug:
+        url = get_asset_manifest().url(asset)
+        if url is not None:
+            return url
+    return f"/static/v{settings.v_hash}/{asset}"
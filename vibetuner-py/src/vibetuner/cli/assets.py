@@ -0,0 +1,85 @@
+# ABOUTME: CLI commands for build-time processing of static assets.
+# ABOUTME: Precompresses css/img/js and writes the per-file content-hash manifest.
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+assets_app = typer.Typer(
+    help="Build-time static asset processing", no_args_is_help=True
+)
+
+
+@assets_app.command()
+def compress(
+    directories: Annotated[
+        list[Path] | None,
+        typer.Argument(
+            help="Directories to process. Defaults to the project's css, img and js."
+        ),
+    ] = None,
+    min_size: Annotated[
+        int,
+        typer.Option("--min-size", help="Skip files smaller than this many bytes"),
+    ] = 512,
+) -> None:
+    """Write precompressed .zst/.br/.gz siblings next to static assets.
+
+    Run after building CSS/JS (e.g. in the Dockerfile). The static mounts
+    serve a sibling whenever the client accepts its encoding, so assets are
+    never compressed per request. br is only produced when the optional
+    ``brotli`` package is installed.
+    """
+    from vibetuner.compression import available_encodings, precompress_directory
+    from vibetuner.paths import paths
+
+    targets = directories or [paths.css, paths.img, paths.js]
+    encodings = ", ".join(available_encodings())
+    total = 0
+    for directory in targets:
+        if not directory.is_dir():
+            typer.echo(f"Skipping {directory}: not a directory", err=True)
+            continue
+        written = precompress_directory(directory, min_size=min_size)
+        total += len(written)
+        typer.echo(f"{directory}: {len(written)} file(s) written ({encodings})")
+    typer.echo(f"Precompressed {total} file(s).")
+
+
+@assets_app.command()
+def manifest(
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Manifest path. Defaults to assets/statics/asset-manifest.json.",
+        ),
+    ] = None,
+) -> None:
+    """Write the per-file content-hash manifest used by ``static_url()``.
+
+    Run after building CSS/JS (e.g. in the Dockerfile). Each asset's URL
+    then only changes when its own content does, so unchanged assets stay
+    cached across deploys. Without a manifest, hashes are computed on first
+    use at runtime instead.
+    """
+    from vibetuner.asset_manifest import (
+        ASSET_KINDS,
+        MANIFEST_FILENAME,
+        build_manifest,
+        write_manifest,
+    )
+    from vibetuner.paths import paths
+
+    if output is None:
+        if paths.statics is None:
+            typer.echo("No project root found; pass --output.", err=True)
+            raise typer.Exit(1)
+        output = paths.statics / MANIFEST_FILENAME
+
+    hashes = build_manifest({kind: getattr(paths, kind) for kind in ASSET_KINDS})
+    output.parent.mkdir(parents=True, exist_ok=True)
+    write_manifest(output, hashes)
+    typer.echo(f"Wrote {len(hashes)} asset hash(es) to {output}")
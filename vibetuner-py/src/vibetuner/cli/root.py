@@ -7,6 +7,7 @@ from functools import partial, wraps
 import asyncer
 import typer
 
+from vibetuner.cli.assets import assets_app
 from vibetuner.cli.config import config_app
 from vibetuner.cli.crypto import crypto_app
 from vibetuner.cli.db import db_app
@@ -146,6 +147,7 @@ async def worker_health() -> None:
         raise typer.Exit(code=code)
 
 
+app.add_typer(assets_app, name="assets")
 app.add_typer(config_app, name="config")
 app.add_typer(crypto_app, name="crypto")
 app.add_typer(db_app, name="db")
@@ -0,0 +1,218 @@
+# ABOUTME: Content-coding helpers shared by the compression middleware and static files.
+# ABOUTME: Negotiates Accept-Encoding, streams zstd/br/gzip, and precompresses asset trees.
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+from vibetuner.logging import logger
+
+
+def _load_zstd() -> Any:
+    # Python 3.14 ships zstd in the stdlib; older versions get the backport
+    # through pymongo's zstd extra (pulled in by beanie[zstd]).
+    try:
+        from compression import zstd  # ty: ignore[unresolved-import]
+    except ImportError:
+        try:
+            from backports import zstd
+        except ImportError:
+            return None
+    return zstd
+
+
+def _load_brotli() -> Any:
+    # Brotli is optional: `uv add brotli` to enable `br` responses.
+    try:
+        import brotli  # ty: ignore[unresolved-import]
+    except ImportError:
+        return None
+    return brotli
+
+
+_zstd = _load_zstd()
+_brotli = _load_brotli()
+
+# Server preference order, used to break ties between equal client q-values.
+ENCODING_PREFERENCE: tuple[str, ...] = ("zstd", "br", "gzip")
+
+# File suffix of the precompressed sibling for each content coding.
+ENCODING_SUFFIXES: dict[str, str] = {"zstd": ".zst", "br": ".br", "gzip": ".gz"}
+
+# Files that are already compressed gain nothing from another pass.
+_INCOMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        *ENCODING_SUFFIXES.values(),
+        ".avif",
+        ".gif",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".zip",
+    }
+)
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Content codings this process can produce, in preference order."""
+    return tuple(
+        name
+        for name in ENCODING_PREFERENCE
+        if (name != "zstd" or _zstd is not None)
+        and (name != "br" or _brotli is not None)
+    )
+
+
+def negotiate_encoding(accept_encoding: str, offered: Iterable[str]) -> str | None:
+    """Pick the best content coding from an ``Accept-Encoding`` header value.
+
+    The highest client q-value wins; ties go to the earliest entry in
+    ``offered``. Codings with ``q=0`` are refused and ``*`` matches any
+    offered coding not listed explicitly. Returns None when nothing offered
+    is acceptable, meaning the identity coding should be used.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*")
+    best: str | None = None
+    best_q = 0.0
+    for name in offered:
+        q = weights.get(name, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _ZstdCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = _zstd.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data, mode=self._obj.FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(mode=self._obj.FLUSH_FRAME)
+
+
+class _BrotliCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = _brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+def stream_compressor(encoding: str, level: int) -> StreamCompressor:
+    """Return an incremental compressor that flushes after every chunk.
+
+    Flushing per chunk keeps streamed responses (``render_template_stream``,
+    chunked ``FileResponse``) progressive instead of buffering them whole.
+    """
+    if encoding == "gzip":
+        return _GzipCompressor(level)
+    if encoding == "zstd":
+        return _ZstdCompressor(level)
+    if encoding == "br":
+        return _BrotliCompressor(level)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress a complete body in one shot."""
+    compressor = stream_compressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+# Build-time levels: assets are compressed once, so spend the CPU.
+BUILD_LEVELS: dict[str, int] = {"zstd": 19, "br": 11, "gzip": 9}
+
+
+def precompress_directory(
+    directory: Path,
+    *,
+    encodings: Iterable[str] | None = None,
+    min_size: int = 512,
+) -> list[Path]:
+    """Write ``.zst`` / ``.br`` / ``.gz`` siblings for every asset in a tree.
+
+    Run at build time so the static mounts can serve precompressed files with
+    no per-request compression. A sibling is skipped when it is already newer
+    than its source, when the source is below ``min_size`` or already
+    compressed, or when compressing would not make it smaller.
+
+    Returns:
+        Paths of the sibling files written.
+    """
+    wanted = tuple(encodings or available_encodings())
+    written: list[Path] = []
+    for source in sorted(directory.rglob("*")):
+        if not source.is_file() or source.name.startswith("."):
+            continue
+        if source.suffix.lower() in _INCOMPRESSIBLE_SUFFIXES:
+            continue
+        source_stat = source.stat()
+        if source_stat.st_size < min_size:
+            continue
+
+        data: bytes | None = None
+        for encoding in wanted:
+            target = source.with_name(source.name + ENCODING_SUFFIXES[encoding])
+            if target.exists() and target.stat().st_mtime >= source_stat.st_mtime:
+                continue
+            if data is None:
+                data = source.read_bytes()
+            compressed = compress(data, encoding, BUILD_LEVELS[encoding])
+            if len(compressed) >= len(data):
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(compressed)
+            written.append(target)
+            logger.debug(
+                "Precompressed {} ({} -> {} bytes)", target, len(data), len(compressed)
+            )
+    return written
@@ -151,6 +151,101 @@ class RateLimitSettings(BaseSettings):
     )
 
 
+class CompressionSettings(BaseSettings):
+    """Settings for the response compression middleware.
+
+    Responses are compressed with the best of zstd, br (when the optional
+    ``brotli`` package is installed) and gzip that the client accepts.
+    Only bodies of at least ``minimum_size`` bytes whose media type is in
+    ``content_types`` are compressed.
+    """
+
+    enabled: bool = True
+    minimum_size: int = 500
+    content_types: list[str] = [
+        "text/html",
+        "text/css",
+        "text/plain",
+        "text/javascript",
+        "text/xml",
+        "application/javascript",
+        "application/json",
+        "application/manifest+json",
+        "application/xml",
+        "image/svg+xml",
+    ]
+    # Runtime levels favour latency; build-time precompression uses maximum levels.
+    zstd_level: int = 3
+    brotli_quality: int = 4
+    gzip_level: int = 6
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="COMPRESSION_",
+        env_file=_ENV_FILES,
+    )
+
+
+# What happens when an SSE subscriber's queue is full (see SSESettings).
+SlowConsumerPolicy = Literal["drop_oldest", "coalesce", "disconnect"]
+
+
+class SSESettings(BaseSettings):
+    """Settings for Server-Sent Events streaming.
+
+    Each connected client gets a queue of at most ``queue_size`` pending
+    events (0 means unbounded). When a slow client's queue is full,
+    ``slow_consumer_policy`` decides what happens:
+
+    - ``drop_oldest``: discard the oldest pending event.
+    - ``coalesce``: keep only the latest pending event per event name, then
+      drop the oldest if that is not enough.
+    - ``disconnect``: close the stream; the browser reconnects and resumes
+      via ``Last-Event-ID`` when the endpoint has a ``buffer_size``.
+
+    ``buffer_backend`` selects where ``sse_endpoint(buffer_size=...)`` keeps
+    events for ``Last-Event-ID`` replay: ``memory`` (per worker) or ``redis``
+    (a Redis Stream per channel shared by all workers, kept for
+    ``stream_ttl`` seconds after the last event; requires ``REDIS_URL``).
+
+    A connection that receives nothing for between one and two
+    ``keepalive_interval`` periods gets a keepalive comment, so proxies do
+    not close it as idle.
+
+    ``max_connections``, ``max_connections_per_user`` (authenticated users)
+    and ``max_connections_per_channel`` cap the SSE streams each worker
+    serves (0 means unlimited). Over-limit requests get
+    ``over_limit_response``: ``retry`` sends an empty stream whose ``retry:``
+    field makes the browser reconnect after ``over_limit_retry_after``
+    seconds (jittered up to twice that, to spread reconnect storms), and
+    ``503`` answers HTTP 503 with a ``Retry-After`` header.
+
+    ``metrics_token`` enables ``/health/sse/metrics``, the Prometheus
+    endpoint for scrapers, which must send it as a bearer token. Unset, the
+    endpoint answers 404 and the metrics stay behind the debug access check.
+    """
+
+    queue_size: int = 256
+    slow_consumer_policy: SlowConsumerPolicy = "drop_oldest"
+    buffer_backend: Literal["memory", "redis"] = "memory"
+    stream_ttl: int = 24 * 60 * 60
+    keepalive_interval: float = 15.0
+    max_connections: int = 0
+    max_connections_per_user: int = 0
+    max_connections_per_channel: int = 0
+    over_limit_response: Literal["retry", "503"] = "retry"
+    over_limit_retry_after: float = 5.0
+    metrics_token: SecretStr | None = None
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="SSE_",
+        env_file=_ENV_FILES,
+    )
+
+
 class LocaleDetectionSettings(BaseSettings):
     """Settings for locale detection selectors.
 
@@ -317,6 +412,12 @@ class CoreConfiguration(BaseSettings):
     environment: Literal["dev", "prod"] = "dev"
     session_key: SecretStr = SecretStr(DEFAULT_SESSION_KEY_PLACEHOLDER)
 
+    # Where session data lives. "cookie" signs the whole session into the
+    # cookie; "redis" keeps it server-side and only puts an opaque ID in the
+    # cookie (requires REDIS_URL, falls back to "cookie" without it).
+    session_backend: Literal["cookie", "redis"] = "cookie"
+    session_max_age: int = 14 * 24 * 60 * 60
+
     # Database and Cache URLs
     mongodb_url: MongoDsn | None = None
     redis_url: RedisDsn | None = None
@@ -421,6 +522,12 @@ class CoreConfiguration(BaseSettings):
     # Rate limiting settings
     rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
 
+    # Response compression settings
+    compression: CompressionSettings = Field(default_factory=CompressionSettings)
+
+    # Server-Sent Events settings (SSE_* env vars)
+    sse: SSESettings = Field(default_factory=SSESettings)
+
     # Locale detection settings
     locale_detection: LocaleDetectionSettings = Field(
         default_factory=LocaleDetectionSettings
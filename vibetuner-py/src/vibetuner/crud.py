@@ -1,15 +1,47 @@
 # ABOUTME: Generic CRUD route factory for Beanie Document classes.
 # ABOUTME: Generates list/create/read/update/delete routes with pagination, filtering, and sorting.
+import base64
+import binascii
+import hashlib
+import json
 import re
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum, StrEnum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Literal
+from uuid import UUID, uuid4
 
 from beanie import Document, PydanticObjectId
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from pydantic import BaseModel
+from beanie.exceptions import RevisionIdWasChanged
+from beanie.odm.actions import ActionDirections, ActionRegistry, EventTypes
+from beanie.odm.utils.dump import get_dict
+from beanie.odm.utils.encoder import Encoder
+from bson import ObjectId, json_util
+from bson.binary import UUID_SUBTYPE, Binary
+from bson.errors import InvalidBSON
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pymongo import ASCENDING, DESCENDING, TEXT, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from vibetuner.logging import logger
+from vibetuner.models.mixins import (
+    SEARCH_TERM_MAX_LENGTH,
+    PrefixSearchMixin,
+    TimeStampMixin,
+    normalize_search_text,
+)
+from vibetuner.time import now
 
 
 class Operation(StrEnum):
@@ -24,6 +56,19 @@ class Operation(StrEnum):
 
 ALL_OPERATIONS: set[Operation] = set(Operation)
 
+# "offset" pages with skip/limit; "cursor" pages with keyset range queries.
+Pagination = Literal["offset", "cursor"]
+
+# How offset-paginated list responses compute "total"; see create_crud_routes.
+CountMode = Literal["exact", "facet", "estimated", "capped", "none"]
+
+# How the list endpoint's ``search`` param matches; see create_crud_routes.
+SearchMode = Literal["regex", "text", "prefix"]
+
+# Whether list filter/sort indexes are created at startup; see create_crud_routes.
+IndexPolicy = Literal["create", "warn", "off"]
+IndexUsage = Literal["filter", "sort", "filter_sort", "search"]
+
 PreHook = Callable[..., Any]
 PostHook = Callable[..., Any]
 
@@ -42,22 +87,31 @@ def _apply_filters(query, request: Request, filterable: list[str]):
     return query
 
 
-def _apply_search(query, search: str | None, searchable: list[str]):
+def _apply_search(
+    query, search: str | None, searchable: list[str], mode: SearchMode = "regex"
+):
     """Apply text search across searchable fields."""
     q = search
-    if q and searchable:
-        escaped_q = re.escape(q)
-        search_filter = {
-            "$or": [{f: {"$regex": escaped_q, "$options": "i"}} for f in searchable]
-        }
-        query = query.find(search_filter)
-    return query
-
-
-def _apply_sort(query, sort: str | None, sortable: list[str]):
-    """Apply sorting to a query."""
-    if not sort or not sortable:
+    if not q or not searchable:
         return query
+    if mode == "text":
+        return query.find({"$text": {"$search": q}})
+    if mode == "prefix":
+        # Anchored and case-sensitive on pre-normalized terms, so the
+        # search_terms index bounds the scan.
+        prefix = normalize_search_text(q)[:SEARCH_TERM_MAX_LENGTH]
+        return query.find({"search_terms": {"$regex": f"^{re.escape(prefix)}"}})
+    escaped_q = re.escape(q)
+    search_filter = {
+        "$or": [{f: {"$regex": escaped_q, "$options": "i"}} for f in searchable]
+    }
+    return query.find(search_filter)
+
+
+def _parse_sort(sort: str | None, sortable: list[str]) -> list[str]:
+    """Turn a ``sort`` query param into ``+field``/``-field`` parts."""
+    if not sort or not sortable:
+        return []
     sort_parts = []
     for part in sort.split(","):
         part = part.strip()
@@ -67,9 +121,248 @@ def _apply_sort(query, sort: str | None, sortable: list[str]):
             field, direction = part.lstrip("+"), "+"
         if field in sortable:
             sort_parts.append(f"{direction}{field}")
+    return sort_parts
+
+
+# ────────────────────────────────────────────────────────────────
+#  Offset pages and totals
+# ────────────────────────────────────────────────────────────────
+
+
+async def _facet_page(
+    model: type[Document],
+    query,
+    sort_parts: list[str],
+    offset: int,
+    limit: int,
+    projection_model: type[BaseModel] | None = None,
+    raw: bool = False,
+) -> tuple[list, int]:
+    """Fetch one page and the total in a single ``$facet`` aggregation.
+
+    With ``raw``, items are returned as the BSON-decoded dicts.
+    """
+    pipeline: list[dict[str, Any]] = [{"$match": query.get_filter_query()}]
     if sort_parts:
-        query = query.sort(sort_parts)
-    return query
+        pipeline.append(
+            {"$sort": {p[1:]: -1 if p[0] == "-" else 1 for p in sort_parts}}
+        )
+    items_stages: list[dict[str, Any]] = [{"$skip": offset}, {"$limit": limit}]
+    if projection_model is not None:
+        items_stages.append({"$project": _projection(projection_model)})
+    pipeline.append({"$facet": {"items": items_stages, "total": [{"$count": "n"}]}})
+    cursor = await model.get_pymongo_collection().aggregate(pipeline)
+    result = (await cursor.to_list(length=1))[0]
+    items = result["items"]
+    if not raw:
+        item_model = projection_model or model
+        items = [item_model.model_validate(doc) for doc in items]
+    return items, result["total"][0]["n"] if result["total"] else 0
+
+
+async def _find_raw(
+    model: type[Document],
+    query,
+    sort_parts: list[str],
+    skip: int,
+    limit: int,
+    projection: dict[str, int] | None = None,
+) -> list[dict[str, Any]]:
+    """Run ``query`` on the pymongo cursor, returning BSON-decoded dicts."""
+    cursor = model.get_pymongo_collection().find(query.get_filter_query(), projection)
+    if sort_parts:
+        cursor = cursor.sort(
+            [(p[1:], DESCENDING if p[0] == "-" else ASCENDING) for p in sort_parts]
+        )
+    return await cursor.skip(skip).limit(limit).to_list(length=limit)
+
+
+async def _count_total(
+    model: type[Document], query, count: CountMode, count_cap: int
+) -> tuple[int | None, bool]:
+    """Total for an offset page as ``(total, capped)``."""
+    if count == "none":
+        return None, False
+    collection = model.get_pymongo_collection()
+    filter_query = query.get_filter_query()
+    if count == "estimated" and not filter_query:
+        # Reads collection metadata instead of scanning; may be slightly off
+        # after an unclean shutdown or on sharded clusters with orphans.
+        return await collection.estimated_document_count(), False
+    if count == "capped":
+        total = await collection.count_documents(filter_query, limit=count_cap + 1)
+        return min(total, count_cap), total > count_cap
+    return await collection.count_documents(filter_query), False
+
+
+async def _offset_page(
+    model: type[Document],
+    query,
+    sort_parts: list[str],
+    offset: int,
+    limit: int,
+    count: CountMode,
+    count_cap: int,
+    projection_model: type[BaseModel] | None = None,
+    raw: bool = False,
+) -> dict[str, Any]:
+    """Fetch an offset page and its total as configured by ``count``.
+
+    With ``raw``, items are BSON-decoded dicts read straight from the
+    pymongo cursor (``projection_model`` is then ignored).
+    """
+    if count == "facet":
+        items, total = await _facet_page(
+            model, query, sort_parts, offset, limit, projection_model, raw
+        )
+        return {"items": items, "total": total}
+
+    total, capped = await _count_total(model, query, count, count_cap)
+    if raw:
+        items = await _find_raw(model, query, sort_parts, offset, limit)
+    else:
+        if sort_parts:
+            query = query.sort(sort_parts)
+        if projection_model is not None:
+            query = query.project(projection_model)
+        items = await query.skip(offset).limit(limit).to_list()
+    page: dict[str, Any] = {"items": items, "total": total}
+    if count == "capped":
+        page["total_capped"] = capped
+    return page
+
+
+# ────────────────────────────────────────────────────────────────
+#  Field selection (projection pushdown)
+# ────────────────────────────────────────────────────────────────
+
+
+def _parse_fields(fields: str | None) -> set[str]:
+    """Field names requested via the ``fields`` query param."""
+    if not fields:
+        return set()
+    return {f.strip() for f in fields.split(",") if f.strip()}
+
+
+@lru_cache(maxsize=256)
+def _projection_model(model: type[Document], fields: frozenset[str]) -> type[BaseModel]:
+    """Lightweight model holding only ``fields`` (and ``id``) of ``model``.
+
+    Passed to Beanie's ``project()``, it makes MongoDB return just those
+    fields, and results are validated into this model instead of the full
+    document. Every field is optional, so documents missing one still load.
+    Unknown names are ignored.
+    """
+    annotations: dict[str, Any] = {"id": PydanticObjectId | None}
+    defaults: dict[str, Any] = {"id": Field(None, alias="_id")}
+    for name, field_info in model.model_fields.items():
+        if name in fields and name != "id":
+            annotations[name] = field_info.annotation | None
+            defaults[name] = Field(None, alias=field_info.alias)
+    return type(
+        f"{model.__name__}Projection",
+        (BaseModel,),
+        {"__annotations__": annotations, **defaults},
+    )
+
+
+def _projection(projection_model: type[BaseModel]) -> dict[str, int]:
+    """MongoDB projection document for a projection model."""
+    return {
+        field_info.alias or name: 1
+        for name, field_info in projection_model.model_fields.items()
+    }
+
+
+# ────────────────────────────────────────────────────────────────
+#  Keyset (cursor) pagination
+# ────────────────────────────────────────────────────────────────
+
+
+def _keyset_sort(sort: str | None, sortable: list[str]) -> list[str]:
+    """Sort parts for cursor pagination, always ending in ``_id`` as tie-break.
+
+    ``_id`` follows the direction of the first sort field, so a
+    ``(field, _id)`` compound index serves both directions of ``field``.
+    """
+    sort_parts = _parse_sort(sort, sortable)
+    direction = sort_parts[0][0] if sort_parts else "+"
+    return [*sort_parts, f"{direction}_id"]
+
+
+def _document_value(doc: BaseModel | dict[str, Any], field: str) -> Any:
+    """Value of a (possibly dotted) sort field on a loaded or raw document."""
+    if isinstance(doc, dict):
+        value: Any = doc
+    elif field == "_id":
+        # Documents and projection models both carry ``id``; BaseModel doesn't.
+        return getattr(doc, "id", None)
+    else:
+        value = doc.model_dump()
+    for key in field.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def _encode_cursor(sort_parts: list[str], doc: BaseModel | dict[str, Any]) -> str:
+    """Opaque cursor holding the sort spec and the sort key of ``doc``."""
+    values = [_document_value(doc, part[1:]) for part in sort_parts]
+    raw = json_util.dumps({"s": sort_parts, "v": values}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_parts: list[str]) -> list[Any]:
+    """Sort key values stored in ``cursor``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or was issued for a
+            different sort order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        decoded = json_util.loads(raw)
+        values = decoded["v"]
+        cursor_sort = decoded["s"]
+    except (binascii.Error, InvalidBSON, KeyError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if cursor_sort != sort_parts or len(values) != len(sort_parts):
+        raise HTTPException(
+            status_code=400, detail="Cursor does not match the requested sort"
+        )
+    return values
+
+
+def _keyset_after(field: str, descending: bool, value: Any) -> dict[str, Any] | None:
+    """Condition for ``field`` sorting strictly after ``value``, if any can.
+
+    MongoDB sorts null (and missing) before every other value, but ``$gt`` and
+    ``$lt`` never match across types, so a null boundary is spelled out.
+    """
+    if value is None:
+        return None if descending else {field: {"$ne": None}}
+    op = "$lt" if descending else "$gt"
+    if descending and field != "_id":
+        # Nulls come last in descending order; ``_id`` is never null.
+        return {"$or": [{field: {op: value}}, {field: None}]}
+    return {field: {op: value}}
+
+
+def _keyset_filter(sort_parts: list[str], values: list[Any]) -> dict[str, Any]:
+    """Range filter selecting documents strictly after the cursor position.
+
+    For sort ``a, b, _id`` this is ``a > va OR (a = va AND b > vb) OR
+    (a = va AND b = vb AND _id > vid)``, with ``$lt`` for descending fields.
+    Null cursor values follow MongoDB's sort order (see :func:`_keyset_after`).
+    """
+    clauses = []
+    for i, part in enumerate(sort_parts):
+        after = _keyset_after(part[1:], part[0] == "-", values[i])
+        if after is None:
+            continue
+        clause = {p[1:]: v for p, v in zip(sort_parts[:i], values[:i], strict=True)}
+        clause.update(after)
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
 
 
 def _serialize_items(
@@ -79,7 +372,7 @@ def _serialize_items(
 ) -> list:
     """Serialize items with optional field selection and response schema."""
     if fields:
-        selected = {f.strip() for f in fields.split(",")}
+        selected = _parse_fields(fields)
         return [_select_fields(item, selected, response_schema) for item in items]
     if response_schema:
         return [
@@ -89,6 +382,64 @@ def _serialize_items(
     return items
 
 
+@lru_cache(maxsize=128)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Compiled validator and JSON serializer for a list of ``schema``."""
+    return TypeAdapter(list[schema])  # ty: ignore[invalid-type-form]
+
+
+def _plain_bson(value: Any) -> Any:
+    """Raw BSON value with ObjectIds as strings, as ``mode="json"`` dumps them."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, dict):
+        return {k: _plain_bson(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain_bson(v) for v in value]
+    return value
+
+
+def _raw_json_response(
+    docs: list[dict[str, Any]],
+    model: type[Document],
+    response_schema: type[BaseModel] | None,
+    meta: dict[str, Any],
+) -> Response:
+    """JSON list response built from raw documents by pydantic-core.
+
+    Raw dicts are validated and serialized by a cached ``TypeAdapter`` in
+    one pass each, instead of hydrating Beanie documents and running them
+    through ``model_dump()``/``model_validate()`` and FastAPI's encoder.
+    For documents that store every field, the output matches the regular
+    path.
+    """
+    if response_schema is not None:
+        adapter = _list_adapter(response_schema)
+        rows = [{"id": doc.get("_id"), **doc} for doc in docs]
+        items = adapter.validate_python(_plain_bson(rows))
+    else:
+        adapter = _list_adapter(model)
+        items = adapter.validate_python(docs)
+    body = b'{"items":' + adapter.dump_json(items, by_alias=True)
+    for key, value in meta.items():
+        body += b"," + json.dumps(key).encode() + b":" + json.dumps(value).encode()
+    return Response(body + b"}", media_type="application/json")
+
+
+def _with_search_terms(doc: Document, update_data: dict[str, Any]) -> dict[str, Any]:
+    """Add rebuilt prefix-search terms to a partial update that needs them.
+
+    ``set()`` runs before-update hooks on the old values, so the terms of a
+    :class:`PrefixSearchMixin` document are computed from the merged state.
+    """
+    if isinstance(doc, PrefixSearchMixin) and update_data.keys() & set(
+        doc.search_fields
+    ):
+        merged = doc.model_copy(update=update_data)
+        return {**update_data, "search_terms": merged.refresh_search_terms()}
+    return update_data
+
+
 def _serialize_one(doc: Document, response_schema: type[BaseModel] | None):
     """Serialize a single document with optional response schema."""
     if response_schema:
@@ -96,6 +447,109 @@ def _serialize_one(doc: Document, response_schema: type[BaseModel] | None):
     return doc
 
 
+# ────────────────────────────────────────────────────────────────
+#  Conditional GET (ETags)
+# ────────────────────────────────────────────────────────────────
+
+# Fields a document's version is read from: revision_id when the model
+# uses revisions, db_update_dt from TimeStampMixin otherwise.
+_VERSION_FIELDS = frozenset({"revision_id", "db_update_dt"})
+_VERSION_PROJECTION = {"_id": 1, "revision_id": 1, "db_update_dt": 1}
+
+
+def _versioned(model: type[Document]) -> bool:
+    return _uses_revision(model) or issubclass(model, TimeStampMixin)
+
+
+def _version_token(doc: BaseModel | dict[str, Any]) -> str | None:
+    """Version of a loaded, projected or raw document, as a string."""
+
+    def value(name: str) -> Any:
+        return doc.get(name) if isinstance(doc, dict) else getattr(doc, name, None)
+
+    revision = value("revision_id")
+    if isinstance(revision, Binary) and revision.subtype == UUID_SUBTYPE:
+        revision = revision.as_uuid()
+    if revision is not None:
+        return str(revision)
+    updated = value("db_update_dt")
+    if isinstance(updated, datetime):
+        # MongoDB keeps milliseconds and returns naive UTC datetimes.
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=UTC)
+        return updated.astimezone(UTC).isoformat(timespec="milliseconds")
+    return None
+
+
+def _document_etag(doc: BaseModel | dict[str, Any]) -> str | None:
+    token = _version_token(doc)
+    return f'"{token}"' if token is not None else None
+
+
+def _list_etag(docs: list, meta: list[Any]) -> str:
+    """ETag of a page: a hash of its ids, their versions and ``meta``."""
+    entries = [
+        [str(doc.get("_id") if isinstance(doc, dict) else doc.id), _version_token(doc)]
+        for doc in docs
+    ]
+    digest = hashlib.blake2b(json.dumps([entries, meta]).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def _list_etag_headers(enabled: bool, docs: list, meta: list[Any]) -> dict[str, str]:
+    return {"ETag": _list_etag(docs, meta)} if enabled else {}
+
+
+def _set_etag(response: Response, doc: BaseModel, enabled: bool) -> None:
+    if enabled and (etag := _document_etag(doc)) is not None:
+        response.headers["ETag"] = etag
+
+
+def _not_modified(request: Request, etag: str | None) -> Response | None:
+    """A 304 response when ``If-None-Match`` names ``etag``."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match or etag is None:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+async def _read_not_modified(
+    model: type[Document], item_id: PydanticObjectId, request: Request
+) -> Response | None:
+    """Answer a conditional read from a projection of the version fields."""
+    if "if-none-match" not in request.headers:
+        return None
+    raw = await model.get_pymongo_collection().find_one(
+        {"_id": item_id}, _VERSION_PROJECTION
+    )
+    if raw is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return _not_modified(request, _document_etag(raw))
+
+
+async def _page_not_modified(
+    model: type[Document],
+    query,
+    sort_parts: list[str],
+    skip: int,
+    limit: int,
+    request: Request,
+    meta: Callable[[list[dict[str, Any]]], Awaitable[list[Any]]],
+) -> Response | None:
+    """Answer a conditional list request from the page's version fields.
+
+    ``meta`` computes the rest of the page's ETag input (its total, or
+    whether more pages follow) from the projected documents.
+    """
+    if "if-none-match" not in request.headers:
+        return None
+    docs = await _find_raw(model, query, sort_parts, skip, limit, _VERSION_PROJECTION)
+    return _not_modified(request, _list_etag(docs, await meta(docs)))
+
+
 # ────────────────────────────────────────────────────────────────
 #  Route registration helpers
 # ────────────────────────────────────────────────────────────────
@@ -111,10 +565,19 @@ def _register_list_route(
     searchable: list[str],
     sortable: list[str],
     response_schema: type[BaseModel] | None,
+    count: CountMode = "exact",
+    count_cap: int = 10_000,
+    raw_json: bool = False,
+    search_mode: SearchMode = "regex",
+    etags: bool = False,
 ) -> None:
+    # Only the count modes' totals go into the ETag; "facet" counts exactly.
+    etag_count: CountMode = "exact" if count == "facet" else count
+
     @router.get("", name=f"{collection_name}_list")
     async def list_items(
         request: Request,
+        response: Response,
         offset: int = Query(0, ge=0),
         limit: int = Query(page_size, ge=1, le=max_page_size),
         sort: str | None = Query(None),
@@ -125,16 +588,136 @@ def _register_list_route(
     ):
         query = model.find()
         query = _apply_filters(query, request, filterable)
-        query = _apply_search(query, search, searchable)
-        query = _apply_sort(query, sort, sortable)
+        query = _apply_search(query, search, searchable, search_mode)
+        sort_parts = _parse_sort(sort, sortable)
+
+        async def total_meta(docs) -> list[Any]:
+            return list(await _count_total(model, query, etag_count, count_cap))
+
+        if etags and (
+            not_modified := await _page_not_modified(
+                model, query, sort_parts, offset, limit, request, total_meta
+            )
+        ):
+            return not_modified
+
+        selected = _parse_fields(fields)
+        raw = raw_json and not selected
+        projected = selected | _VERSION_FIELDS if etags else selected
+        page = await _offset_page(
+            model,
+            query,
+            sort_parts,
+            offset,
+            limit,
+            count,
+            count_cap,
+            _projection_model(model, frozenset(projected)) if selected else None,
+            raw,
+        )
+        totals = [page["total"], page.get("total_capped", False)]
+        headers = _list_etag_headers(etags, page["items"], totals)
+        if raw:
+            items = page.pop("items")
+            result = _raw_json_response(
+                items,
+                model,
+                response_schema,
+                {**page, "offset": offset, "limit": limit},
+            )
+            result.headers.update(headers)
+            return result
+        response.headers.update(headers)
+        return {
+            **page,
+            "items": _serialize_items(page["items"], fields, response_schema),
+            "offset": offset,
+            "limit": limit,
+        }
 
-        total = await query.count()
-        items = await query.skip(offset).limit(limit).to_list()
 
+def _register_cursor_list_route(
+    router: APIRouter,
+    model: type[Document],
+    collection_name: str,
+    page_size: int,
+    max_page_size: int,
+    filterable: list[str],
+    searchable: list[str],
+    sortable: list[str],
+    response_schema: type[BaseModel] | None,
+    raw_json: bool = False,
+    search_mode: SearchMode = "regex",
+    etags: bool = False,
+) -> None:
+    @router.get("", name=f"{collection_name}_list")
+    async def list_items(
+        request: Request,
+        response: Response,
+        cursor: str | None = Query(
+            None, description="Opaque cursor from a previous page's next_cursor"
+        ),
+        limit: int = Query(page_size, ge=1, le=max_page_size),
+        sort: str | None = Query(None),
+        search: str | None = Query(None, description="Search across searchable fields"),
+        fields: str | None = Query(
+            None, description="Comma-separated field names to include"
+        ),
+    ):
+        sort_parts = _keyset_sort(sort, sortable)
+        query = model.find()
+        query = _apply_filters(query, request, filterable)
+        query = _apply_search(query, search, searchable, search_mode)
+        if cursor:
+            query = query.find(
+                _keyset_filter(sort_parts, _decode_cursor(cursor, sort_parts))
+            )
+
+        async def more_meta(docs) -> list[Any]:
+            return [len(docs) > limit]
+
+        if etags and (
+            not_modified := await _page_not_modified(
+                model, query, sort_parts, 0, limit + 1, request, more_meta
+            )
+        ):
+            return not_modified
+
+        selected = _parse_fields(fields)
+        if selected:
+            # The cursor needs the sort fields even when they are not selected.
+            sort_fields = {p[1:].split(".")[0] for p in sort_parts}
+            if etags:
+                sort_fields |= _VERSION_FIELDS
+            query = query.project(
+                _projection_model(model, frozenset(selected | sort_fields))
+            )
+
+        # One extra document tells whether another page follows.
+        raw = raw_json and not selected
+        if raw:
+            items = await _find_raw(model, query, sort_parts, 0, limit + 1)
+        else:
+            items = await query.sort(sort_parts).limit(limit + 1).to_list()
+        headers = _list_etag_headers(etags, items[:limit], [len(items) > limit])
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = _encode_cursor(sort_parts, items[-1])
+
+        if raw:
+            result = _raw_json_response(
+                items,
+                model,
+                response_schema,
+                {"next_cursor": next_cursor, "limit": limit},
+            )
+            result.headers.update(headers)
+            return result
+        response.headers.update(headers)
         return {
             "items": _serialize_items(items, fields, response_schema),
-            "total": total,
-            "offset": offset,
+            "next_cursor": next_cursor,
             "limit": limit,
         }
 
@@ -183,16 +766,37 @@ def _register_read_route(
     model: type[Document],
     collection_name: str,
     response_schema: type[BaseModel] | None,
+    concurrency: bool = False,
+    etags: bool = False,
 ) -> None:
     @router.get("/{item_id}", name=f"{collection_name}_read")
-    async def read_item(item_id: PydanticObjectId, fields: str | None = Query(None)):
+    async def read_item(
+        request: Request,
+        response: Response,
+        item_id: PydanticObjectId,
+        fields: str | None = Query(None),
+    ):
+        if etags and (
+            not_modified := await _read_not_modified(model, item_id, request)
+        ):
+            return not_modified
+
+        selected = _parse_fields(fields)
+        if selected:
+            projected = await model.find_one({"_id": item_id}).project(
+                _projection_model(
+                    model, frozenset(selected | _VERSION_FIELDS if etags else selected)
+                )
+            )
+            if projected is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            _set_etag(response, projected, etags)
+            return _select_fields(projected, selected, response_schema)
+
         doc = await model.get(item_id)
         if doc is None:
             raise HTTPException(status_code=404, detail="Not found")
-
-        if fields:
-            selected = {f.strip() for f in fields.split(",")}
-            return _select_fields(doc, selected, response_schema)
+        _set_etag(response, doc, etags or concurrency)
         return _serialize_one(doc, response_schema)
 
 
@@ -204,31 +808,24 @@ def _register_update_route(
     response_schema: type[BaseModel] | None,
     pre_update: PreHook | None,
     post_update: PostHook | None,
+    concurrency: bool = False,
+    etags: bool = False,
 ) -> None:
     @router.patch("/{item_id}", name=f"{collection_name}_update")
     async def update_item(
         request: Request,
+        response: Response,
         item_id: PydanticObjectId,
         data: schema,  # type: ignore[valid-type]  # ty: ignore[invalid-type-form]
     ):
-        doc = await model.get(item_id)
-        if doc is None:
-            raise HTTPException(status_code=404, detail="Not found")
-
-        if pre_update:
-            try:
-                data = await pre_update(doc, data, request) or data
-            except HTTPException:
-                raise
-            except Exception as exc:
-                logger.error(f"Hook execution failed: pre_update: {exc}")
-                raise HTTPException(
-                    status_code=500, detail="Hook execution failed: pre_update"
-                ) from exc
-
+        revision = _expected_revision(request) if concurrency else None
         update_data = data.model_dump(exclude_unset=True)
-        if update_data:
-            await doc.set(update_data)
+        if pre_update is None and not _update_needs_document(model, update_data):
+            doc = await _find_and_update(model, item_id, update_data, revision)
+        else:
+            doc = await _load_and_update(
+                model, item_id, data, revision, pre_update, request
+            )
 
         if post_update:
             try:
@@ -241,6 +838,7 @@ def _register_update_route(
                     status_code=500, detail="Hook execution failed: post_update"
                 ) from exc
 
+        _set_etag(response, doc, etags or concurrency)
         return _serialize_one(doc, response_schema)
 
 
@@ -250,25 +848,35 @@ def _register_delete_route(
     collection_name: str,
     pre_delete: PreHook | None,
     post_delete: PostHook | None,
+    concurrency: bool = False,
 ) -> None:
     @router.delete("/{item_id}", name=f"{collection_name}_delete", status_code=204)
     async def delete_item(request: Request, item_id: PydanticObjectId):
-        doc = await model.get(item_id)
-        if doc is None:
-            raise HTTPException(status_code=404, detail="Not found")
-
-        if pre_delete:
-            try:
-                await pre_delete(doc, request)
-            except HTTPException:
-                raise
-            except Exception as exc:
-                logger.error(f"Hook execution failed: pre_delete: {exc}")
-                raise HTTPException(
-                    status_code=500, detail="Hook execution failed: pre_delete"
-                ) from exc
-
-        await doc.delete()
+        revision = _expected_revision(request) if concurrency else None
+        if pre_delete is None and not _has_actions(
+            model, EventTypes.DELETE, ActionDirections.BEFORE
+        ):
+            doc = await _find_and_delete(
+                model,
+                item_id,
+                revision,
+                need_document=post_delete is not None
+                or _has_actions(model, EventTypes.DELETE, ActionDirections.AFTER),
+            )
+        else:
+            doc = await _load_for_write(model, item_id, revision)
+            if pre_delete:
+                try:
+                    await pre_delete(doc, request)
+                except HTTPException:
+                    raise
+                except Exception as exc:
+                    logger.error(f"Hook execution failed: pre_delete: {exc}")
+                    raise HTTPException(
+                        status_code=500, detail="Hook execution failed: pre_delete"
+                    ) from exc
+
+            await doc.delete()
 
         if post_delete:
             try:
@@ -284,6 +892,834 @@ def _register_delete_route(
         return None
 
 
+# ────────────────────────────────────────────────────────────────
+#  Single-round-trip writes and revisions
+# ────────────────────────────────────────────────────────────────
+
+# Before-update actions that don't read the document, with the fields they
+# would set. Updates on models with only these skip loading the document.
+_STATELESS_UPDATE_ACTIONS: dict[Callable[..., Any], Callable[[], dict[str, Any]]] = {
+    TimeStampMixin.touch_on_update: lambda: {"db_update_dt": now()},
+}
+
+
+def _has_actions(
+    model: type[Document], event: EventTypes, direction: ActionDirections
+) -> bool:
+    return bool(ActionRegistry.get_action_list(model, event, direction))
+
+
+def _update_needs_document(model: type[Document], update_data: dict[str, Any]) -> bool:
+    """Whether applying ``update_data`` requires loading the document first.
+
+    True when a before-update action reads the document (e.g. field
+    encryption), or when prefix search terms must be rebuilt from it.
+    """
+    if issubclass(model, PrefixSearchMixin) and set(update_data) & set(
+        model.search_fields
+    ):
+        return True
+    actions = ActionRegistry.get_action_list(
+        model, EventTypes.UPDATE, ActionDirections.BEFORE
+    )
+    return any(action not in _STATELESS_UPDATE_ACTIONS for action in actions)
+
+
+def _uses_revision(model: type[Document]) -> bool:
+    return bool(getattr(getattr(model, "Settings", None), "use_revision", False))
+
+
+def _expected_revision(request: Request) -> UUID | None:
+    """The revision in ``If-Match``, or None when absent or ``*``."""
+    if_match = request.headers.get("if-match")
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return UUID(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError as exc:
+        raise HTTPException(status_code=412, detail="Revision mismatch") from exc
+
+
+async def _missing_or_stale(
+    model: type[Document], item_id: PydanticObjectId, revision: UUID | None
+) -> HTTPException:
+    """404 for a missing document, 412 when only the revision didn't match."""
+    if revision is not None and await model.get_pymongo_collection().count_documents(
+        {"_id": item_id}, limit=1
+    ):
+        return HTTPException(status_code=412, detail="Revision mismatch")
+    return HTTPException(status_code=404, detail="Not found")
+
+
+def _write_filter(item_id: PydanticObjectId, revision: UUID | None) -> dict[str, Any]:
+    query: dict[str, Any] = {"_id": item_id}
+    if revision is not None:
+        query["revision_id"] = Encoder(to_db=True).encode(revision)
+    return query
+
+
+async def _load_for_write(
+    model: type[Document], item_id: PydanticObjectId, revision: UUID | None
+) -> Document:
+    doc = await model.get(item_id)
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    if revision is not None and doc.revision_id != revision:
+        raise HTTPException(status_code=412, detail="Revision mismatch")
+    return doc
+
+
+async def _find_and_update(
+    model: type[Document],
+    item_id: PydanticObjectId,
+    update_data: dict[str, Any],
+    revision: UUID | None,
+) -> Document:
+    """Apply ``update_data`` with one ``find_one_and_update`` and return the result.
+
+    Stateless before-update actions contribute their fields to the
+    ``$set``; after-update actions run on the returned document.
+    """
+    changes = dict(update_data)
+    for action in ActionRegistry.get_action_list(
+        model, EventTypes.UPDATE, ActionDirections.BEFORE
+    ):
+        changes.update(_STATELESS_UPDATE_ACTIONS[action]())
+    if _uses_revision(model):
+        changes["revision_id"] = uuid4()
+
+    collection = model.get_pymongo_collection()
+    if changes:
+        raw = await collection.find_one_and_update(
+            _write_filter(item_id, revision),
+            {"$set": Encoder(to_db=True).encode(changes)},
+            return_document=ReturnDocument.AFTER,
+        )
+    else:
+        raw = await collection.find_one(_write_filter(item_id, revision))
+    if raw is None:
+        raise await _missing_or_stale(model, item_id, revision)
+
+    doc = model.model_validate(raw)
+    await ActionRegistry.run_actions(doc, EventTypes.UPDATE, ActionDirections.AFTER, [])
+    return doc
+
+
+async def _load_and_update(
+    model: type[Document],
+    item_id: PydanticObjectId,
+    data: BaseModel,
+    revision: UUID | None,
+    pre_update: PreHook | None,
+    request: Request,
+) -> Document:
+    """Update through a loaded document, for hooks and actions that read it."""
+    doc = await _load_for_write(model, item_id, revision)
+    if pre_update:
+        try:
+            data = await pre_update(doc, data, request) or data
+        except HTTPException:
+            raise
+        except Exception as exc:
+            logger.error(f"Hook execution failed: pre_update: {exc}")
+            raise HTTPException(
+                status_code=500, detail="Hook execution failed: pre_update"
+            ) from exc
+
+    update_data = _with_search_terms(doc, data.model_dump(exclude_unset=True))
+    if update_data:
+        try:
+            await doc.set(update_data)
+        except RevisionIdWasChanged as exc:
+            raise HTTPException(status_code=412, detail="Revision mismatch") from exc
+    return doc
+
+
+async def _find_and_delete(
+    model: type[Document],
+    item_id: PydanticObjectId,
+    revision: UUID | None,
+    *,
+    need_document: bool,
+) -> Document | None:
+    """Delete in one round trip, returning the deleted document if needed.
+
+    Uses ``find_one_and_delete`` when a post-delete hook or action needs the
+    document, ``delete_one`` otherwise.
+    """
+    collection = model.get_pymongo_collection()
+    query = _write_filter(item_id, revision)
+    if not need_document:
+        result = await collection.delete_one(query)
+        if not result.deleted_count:
+            raise await _missing_or_stale(model, item_id, revision)
+        return None
+
+    raw = await collection.find_one_and_delete(query)
+    if raw is None:
+        raise await _missing_or_stale(model, item_id, revision)
+    doc = model.model_validate(raw)
+    await ActionRegistry.run_actions(doc, EventTypes.DELETE, ActionDirections.AFTER, [])
+    return doc
+
+
+# ────────────────────────────────────────────────────────────────
+#  Bulk routes
+# ────────────────────────────────────────────────────────────────
+
+# MongoDB's duplicate key error code, reported per item as 409.
+_DUPLICATE_KEY = 11000
+
+
+class _BulkResult:
+    """Per-item outcome of a bulk request, indexed by position in the body."""
+
+    def __init__(self, total: int, ordered: bool) -> None:
+        self.total = total
+        self.ordered = ordered
+        self.ids: list[str] = []
+        self.errors: list[dict[str, Any]] = []
+        self.stopped = False
+
+    def fail(self, index: int, status: int, detail: Any) -> None:
+        self.errors.append({"index": index, "status": status, "detail": detail})
+        # Ordered requests stop at the first failure, like MongoDB's.
+        self.stopped = self.stopped or self.ordered
+
+    def as_response(self) -> dict[str, Any]:
+        return {
+            "succeeded": len(self.ids),
+            "ids": self.ids,
+            "errors": sorted(self.errors, key=lambda e: e["index"]),
+            # Items never attempted because an ordered request stopped.
+            "skipped": self.total - len(self.ids) - len(self.errors),
+        }
+
+
+def _check_bulk_size(items: list, max_items: int) -> None:
+    if len(items) > max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Bulk requests accept at most {max_items} items",
+        )
+
+
+def _validate_chunk(
+    adapter: TypeAdapter, chunk: list[Any], start: int, result: _BulkResult
+) -> list[tuple[int, Any]]:
+    """Validate each item of a chunk; invalid items are reported as 422."""
+    valid: list[tuple[int, Any]] = []
+    for offset, item in enumerate(chunk):
+        try:
+            valid.append((start + offset, adapter.validate_python(item)))
+        except ValidationError as exc:
+            result.fail(
+                start + offset, 422, exc.errors(include_url=False, include_input=False)
+            )
+            if result.stopped:
+                break
+    return valid
+
+
+async def _run_bulk_hook(hook: Callable[..., Any], name: str, *args: Any) -> Any:
+    try:
+        return await hook(*args)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.error(f"Hook execution failed: {name}: {exc}")
+        raise HTTPException(
+            status_code=500, detail=f"Hook execution failed: {name}"
+        ) from exc
+
+
+def _hook_replacements(name: str, replaced: Any, original: list) -> list:
+    """Items a pre-bulk hook returned in place of ``original``, if it did.
+
+    Results are reported by request index, so a replacement must keep one
+    item per original item, in the same order.
+
+    Raises:
+        HTTPException: 500 if the hook returned a different number of items.
+    """
+    if replaced is None:
+        return original
+    replaced = list(replaced)
+    if len(replaced) != len(original):
+        logger.error(
+            f"Hook {name} returned {len(replaced)} items for a chunk of "
+            f"{len(original)}; it must return one per item or None"
+        )
+        raise HTTPException(status_code=500, detail=f"Hook execution failed: {name}")
+    return replaced
+
+
+async def _run_actions(
+    docs: list[Document], event: EventTypes, direction: ActionDirections
+) -> None:
+    """Run the Beanie event actions (timestamps, encryption, ...) of ``docs``."""
+    for doc in docs:
+        await ActionRegistry.run_actions(doc, event, direction, [])
+
+
+async def _write_chunk(
+    write: Callable[[], Awaitable[Any]], indexes: list[int], result: _BulkResult
+) -> list[int]:
+    """Run one bulk write and return the positions (in ``indexes``) it applied."""
+    try:
+        await write()
+    except BulkWriteError as exc:
+        failed: dict[int, dict[str, Any]] = {
+            e["index"]: e for e in exc.details.get("writeErrors", [])
+        }
+        for position, error in sorted(failed.items()):
+            status = 409 if error.get("code") == _DUPLICATE_KEY else 400
+            result.fail(indexes[position], status, error.get("errmsg", "Write failed"))
+        if result.ordered and failed:
+            # Items after the failed write were never reached.
+            stop = min(failed)
+            result.errors = [e for e in result.errors if e["index"] <= indexes[stop]]
+            return list(range(stop))
+        return [p for p in range(len(indexes)) if p not in failed]
+    return list(range(len(indexes)))
+
+
+def _chunks(items: list[Any], size: int):
+    for start in range(0, len(items), size):
+        yield start, items[start : start + size]
+
+
+async def _found_documents(
+    model: type[Document], ids: list[PydanticObjectId]
+) -> dict[PydanticObjectId, Document]:
+    docs = await model.find({"_id": {"$in": ids}}).to_list()
+    return {doc.id: doc for doc in docs}
+
+
+def _unique_targets(
+    chunk: list[PydanticObjectId],
+    start: int,
+    seen: set[PydanticObjectId],
+    result: _BulkResult,
+) -> list[tuple[int, PydanticObjectId]]:
+    """Index the ids of a chunk, reporting repeats of an earlier id as 400."""
+    targets: list[tuple[int, PydanticObjectId]] = []
+    for index, item_id in enumerate(chunk, start):
+        if item_id in seen:
+            result.fail(index, 400, "Duplicate id")
+            if result.stopped:
+                break
+            continue
+        seen.add(item_id)
+        targets.append((index, item_id))
+    return targets
+
+
+def _match_found(
+    targets: list[tuple[int, Any]],
+    found: dict[PydanticObjectId, Document],
+    key: Callable[[Any], PydanticObjectId],
+    result: _BulkResult,
+) -> list[tuple[int, Document, Any]]:
+    """Pair each target with its document, reporting missing ones as 404."""
+    matched: list[tuple[int, Document, Any]] = []
+    for index, target in targets:
+        doc = found.get(key(target))
+        if doc is None:
+            result.fail(index, 404, "Not found")
+            if result.stopped:
+                break
+            continue
+        matched.append((index, doc, target))
+    return matched
+
+
+def _register_bulk_create_route(
+    router: APIRouter,
+    model: type[Document],
+    collection_name: str,
+    schema: type[BaseModel],
+    chunk_size: int,
+    max_items: int,
+    pre_bulk_create: PreHook | None,
+    post_bulk_create: PostHook | None,
+) -> None:
+    adapter = TypeAdapter(schema)
+
+    @router.post("/bulk", name=f"{collection_name}_bulk_create")
+    async def bulk_create(
+        request: Request,
+        items: list[dict[str, Any]] = Body(...),
+        ordered: bool = Query(True),
+    ):
+        _check_bulk_size(items, max_items)
+        result = _BulkResult(len(items), ordered)
+        for start, chunk in _chunks(items, chunk_size):
+            if result.stopped:
+                break
+            valid = _validate_chunk(adapter, chunk, start, result)
+            if not valid:
+                continue
+            indexes = [index for index, _ in valid]
+            data = [item for _, item in valid]
+            if pre_bulk_create:
+                data = _hook_replacements(
+                    "pre_bulk_create",
+                    await _run_bulk_hook(
+                        pre_bulk_create, "pre_bulk_create", data, request
+                    ),
+                    data,
+                )
+
+            docs = [model(**item.model_dump()) for item in data]
+            for doc in docs:
+                doc.id = doc.id or PydanticObjectId()
+            await _run_actions(docs, EventTypes.INSERT, ActionDirections.BEFORE)
+            applied = await _write_chunk(
+                lambda docs=docs: model.insert_many(docs, ordered=ordered),
+                indexes,
+                result,
+            )
+            inserted = [docs[p] for p in applied]
+            await _run_actions(inserted, EventTypes.INSERT, ActionDirections.AFTER)
+            result.ids.extend(str(doc.id) for doc in inserted)
+
+            if post_bulk_create and inserted:
+                await _run_bulk_hook(
+                    post_bulk_create, "post_bulk_create", inserted, request
+                )
+
+        return result.as_response()
+
+
+def _bulk_update_schema(schema: type[BaseModel]) -> type[BaseModel]:
+    """``schema`` plus the required ``id`` of the document to update."""
+    return type(
+        f"{schema.__name__}BulkItem",
+        (schema,),
+        {"__annotations__": {"id": PydanticObjectId}},
+    )
+
+
+async def _update_operation(doc: Document, update: BaseModel) -> UpdateOne | None:
+    """Apply ``update`` to ``doc`` and return the write for what changed.
+
+    The document's before-save actions run in between, so timestamps,
+    encrypted fields and search terms are written as by ``save_changes()``,
+    and revisioned documents get a new ``revision_id``. Returns None when
+    nothing changed.
+    """
+    before = get_dict(doc, to_db=True)
+    for name, value in update.model_dump(exclude_unset=True, exclude={"id"}).items():
+        setattr(doc, name, value)
+    await _run_actions([doc], EventTypes.SAVE_CHANGES, ActionDirections.BEFORE)
+    after = get_dict(doc, to_db=True)
+    changes = {
+        name: value for name, value in after.items() if before.get(name) != value
+    }
+    if not changes:
+        return None
+    if _uses_revision(type(doc)):
+        doc.revision_id = uuid4()
+        changes["revision_id"] = Encoder(to_db=True).encode(doc.revision_id)
+    return UpdateOne({"_id": doc.id}, {"$set": changes})
+
+
+def _updated_documents(
+    docs: list[Document],
+    indexes: list[int],
+    operations: list[UpdateOne | None],
+    applied: set[int],
+    result: _BulkResult,
+) -> list[Document]:
+    """Documents of a chunk whose update was applied or was a no-op.
+
+    No-op updates count as done, except those after the failure that
+    stopped an ordered request.
+    """
+    stop = max(e["index"] for e in result.errors) if result.stopped else None
+    return [
+        doc
+        for p, doc in enumerate(docs)
+        if p in applied
+        or (operations[p] is None and (stop is None or indexes[p] < stop))
+    ]
+
+
+def _register_bulk_update_route(
+    router: APIRouter,
+    model: type[Document],
+    collection_name: str,
+    schema: type[BaseModel],
+    chunk_size: int,
+    max_items: int,
+    pre_bulk_update: PreHook | None,
+    post_bulk_update: PostHook | None,
+) -> None:
+    adapter = TypeAdapter(_bulk_update_schema(schema))
+
+    @router.patch("/bulk", name=f"{collection_name}_bulk_update")
+    async def bulk_update(
+        request: Request,
+        items: list[dict[str, Any]] = Body(...),
+        ordered: bool = Query(True),
+    ):
+        _check_bulk_size(items, max_items)
+        result = _BulkResult(len(items), ordered)
+        collection = model.get_pymongo_collection()
+        for start, chunk in _chunks(items, chunk_size):
+            if result.stopped:
+                break
+            valid = _validate_chunk(adapter, chunk, start, result)
+            if not valid:
+                continue
+            found = await _found_documents(model, [item.id for _, item in valid])
+            matched = _match_found(valid, found, lambda item: item.id, result)
+            if not matched:
+                continue
+            indexes = [index for index, _, _ in matched]
+            docs = [doc for _, doc, _ in matched]
+            updates = [item for _, _, item in matched]
+            if pre_bulk_update:
+                updates = _hook_replacements(
+                    "pre_bulk_update",
+                    await _run_bulk_hook(
+                        pre_bulk_update, "pre_bulk_update", docs, updates, request
+                    ),
+                    updates,
+                )
+
+            operations = [
+                await _update_operation(doc, update)
+                for doc, update in zip(docs, updates, strict=True)
+            ]
+            writes = [p for p, operation in enumerate(operations) if operation]
+            applied = set(writes)
+            if writes:
+                applied = {
+                    writes[p]
+                    for p in await _write_chunk(
+                        lambda w=writes, o=operations: collection.bulk_write(
+                            [o[p] for p in w], ordered=ordered
+                        ),
+                        [indexes[p] for p in writes],
+                        result,
+                    )
+                }
+            updated = _updated_documents(docs, indexes, operations, applied, result)
+            await _run_actions(updated, EventTypes.SAVE_CHANGES, ActionDirections.AFTER)
+            result.ids.extend(str(doc.id) for doc in updated)
+
+            if post_bulk_update and updated:
+                await _run_bulk_hook(
+                    post_bulk_update, "post_bulk_update", updated, request
+                )
+
+        return result.as_response()
+
+
+def _register_bulk_delete_route(
+    router: APIRouter,
+    model: type[Document],
+    collection_name: str,
+    chunk_size: int,
+    max_items: int,
+    pre_bulk_delete: PreHook | None,
+    post_bulk_delete: PostHook | None,
+) -> None:
+    @router.delete("/bulk", name=f"{collection_name}_bulk_delete")
+    async def bulk_delete(
+        request: Request,
+        ids: list[PydanticObjectId] = Body(...),
+        ordered: bool = Query(True),
+    ):
+        _check_bulk_size(ids, max_items)
+        result = _BulkResult(len(ids), ordered)
+        seen: set[PydanticObjectId] = set()
+        for start, chunk in _chunks(ids, chunk_size):
+            if result.stopped:
+                break
+            targets = _unique_targets(chunk, start, seen, result)
+            if not targets:
+                continue
+            found = await _found_documents(model, [i for _, i in targets])
+            matched = _match_found(targets, found, lambda i: i, result)
+            indexes = [index for index, _, _ in matched]
+            docs = [doc for _, doc, _ in matched]
+            if not docs:
+                continue
+            if pre_bulk_delete:
+                await _run_bulk_hook(pre_bulk_delete, "pre_bulk_delete", docs, request)
+
+            await _run_actions(docs, EventTypes.DELETE, ActionDirections.BEFORE)
+            deleted = await model.get_pymongo_collection().delete_many(
+                {"_id": {"$in": [doc.id for doc in docs]}}
+            )
+            if deleted.deleted_count < len(docs):
+                # Some documents went away between the lookup and the
+                # delete; the count can't tell which, so none is confirmed.
+                for index in indexes:
+                    result.fail(index, 409, "Deleted concurrently")
+                continue
+            await _run_actions(docs, EventTypes.DELETE, ActionDirections.AFTER)
+            result.ids.extend(str(doc.id) for doc in docs)
+
+            if post_bulk_delete:
+                await _run_bulk_hook(
+                    post_bulk_delete, "post_bulk_delete", docs, request
+                )
+
+        return result.as_response()
+
+
+def _register_bulk_routes(
+    router: APIRouter,
+    model: type[Document],
+    collection_name: str,
+    ops: set[Operation],
+    create_schema: type[BaseModel],
+    update_schema: type[BaseModel],
+    chunk_size: int,
+    max_items: int,
+    hooks: list[Callable[..., Any] | None],
+) -> None:
+    """Register the bulk routes of the enabled write operations.
+
+    ``hooks`` holds the pre/post create, update and delete bulk hooks, in
+    that order.
+    """
+    pre_create, post_create, pre_update, post_update, pre_delete, post_delete = hooks
+    if Operation.CREATE in ops:
+        _register_bulk_create_route(
+            router,
+            model,
+            collection_name,
+            create_schema,
+            chunk_size,
+            max_items,
+            pre_create,
+            post_create,
+        )
+    if Operation.UPDATE in ops:
+        _register_bulk_update_route(
+            router,
+            model,
+            collection_name,
+            update_schema,
+            chunk_size,
+            max_items,
+            pre_update,
+            post_update,
+        )
+    if Operation.DELETE in ops:
+        _register_bulk_delete_route(
+            router,
+            model,
+            collection_name,
+            chunk_size,
+            max_items,
+            pre_delete,
+            post_delete,
+        )
+
+
+# ────────────────────────────────────────────────────────────────
+#  Index provisioning
+# ────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexSpec:
+    keys: list[tuple[str, Any]]
+    # Create the index, or only warn when no existing index covers it.
+    create: bool = True
+    # Query shape used to explain() an uncovered "filter", "sort" or
+    # "filter_sort" (equality on the first key, sorted by the rest) index.
+    usage: IndexUsage = "search"
+
+
+# Indexes the generated routes rely on, keyed by (model, index name). Routes
+# are built at import time, before Beanie is initialized, so the indexes are
+# created (or checked) later by ensure_crud_indexes().
+_required_indexes: dict[tuple[type[Document], str], _IndexSpec] = {}
+
+
+def _require_index(
+    model: type[Document],
+    keys: list[tuple[str, Any]],
+    name: str | None = None,
+    *,
+    create: bool = True,
+    usage: IndexUsage = "search",
+) -> None:
+    name = name or "_".join(f"{field}_{direction}" for field, direction in keys)
+    _required_indexes[(model, name)] = _IndexSpec(keys, create, usage)
+
+
+def _require_search_indexes(
+    model: type[Document],
+    collection_name: str,
+    searchable: list[str],
+    search_mode: SearchMode,
+) -> list[str]:
+    """Register the index ``search_mode`` needs; returns the searchable fields."""
+    if search_mode == "prefix":
+        if not issubclass(model, PrefixSearchMixin):
+            raise TypeError(
+                f'search_mode="prefix" requires {model.__name__} to use PrefixSearchMixin'
+            )
+        searchable = searchable or list(model.search_fields)
+        _require_index(model, [("search_terms", ASCENDING)])
+    elif search_mode == "text" and searchable:
+        _require_index(
+            model,
+            [(f, TEXT) for f in searchable],
+            name=f"{collection_name}_crud_text",
+        )
+    return searchable
+
+
+def _sort_keys(field: str, pagination: Pagination) -> list[tuple[str, Any]]:
+    """Index keys serving a sort on ``field``; cursor pages add ``_id``."""
+    keys = [(field, ASCENDING)]
+    if pagination == "cursor" and field != "_id":
+        keys.append(("_id", ASCENDING))
+    return keys
+
+
+def _require_route_indexes(
+    model: type[Document],
+    filterable: list[str],
+    sortable: list[str],
+    compound: list[tuple[str, str]],
+    pagination: Pagination,
+    policy: IndexPolicy,
+) -> None:
+    """Register the indexes backing the list route's filters and sort orders.
+
+    Each filterable field gets a single-field index. Sortable fields get one
+    as well with offset pagination; cursor pages sort on ``(field, _id)`` so
+    they get that compound index. Each ``(filter_field, sort_field)`` pair in
+    ``compound`` gets an index on the filter field followed by the sort keys,
+    which serves that filter and sort together. One ascending index serves
+    both sort directions.
+
+    Raises:
+        ValueError: If a ``compound`` pair names a field that is not
+            filterable or not sortable.
+    """
+    for filter_field, sort_field in compound:
+        if filter_field not in filterable or sort_field not in sortable:
+            raise ValueError(
+                f"compound_indexes pair ({filter_field!r}, {sort_field!r}) must "
+                "name a filterable field and a sortable field"
+            )
+    if policy == "off":
+        return
+    create = policy == "create"
+    for field in filterable:
+        _require_index(model, [(field, ASCENDING)], create=create, usage="filter")
+    for field in sortable:
+        keys = _sort_keys(field, pagination)
+        _require_index(model, keys, create=create, usage="sort")
+    for filter_field, sort_field in compound:
+        keys = [(filter_field, ASCENDING), *_sort_keys(sort_field, pagination)]
+        _require_index(model, keys, create=create, usage="filter_sort")
+
+
+def _index_covers(existing: list[tuple[str, Any]], keys: list[tuple[str, Any]]) -> bool:
+    """Whether an index on ``existing`` keys serves queries needing ``keys``.
+
+    True when ``keys`` is a prefix of ``existing`` with the same directions,
+    or with every direction reversed (indexes can be walked backwards).
+    """
+    if len(existing) < len(keys):
+        return False
+    head = [(field, direction) for field, direction in existing[: len(keys)]]
+    if head == keys:
+        return True
+    return all(
+        field == want_field
+        and isinstance(direction, int)
+        and isinstance(want, int)
+        and direction == -want
+        for (field, direction), (want_field, want) in zip(head, keys, strict=True)
+    )
+
+
+def _plan_stages(plan: dict) -> list[str]:
+    """Stage names of a query plan, from the root down."""
+    stages = [plan.get("stage", "?")]
+    children = plan.get("inputStages", [])
+    if "inputStage" in plan:
+        children = [plan["inputStage"], *children]
+    for child in children:
+        stages.extend(_plan_stages(child))
+    return stages
+
+
+async def _explain_stages(collection, spec: _IndexSpec) -> list[str]:
+    """Winning-plan stages for a list query shaped like ``spec``'s usage.
+
+    Uses ``queryPlanner`` verbosity, so the query is planned but not run.
+    """
+    command: dict[str, Any] = {"find": collection.name, "limit": 1}
+    sort_keys = spec.keys
+    if spec.usage in ("filter", "filter_sort"):
+        command["filter"] = {spec.keys[0][0]: None}
+        sort_keys = spec.keys[1:]
+    if sort_keys:
+        command["sort"] = dict(sort_keys)
+    result = await collection.database.command(
+        {"explain": command, "verbosity": "queryPlanner"}
+    )
+    winning = result.get("queryPlanner", {}).get("winningPlan", {})
+    return _plan_stages(winning.get("queryPlan", winning))
+
+
+async def _check_index(model: type[Document], name: str, spec: _IndexSpec) -> None:
+    collection = model.get_pymongo_collection()
+    if spec.usage != "search":
+        info = await collection.index_information()
+        if any(_index_covers(index["key"], spec.keys) for index in info.values()):
+            return
+    if spec.create:
+        await collection.create_index(spec.keys, name=name)
+        logger.debug("Ensured index {} on {}", name, model.__name__)
+        return
+    stages = await _explain_stages(collection, spec)
+    named = spec.keys[:2] if spec.usage == "filter_sort" else spec.keys[:1]
+    if "COLLSCAN" in stages:
+        logger.warning(
+            "CRUD {} on {}.{} has no supporting index (explain: {}); "
+            "add an index on {} or pass indexes='create'",
+            spec.usage,
+            model.__name__,
+            ",".join(field for field, _ in named),
+            " <- ".join(stages),
+            spec.keys,
+        )
+
+
+async def ensure_crud_indexes() -> None:
+    """Create or check the indexes required by :func:`create_crud_routes`.
+
+    Called by ``init_mongodb()`` once Beanie is initialized. Indexes already
+    covered by an existing index (same leading keys, in either direction)
+    are skipped. Routes built with ``indexes="warn"`` are only checked: a
+    startup warning shows the ``explain()`` plan of each list query that
+    would scan the whole collection. Failures (such as a second text index
+    on the same collection) are logged and do not stop startup.
+    """
+    for (model, name), spec in _required_indexes.items():
+        try:
+            await _check_index(model, name, spec)
+        except Exception as exc:
+            logger.warning(
+                "Could not ensure index {} on {}: {}", name, model.__name__, exc
+            )
+
+
 # ────────────────────────────────────────────────────────────────
 #  Public API
 # ────────────────────────────────────────────────────────────────
@@ -297,6 +1733,18 @@ def create_crud_routes(
     operations: set[Operation] | None = None,
     page_size: int = 25,
     max_page_size: int = 100,
+    pagination: Pagination = "offset",
+    count: CountMode = "exact",
+    count_cap: int = 10_000,
+    raw_json: bool = False,
+    search_mode: SearchMode = "regex",
+    indexes: IndexPolicy = "warn",
+    compound_indexes: list[tuple[str, str]] | None = None,
+    bulk: bool = False,
+    bulk_chunk_size: int = 500,
+    max_bulk_items: int = 10_000,
+    optimistic_concurrency: bool = False,
+    etags: bool = False,
     sortable_fields: list[str] | None = None,
     filterable_fields: list[str] | None = None,
     searchable_fields: list[str] | None = None,
@@ -307,6 +1755,12 @@ def create_crud_routes(
     post_update: PostHook | None = None,
     pre_delete: PreHook | None = None,
     post_delete: PostHook | None = None,
+    pre_bulk_create: PreHook | None = None,
+    post_bulk_create: PostHook | None = None,
+    pre_bulk_update: PreHook | None = None,
+    post_bulk_update: PostHook | None = None,
+    pre_bulk_delete: PreHook | None = None,
+    post_bulk_delete: PostHook | None = None,
     create_schema: type[BaseModel] | None = None,
     update_schema: type[BaseModel] | None = None,
     response_schema: type[BaseModel] | None = None,
@@ -320,9 +1774,69 @@ def create_crud_routes(
         operations: Set of operations to generate. Defaults to all.
         page_size: Default items per page.
         max_page_size: Maximum allowed items per page.
+        pagination: ``"offset"`` (default) pages with ``offset``/``limit`` and
+            returns a ``total``. ``"cursor"`` pages with an opaque ``cursor``
+            and returns ``next_cursor`` instead; each page is a range query
+            on the sort fields plus ``_id``, so deep pages cost the same as
+            the first. Back each sort order with a compound index on
+            ``(field, _id)``.
+        count: How offset pages compute ``total``. ``"exact"`` (default)
+            runs a count next to the page query. ``"facet"`` returns the
+            page and the total from one ``$facet`` aggregation.
+            ``"estimated"`` uses the collection's metadata count when no
+            filter or search applies (an exact count otherwise).
+            ``"capped"`` stops counting past ``count_cap`` and sets
+            ``total_capped`` in the response. ``"none"`` skips the count
+            and returns ``total: null``.
+        count_cap: Upper bound for ``count="capped"``.
+        raw_json: Serve list pages (without ``fields``) from raw pymongo
+            documents, validated and encoded to JSON bytes by a cached
+            pydantic ``TypeAdapter``, skipping Beanie hydration and FastAPI's
+            encoder. Output is unchanged for documents that store every
+            field; documents relying on model defaults for missing fields
+            should keep the default path.
+        bulk: Add ``POST /bulk``, ``PATCH /bulk`` and ``DELETE /bulk`` for
+            the enabled create/update/delete operations. Items are validated
+            one by one and written ``bulk_chunk_size`` at a time with
+            ``insert_many``/``bulk_write``/``delete_many``; the response
+            reports each failed item by its index. ``?ordered=false``
+            keeps going past failures. The single-item hooks do not run;
+            use the ``*_bulk_*`` hooks, which see a chunk at a time.
+        bulk_chunk_size: Items written per database round trip.
+        max_bulk_items: Largest accepted bulk request (larger ones get 413).
+        optimistic_concurrency: Send the document's ``revision_id`` as the
+            ``ETag`` of read and update responses, and reject PATCH and
+            DELETE requests whose ``If-Match`` names another revision with
+            412. Requires ``use_revision = True`` in the model's Settings.
+        etags: Send ``ETag`` headers on read, update and list responses and
+            answer ``If-None-Match`` with 304. Checks read only the version
+            fields (``revision_id`` or ``db_update_dt``) of the document or
+            page, so unchanged responses skip loading and serialization.
+            Requires revisions or :class:`TimeStampMixin`.
         sortable_fields: Fields that can be used for sorting.
         filterable_fields: Fields that support equality filtering via query params.
-        searchable_fields: Fields that support text search.
+        searchable_fields: Fields that support text search. With
+            ``search_mode="prefix"`` defaults to the model's
+            ``search_fields``.
+        search_mode: How ``search`` matches. ``"regex"`` (default) is a
+            case-insensitive substring match that scans the collection.
+            ``"text"`` uses a MongoDB ``$text`` index over the searchable
+            fields (whole words, stemmed). ``"prefix"`` matches word-start
+            prefixes, ignoring case and accents, against the indexed
+            ``search_terms`` field of a :class:`PrefixSearchMixin` model.
+            Indexes for both are created by :func:`ensure_crud_indexes`
+            when MongoDB initializes.
+        indexes: Indexes for the list route's filterable and sortable
+            fields, provisioned by :func:`ensure_crud_indexes` when MongoDB
+            initializes. ``"warn"`` (default) creates nothing and logs the
+            ``explain()`` plan of each query that would scan the collection.
+            ``"create"`` creates any not already covered by an existing
+            index: one per field, ``(field, _id)`` for sortable fields with
+            cursor pagination, plus any ``compound_indexes``. ``"off"`` does
+            neither.
+        compound_indexes: ``(filter_field, sort_field)`` pairs that clients
+            combine; each gets an index on the filter field followed by the
+            sort keys, checked or created according to ``indexes``.
         dependencies: FastAPI dependencies applied to all routes.
         pre_create: Async callable(data, request) called before creating a document.
         post_create: Async callable(doc, request) called after creation.
@@ -330,6 +1844,20 @@ def create_crud_routes(
         post_update: Async callable(doc, request) called after updating.
         pre_delete: Async callable(doc, request) called before deletion.
         post_delete: Async callable(doc, request) called after deletion.
+        pre_bulk_create: Async callable(items, request) called before each
+            bulk insert chunk; may return None or a list of replacement
+            items, one per item in the same order (anything else is a 500).
+        post_bulk_create: Async callable(docs, request) called with the
+            documents each chunk inserted.
+        pre_bulk_update: Async callable(docs, updates, request) called before
+            each bulk update chunk; may return None or a list of replacement
+            updates, one per update in the same order (anything else is a 500).
+        post_bulk_update: Async callable(docs, request) called with the
+            documents each chunk updated.
+        pre_bulk_delete: Async callable(docs, request) called before each
+            bulk delete chunk.
+        post_bulk_delete: Async callable(docs, request) called with the
+            documents each chunk deleted.
         create_schema: Pydantic model for create payloads (defaults to model fields).
         update_schema: Pydantic model for update payloads (defaults to create_schema).
         response_schema: Pydantic model for response serialization.
@@ -357,6 +1885,14 @@ def create_crud_routes(
     sortable = sortable_fields or []
     filterable = filterable_fields or []
     searchable = searchable_fields or []
+    searchable = _require_search_indexes(
+        model, collection_name, searchable, search_mode
+    )
+    if Operation.LIST in ops:
+        _require_route_indexes(
+            model, filterable, sortable, compound_indexes or [], pagination, indexes
+        )
+    _check_versioning(model, optimistic_concurrency, etags)
     deps = dependencies or []
 
     router = APIRouter(
@@ -365,7 +1901,22 @@ def create_crud_routes(
         dependencies=[Depends(d) for d in deps] if deps else [],
     )
 
-    if Operation.LIST in ops:
+    if Operation.LIST in ops and pagination == "cursor":
+        _register_cursor_list_route(
+            router,
+            model,
+            collection_name,
+            page_size,
+            max_page_size,
+            filterable,
+            searchable,
+            sortable,
+            response_schema,
+            raw_json,
+            search_mode,
+            etags,
+        )
+    elif Operation.LIST in ops:
         _register_list_route(
             router,
             model,
@@ -376,10 +1927,16 @@ def create_crud_routes(
             searchable,
             sortable,
             response_schema,
+            count,
+            count_cap,
+            raw_json,
+            search_mode,
+            etags,
         )
 
+    _cs, _us = _write_schemas(model, create_schema, update_schema)
+
     if Operation.CREATE in ops:
-        _cs = create_schema or _build_create_schema(model)
         _register_create_route(
             router,
             model,
@@ -390,13 +1947,38 @@ def create_crud_routes(
             post_create,
         )
 
+    # Registered before the item routes so "/bulk" is not taken for an id.
+    if bulk:
+        _register_bulk_routes(
+            router,
+            model,
+            collection_name,
+            ops,
+            _cs,
+            _us,
+            bulk_chunk_size,
+            max_bulk_items,
+            [
+                pre_bulk_create,
+                post_bulk_create,
+                pre_bulk_update,
+                post_bulk_update,
+                pre_bulk_delete,
+                post_bulk_delete,
+            ],
+        )
+
     if Operation.READ in ops:
-        _register_read_route(router, model, collection_name, response_schema)
+        _register_read_route(
+            router,
+            model,
+            collection_name,
+            response_schema,
+            optimistic_concurrency,
+            etags,
+        )
 
     if Operation.UPDATE in ops:
-        _us = update_schema or _build_update_schema(
-            create_schema or _build_create_schema(model)
-        )
         _register_update_route(
             router,
             model,
@@ -405,10 +1987,19 @@ def create_crud_routes(
             response_schema,
             pre_update,
             post_update,
+            optimistic_concurrency,
+            etags,
         )
 
     if Operation.DELETE in ops:
-        _register_delete_route(router, model, collection_name, pre_delete, post_delete)
+        _register_delete_route(
+            router,
+            model,
+            collection_name,
+            pre_delete,
+            post_delete,
+            optimistic_concurrency,
+        )
 
     logger.debug(
         "Created CRUD routes for {} at {} (operations: {})",
@@ -425,6 +2016,20 @@ def create_crud_routes(
 # ────────────────────────────────────────────────────────────────
 
 
+def _check_versioning(
+    model: type[Document], optimistic_concurrency: bool, etags: bool
+) -> None:
+    """Reject options that need document versions the model doesn't keep."""
+    if optimistic_concurrency and not _uses_revision(model):
+        raise TypeError(
+            f"optimistic_concurrency requires {model.__name__}.Settings.use_revision"
+        )
+    if etags and not _versioned(model):
+        raise TypeError(
+            f"etags requires {model.__name__} to use revisions or TimeStampMixin"
+        )
+
+
 def _get_collection_name(model: type[Document]) -> str:
     """Get the collection name from a Beanie Document."""
     if hasattr(model, "Settings") and hasattr(model.Settings, "name"):
@@ -432,6 +2037,16 @@ def _get_collection_name(model: type[Document]) -> str:
     return model.__name__.lower().rstrip("model") or model.__name__.lower()
 
 
+def _write_schemas(
+    model: type[Document],
+    create_schema: type[BaseModel] | None,
+    update_schema: type[BaseModel] | None,
+) -> tuple[type[BaseModel], type[BaseModel]]:
+    """Create and update payload schemas, built from the model when not given."""
+    create_schema = create_schema or _build_create_schema(model)
+    return create_schema, update_schema or _build_update_schema(create_schema)
+
+
 def _build_create_schema(model: type[Document]) -> type[BaseModel]:
     """Build a Pydantic create schema from a Beanie Document, excluding id and internal fields."""
     excluded = {"id", "revision_id", "db_insert_dt", "db_update_dt", "deleted_at"}
@@ -468,15 +2083,15 @@ def _build_update_schema(create_schema: type[BaseModel]) -> type[BaseModel]:
 
 
 def _select_fields(
-    doc: Document,
+    doc: BaseModel,
     selected: set[str],
     response_schema: type[BaseModel] | None = None,
 ) -> dict[str, Any]:
-    """Return only the selected fields from a document."""
+    """Return only the selected fields from a document or projection."""
     data = doc.model_dump()
     filtered = {k: v for k, v in data.items() if k in selected or k == "id"}
     if "id" in filtered:
-        filtered["id"] = str(doc.id)
+        filtered["id"] = str(filtered["id"])
     if response_schema:
         return response_schema.model_validate(filtered).model_dump(
             include=selected | {"id"}
@@ -7,6 +7,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
 import vibetuner.frontend.lifespan as lifespan_module
+from vibetuner.asset_manifest import ASSET_KINDS, FINGERPRINT_PREFIX
 from vibetuner.config import settings
 from vibetuner.loader import load_app_config
 from vibetuner.logging import logger
@@ -17,6 +18,11 @@ from .middleware import middlewares
 from .oauth import auto_register_providers
 from .routes import auth, debug, health, language, meta, user
 from .routes.auth import register_oauth_routes
+from .staticfiles import (
+    FingerprintedStaticFiles,
+    PrecompressedStaticFiles,
+    VersionedStaticFiles,
+)
 from .templates import render_template
 
 
@@ -51,12 +57,40 @@ if settings.rate_limit.enabled:
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # ty: ignore[invalid-argument-type]
 
-# Static files
-app.mount(f"/static/v{ctx.v_hash}/css", StaticFiles(directory=paths.css), name="css")
-app.mount(f"/static/v{ctx.v_hash}/img", StaticFiles(directory=paths.img), name="img")
-app.mount(f"/static/v{ctx.v_hash}/js", StaticFiles(directory=paths.js), name="js")
+# Static files (precompressed .zst/.br/.gz siblings from `vibetuner assets compress`
+# are served when the client accepts them). Versioned mounts are cached immutably
+# and served from memory outside debug mode, where assets change under one v_hash.
+app.mount(
+    f"/static/v{ctx.v_hash}/css",
+    VersionedStaticFiles(directory=paths.css, immutable=not ctx.DEBUG),
+    name="css",
+)
+app.mount(
+    f"/static/v{ctx.v_hash}/img",
+    VersionedStaticFiles(directory=paths.img, immutable=not ctx.DEBUG),
+    name="img",
+)
+app.mount(
+    f"/static/v{ctx.v_hash}/js",
+    VersionedStaticFiles(directory=paths.js, immutable=not ctx.DEBUG),
+    name="js",
+)
 
-app.mount("/static/favicons", StaticFiles(directory=paths.favicons), name="favicons")
+# Per-file fingerprinted URLs emitted by the static_url() template global
+for _kind in ASSET_KINDS:
+    app.mount(
+        f"{FINGERPRINT_PREFIX}/{_kind}",
+        FingerprintedStaticFiles(
+            directory=getattr(paths, _kind), kind=_kind, immutable=not ctx.DEBUG
+        ),
+        name=f"{_kind}_fingerprinted",
+    )
+
+app.mount(
+    "/static/favicons",
+    PrecompressedStaticFiles(directory=paths.favicons),
+    name="favicons",
+)
 app.mount("/static/fonts", StaticFiles(directory=paths.fonts), name="fonts")
 
 
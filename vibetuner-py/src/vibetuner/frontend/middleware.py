@@ -1,12 +1,14 @@
 import asyncio
+import json
 import re
 import secrets
+from functools import lru_cache
 from typing import Any, MutableMapping, cast
 
 from fastapi.middleware import Middleware
 from fastapi.requests import HTTPConnection
 from starlette.authentication import AuthCredentials, AuthenticationBackend
-from starlette.datastructures import MutableHeaders
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
@@ -21,6 +23,12 @@ from starlette_babel import (
 from starlette_context.middleware import RawContextMiddleware
 from starlette_context.plugins import RequestIdPlugin
 
+from vibetuner.compression import (
+    StreamCompressor,
+    available_encodings,
+    negotiate_encoding,
+    stream_compressor,
+)
 from vibetuner.config import settings
 from vibetuner.context import ctx
 from vibetuner.htmx import HtmxDetails
@@ -284,6 +292,152 @@ class SecurityHeadersMiddleware:
         await self.app(scope, receive, send_with_headers)
 
 
+class CompressionMiddleware:
+    """Pure ASGI middleware that compresses responses per ``Accept-Encoding``.
+
+    Negotiates zstd, br (when ``brotli`` is installed) and gzip. Only bodies
+    of at least ``minimum_size`` bytes with an allowlisted media type are
+    compressed. Streamed bodies are compressed chunk by chunk with a flush
+    after each, so streamed pages stay progressive.
+
+    Must wrap SecurityHeadersMiddleware so CSP nonces are injected into the
+    HTML before it is compressed. Responses that already carry a
+    ``Content-Encoding`` (precompressed static files), partial content and
+    ``Cache-Control: no-transform`` responses pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int | None = None,
+        content_types: list[str] | None = None,
+    ):
+        config = settings.compression
+        self.app = app
+        self.minimum_size = (
+            config.minimum_size if minimum_size is None else minimum_size
+        )
+        self.content_types = frozenset(content_types or config.content_types)
+        self.encodings = available_encodings()
+        self.levels = {
+            "zstd": config.zstd_level,
+            "br": config.brotli_quality,
+            "gzip": config.gzip_level,
+        }
+
+    def _is_compressible(self, status: int, headers: Headers) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        media_type = headers.get("content-type", "").split(";", 1)[0]
+        return media_type.strip().lower() in self.content_types
+
+    def _holds_start(self, message: Message, encoding: str | None) -> bool:
+        """Whether to hold a response start until its first body chunk.
+
+        Responses that won't be compressed are left to pass through.
+        """
+        headers = MutableHeaders(scope=message)
+        if not self._is_compressible(message["status"], headers):
+            return False
+        headers.add_vary_header("Accept-Encoding")
+        content_length = headers.get("content-length")
+        return encoding is not None and (
+            content_length is None or int(content_length) >= self.minimum_size
+        )
+
+    async def _send_first_body(
+        self, send: Send, initial: Message, message: Message, encoding: str
+    ) -> StreamCompressor | None:
+        """Send the held start with the first body chunk, compressed if worth it.
+
+        Returns the compressor for the remaining chunks of a streamed body,
+        or None when the whole body has been sent.
+        """
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body and len(body) < self.minimum_size:
+            await send(initial)
+            await send(message)
+            return None
+
+        compressor = stream_compressor(encoding, self.levels[encoding])
+        headers = MutableHeaders(scope=initial)
+        headers["Content-Encoding"] = encoding
+        del headers["Content-Length"]
+        # The compressed bytes differ, so a strong validator no longer holds.
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        chunk = compressor.compress(body)
+        if not more_body:
+            chunk += compressor.finish()
+            headers["Content-Length"] = str(len(chunk))
+        await send(initial)
+        await send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+        return compressor if more_body else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+
+        start_message: Message | None = None
+        compressor: StreamCompressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                if self._holds_start(message, encoding):
+                    # Hold the headers until the first body chunk shows
+                    # whether the response is big enough to compress.
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                if start_message is not None:
+                    # No body is coming (e.g. ``http.response.pathsend``), so
+                    # send the held headers as they are and stop compressing.
+                    await send(start_message)
+                    start_message = None
+                    passthrough = True
+                await send(message)
+                return
+
+            if compressor is None:
+                initial, start_message = cast(Message, start_message), None
+                compressor = await self._send_first_body(
+                    send, initial, message, cast(str, encoding)
+                )
+                passthrough = compressor is None
+                return
+
+            more_body = message.get("more_body", False)
+            chunk = compressor.compress(message.get("body", b""))
+            if not more_body:
+                chunk += compressor.finish()
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_compressed)
+
+
 class AdjustLangCookieMiddleware:
     """Pure ASGI middleware that syncs the language cookie with request.state.language.
 
@@ -558,6 +712,22 @@ class StreaqDebugTimeoutMiddleware:
             )
 
 
+# Number of distinct session user payloads whose validated WebUser is kept.
+WEB_USER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=WEB_USER_CACHE_SIZE)
+def _validate_session_user(payload: str) -> WebUser:
+    """Validate a canonical JSON session user payload into a WebUser.
+
+    Memoized on the payload, so full pydantic validation (including the
+    pycountry lookup behind ``LanguageAlpha2``) runs once per distinct
+    session user instead of on every request. Invalid payloads raise and are
+    never cached.
+    """
+    return WebUser.model_validate_json(payload)
+
+
 class AuthBackend(AuthenticationBackend):
     async def authenticate(
         self,
@@ -565,9 +735,12 @@ class AuthBackend(AuthenticationBackend):
     ) -> tuple[AuthCredentials, WebUser] | None:
         if user := conn.session.get("user"):
             try:
+                payload = json.dumps(user, sort_keys=True, separators=(",", ":"))
+                # Hand out a copy so a handler mutating request.user can't leak
+                # into other requests sharing the cached instance.
                 return (
                     AuthCredentials(["authenticated"]),
-                    WebUser.model_validate(user),
+                    _validate_session_user(payload).model_copy(),
                 )
             except Exception as exc:
                 logger.warning(
@@ -616,10 +789,38 @@ def _build_locale_selectors() -> list:
     return selectors
 
 
+def _build_session_middleware() -> Middleware:
+    """Build the session middleware for the configured ``session_backend``."""
+    if settings.session_backend == "redis":
+        if settings.redis_url is not None:
+            from .sessions import RedisSessionMiddleware
+
+            return Middleware(
+                RedisSessionMiddleware,
+                max_age=settings.session_max_age,
+                https_only=not ctx.DEBUG,
+            )
+        logger.warning(
+            "SESSION_BACKEND=redis requires REDIS_URL; falling back to cookie sessions"
+        )
+
+    return Middleware(
+        SessionMiddleware,
+        secret_key=settings.session_key.get_secret_value(),
+        max_age=settings.session_max_age,
+        https_only=not ctx.DEBUG,
+    )
+
+
 middlewares: list[Middleware] = [
     Middleware(RawContextMiddleware, plugins=[RequestIdPlugin(validate=False)]),
 ]
 
+if settings.compression.enabled:
+    # Must wrap SecurityHeadersMiddleware: nonces are injected into the HTML
+    # body first, then the final bytes are compressed on the way out.
+    middlewares.append(Middleware(CompressionMiddleware))
+
 if settings.rate_limit.enabled:
     # SlowAPIASGIMiddleware has a bug where it re-sends http.response.start on
     # every body chunk, crashing streaming responses (FileResponse).
@@ -635,11 +836,7 @@ if settings.security_headers.enabled:
 middlewares += [
     Middleware(TrustedHostMiddleware),
     Middleware(HtmxMiddleware),
-    Middleware(
-        SessionMiddleware,
-        secret_key=settings.session_key.get_secret_value(),
-        https_only=not ctx.DEBUG,
-    ),
+    _build_session_middleware(),
     # LangPrefixMiddleware must run before LocaleMiddleware so that
     # state["lang_prefix"] is populated when locale_selector evaluates it.
     # Middleware listed earlier wraps middleware listed later, so the earlier
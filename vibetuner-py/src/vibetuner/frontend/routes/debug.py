@@ -8,6 +8,7 @@ from fastapi import (
 )
 from fastapi.responses import (
     HTMLResponse,
+    PlainTextResponse,
     RedirectResponse,
 )
 from starlette.datastructures import FormData
@@ -18,6 +19,7 @@ from vibetuner.logging import logger
 from vibetuner.models import UserModel
 from vibetuner.mongo import get_all_models
 from vibetuner.paths import package_templates
+from vibetuner.sse import sse_metrics, sse_metrics_prometheus
 
 from ..deps import MAGIC_COOKIE_NAME
 from ..templates import render_template
@@ -116,6 +118,23 @@ def debug_info(request: Request):
     return render_template("debug/info.html.jinja", request, {"cookies": cookies})
 
 
+@router.get("/sse", response_class=HTMLResponse)
+def debug_sse(request: Request):
+    """Live SSE connections, queue depths and throughput for this worker."""
+    return render_template("debug/sse.html.jinja", request, {"metrics": sse_metrics()})
+
+
+@router.get("/sse/metrics", response_class=PlainTextResponse)
+def debug_sse_metrics():
+    """SSE metrics for this worker in the Prometheus text format.
+
+    Scrapers without a debug session use ``/health/sse/metrics`` instead.
+    """
+    return PlainTextResponse(
+        sse_metrics_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 # Skeleton template block metadata for developer reference.
 # Descriptions and examples are maintained here; the actual block list is
 # extracted from the skeleton template at runtime so it never drifts out of sync.
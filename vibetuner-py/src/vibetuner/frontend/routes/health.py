@@ -1,14 +1,17 @@
 import asyncio
 import os
+import secrets
 import time
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
 
 from vibetuner.config import settings
 from vibetuner.logging import logger
 from vibetuner.paths import root as root_path
+from vibetuner.sse import connection_accounting, sse_metrics_prometheus
 
 
 router = APIRouter(prefix="/health")
@@ -40,13 +43,15 @@ def health_ping():
 async def health_check(detailed: bool = False):
     """Health check endpoint.
 
-    Without query params, returns a fast liveness response.
+    Without query params, returns a fast liveness response, including this
+    worker's SSE connection accounting (totals only).
     With ?detailed=true, checks all configured services and reports latency.
     """
     response: dict[str, Any] = {
         "status": "healthy",
         "version": settings.version,
         "uptime_seconds": round(time.monotonic() - _startup_monotonic),
+        "sse": connection_accounting(),
     }
 
     if detailed:
@@ -89,6 +94,24 @@ def health_instance_id():
     }
 
 
+@router.get("/sse/metrics", response_class=PlainTextResponse)
+def health_sse_metrics(authorization: str | None = Header(None)):
+    """SSE metrics for Prometheus scrapers, enabled by ``SSE_METRICS_TOKEN``.
+
+    Unlike ``/debug/sse/metrics`` it needs no debug session, only the token
+    as ``Authorization: Bearer <token>``.
+    """
+    token = settings.sse.metrics_token
+    if token is None:
+        raise HTTPException(status_code=404)
+    expected = f"Bearer {token.get_secret_value()}"
+    if not secrets.compare_digest((authorization or "").encode(), expected.encode()):
+        raise HTTPException(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    return PlainTextResponse(
+        sse_metrics_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 async def _check_all_services() -> dict[str, dict[str, Any]]:
     """Run health checks for all configured services."""
     from vibetuner.services.email.service import configured_provider
@@ -0,0 +1,268 @@
+# ABOUTME: Server-side session store backed by Redis, keyed by an opaque cookie ID.
+# ABOUTME: Decodes session data lazily on first access and writes back only when modified.
+import json
+import secrets
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from vibetuner.logging import logger
+
+
+def _encode(data: dict[str, Any]) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _user_id(data: dict[str, Any]) -> Any:
+    user = data.get("user")
+    return user.get("id") if isinstance(user, dict) else None
+
+
+class RedisSession(MutableMapping[str, Any]):
+    """Session mapping whose Redis payload is decoded on first access.
+
+    ``raw`` is the JSON payload stored for the session cookie, or ``None`` for
+    a new session. Requests that never read the session never pay for the JSON
+    decode, and :attr:`dirty` only reports ``True`` once the data has been
+    decoded and actually differs from what was loaded.
+    """
+
+    __slots__ = ("_raw", "_data", "_modified", "_loaded_user_id")
+
+    def __init__(self, raw: str | None = None) -> None:
+        self._raw = raw
+        self._data: dict[str, Any] | None = None if raw is not None else {}
+        self._modified = False
+        self._loaded_user_id: Any = None
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            try:
+                data = json.loads(self._raw or "")
+            except json.JSONDecodeError:
+                data = None
+            if not isinstance(data, dict):
+                logger.warning("Discarding malformed server-side session payload")
+                data = {}
+                self._modified = True
+            self._data = data
+            self._loaded_user_id = _user_id(data)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._load()[key] = value
+        self._modified = True
+
+    def __delitem__(self, key: str) -> None:
+        del self._load()[key]
+        self._modified = True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return f"{type(self).__name__}({self._data!r})"
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the session must be written back to Redis."""
+        if self._data is None:
+            return False
+        if self._modified:
+            return True
+        # Nested values (e.g. session["user"]["settings"]) can be mutated in
+        # place without going through __setitem__, so compare the payload.
+        return self._raw is not None and _encode(self._data) != self._raw
+
+    @property
+    def user_changed(self) -> bool:
+        """Whether the authenticated user differs from the one loaded."""
+        return self._data is not None and _user_id(self._data) != self._loaded_user_id
+
+    def serialize(self) -> str:
+        return _encode(self._load())
+
+
+class RedisSessionMiddleware:
+    """Pure ASGI session middleware that keeps session data in Redis.
+
+    Drop-in replacement for Starlette's ``SessionMiddleware``: handlers keep
+    using ``request.session``, but the cookie only carries a random session
+    ID and the data lives under ``{redis_key_prefix}session:{id}``.
+
+    Cost is proportional to use:
+
+    - Requests without a session cookie (first visits, API clients) and
+      requests under ``BYPASS_PREFIXES`` never touch Redis.
+    - Requests with a cookie do a single ``GETEX`` (which also slides the
+      server-side TTL); the JSON payload is only decoded when a handler reads
+      ``request.session``.
+    - The session is only written back when its contents changed. The
+      cookie is re-sent on every response for a known session so its
+      ``Max-Age`` slides with the TTL. Emptying a session deletes the key and
+      the cookie, and a cookie naming an unknown or expired session is
+      cleared so it stops costing a lookup.
+
+    Starlette's session API is synchronous, so the raw payload is fetched
+    before the request is dispatched rather than on first access; only the
+    decode is deferred.
+
+    Unknown or expired session IDs are never reused, and the ID is rotated
+    whenever the authenticated user changes, so a client cannot fix a
+    session ID ahead of login.
+    """
+
+    BYPASS_PREFIXES = ("/static/", "/health/")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        session_cookie: str = "session",
+        max_age: int = 14 * 24 * 60 * 60,
+        path: str = "/",
+        same_site: str = "lax",
+        https_only: bool = False,
+        domain: str | None = None,
+    ) -> None:
+        self.app = app
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.security_flags = f"httponly; samesite={same_site}"
+        if https_only:
+            self.security_flags += "; secure"
+        if domain is not None:
+            self.security_flags += f"; domain={domain}"
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        from vibetuner.config import settings
+
+        return f"{settings.redis_key_prefix}session:{session_id}"
+
+    async def _fetch(self, session_id: str) -> tuple[bool, str | None]:
+        """Fetch a session payload and slide its TTL.
+
+        Returns ``(reachable, payload)`` so a miss (unknown or expired ID) can
+        be told apart from Redis being unavailable.
+        """
+        from vibetuner.redis import get_redis_client, reset_redis_client
+
+        try:
+            client = await get_redis_client()
+            if client is None:
+                return False, None
+            raw = await client.getex(self._key(session_id), ex=self.max_age)
+        except (ConnectionError, OSError, TimeoutError):
+            logger.warning("Redis unavailable, treating session as empty")
+            reset_redis_client()
+            return False, None
+        except Exception as exc:
+            logger.warning("Session load failed: {exc}", exc=exc)
+            return False, None
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return True, raw
+
+    async def _store(
+        self, session_id: str, session: RedisSession, previous_id: str | None
+    ) -> bool:
+        """Write a session payload, dropping ``previous_id`` if it was rotated."""
+        from vibetuner.redis import get_redis_client, reset_redis_client
+
+        try:
+            client = await get_redis_client()
+            if client is None:
+                return False
+            pipe = client.pipeline(transaction=False)
+            pipe.set(self._key(session_id), session.serialize(), ex=self.max_age)
+            if previous_id is not None and previous_id != session_id:
+                pipe.unlink(self._key(previous_id))
+            await pipe.execute()
+            return True
+        except (ConnectionError, OSError, TimeoutError):
+            logger.warning("Redis unavailable, session changes were not saved")
+            reset_redis_client()
+        except Exception as exc:
+            logger.warning("Session save failed: {exc}", exc=exc)
+        return False
+
+    async def _delete(self, session_id: str) -> None:
+        from vibetuner.redis import get_redis_client, reset_redis_client
+
+        try:
+            client = await get_redis_client()
+            if client is not None:
+                await client.unlink(self._key(session_id))
+        except (ConnectionError, OSError, TimeoutError):
+            logger.warning("Redis unavailable, session was not deleted")
+            reset_redis_client()
+        except Exception as exc:
+            logger.warning("Session delete failed: {exc}", exc=exc)
+
+    def _cookie(self, value: str, max_age: int) -> str:
+        return (
+            f"{self.session_cookie}={value}; path={self.path}; "
+            f"Max-Age={max_age}; {self.security_flags}"
+        )
+
+    async def _response_cookie(
+        self, session: RedisSession, known_id: str | None, stale_id: str | None
+    ) -> str | None:
+        """Persist ``session`` and return the ``Set-Cookie`` value to send, if any."""
+        if session.dirty and session:
+            new_id = known_id
+            if new_id is None or session.user_changed:
+                new_id = secrets.token_urlsafe(32)
+            if await self._store(new_id, session, known_id):
+                return self._cookie(new_id, self.max_age)
+        elif session.dirty and known_id is not None:
+            await self._delete(known_id)
+            return self._cookie("null", 0)
+        elif known_id is not None:
+            # GETEX slid the server-side TTL; slide the cookie's Max-Age with it.
+            return self._cookie(known_id, self.max_age)
+        if stale_id is not None:
+            # Drop an unknown or expired ID so later requests skip the lookup.
+            return self._cookie("null", 0)
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+        if any(path.startswith(p) for p in self.BYPASS_PREFIXES):
+            scope["session"] = RedisSession()
+            await self.app(scope, receive, send)
+            return
+
+        session_id = HTTPConnection(scope).cookies.get(self.session_cookie)
+        reachable, raw = await self._fetch(session_id) if session_id else (False, None)
+        # An ID with no stored payload is unknown or expired; never adopt it.
+        known_id = session_id if raw is not None else None
+        stale_id = session_id if reachable and raw is None else None
+        session = RedisSession(raw)
+        scope["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                cookie = await self._response_cookie(session, known_id, stale_id)
+                if cookie is not None:
+                    MutableHeaders(scope=message).append("Set-Cookie", cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
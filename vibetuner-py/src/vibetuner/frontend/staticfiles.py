@@ -0,0 +1,330 @@
+# ABOUTME: StaticFiles variants for the frontend's static mounts.
+# ABOUTME: Serves precompressed siblings and caches content-versioned assets immutably in memory.
+import hashlib
+import os
+import stat
+from dataclasses import dataclass
+from email.utils import formatdate
+from mimetypes import guess_type
+from os import PathLike
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from vibetuner.asset_manifest import AssetManifest, get_asset_manifest
+from vibetuner.compression import (
+    ENCODING_PREFERENCE,
+    ENCODING_SUFFIXES,
+    negotiate_encoding,
+)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that prefers precompressed siblings of the requested file.
+
+    When ``bundle.css`` is requested by a client accepting zstd and
+    ``bundle.css.zst`` exists (see ``vibetuner assets compress``), the sibling
+    is served with ``Content-Encoding: zstd`` and the original media type.
+    Siblings older than their source are ignored so a stale build never
+    shadows a fresh asset. Without a usable sibling the plain file is served
+    and the compression middleware may still compress it on the fly.
+    """
+
+    def _find_precompressed(
+        self, full_path: str, stat_result: os.stat_result, scope: Scope
+    ) -> tuple[str, str, os.stat_result] | None:
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        remaining = list(ENCODING_PREFERENCE)
+        while remaining:
+            encoding = negotiate_encoding(accept_encoding, remaining)
+            if encoding is None:
+                return None
+            remaining.remove(encoding)
+            candidate = full_path + ENCODING_SUFFIXES[encoding]
+            try:
+                candidate_stat = os.stat(candidate)
+            except OSError:
+                continue
+            if (
+                stat.S_ISREG(candidate_stat.st_mode)
+                and candidate_stat.st_mtime >= stat_result.st_mtime
+            ):
+                return encoding, candidate, candidate_stat
+        return None
+
+    def file_response(
+        self,
+        full_path: PathLike | str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        found = self._find_precompressed(os.fspath(full_path), stat_result, scope)
+        if found is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            response.headers.setdefault("Vary", "Accept-Encoding")
+            return response
+
+        encoding, sibling, sibling_stat = found
+        media_type = guess_type(os.fspath(full_path))[0] or "text/plain"
+        response = FileResponse(
+            sibling,
+            status_code=status_code,
+            stat_result=sibling_stat,
+            media_type=media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Files up to this size are kept in memory after their first request.
+MEMORY_CACHE_MAX_FILE_SIZE = 256 * 1024
+
+# Upper bound on the bytes held in memory per mount, siblings included.
+MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Upper bound on the fingerprint lookups (hits and misses) remembered per
+# mount; requested paths are client-chosen, so misses must not grow forever.
+HASH_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedVariant:
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedAsset:
+    media_type: str
+    last_modified: str
+    # Keyed by content coding; "identity" is always present.
+    variants: dict[str, _CachedVariant]
+
+    @property
+    def size(self) -> int:
+        return sum(len(v.body) for v in self.variants.values())
+
+
+def _parse_single_range(http_range: str, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into a half-open ``(start, end)``.
+
+    Returns None when the header should be ignored (other units, multiple
+    ranges, or malformed), in which case the full body is served. Raises
+    ValueError when the range cannot be satisfied.
+    """
+    units, _, spec = http_range.partition("=")
+    if units.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_str:
+            start = int(start_str)
+            end = min(int(end_str) + 1, size) if end_str else size
+        else:
+            start = max(size - int(end_str), 0)
+            end = size
+    except ValueError:
+        return None
+    if start >= size or start >= end:
+        raise ValueError(http_range)
+    return start, end
+
+
+class VersionedStaticFiles(PrecompressedStaticFiles):
+    """Static files for content-versioned URLs (``/static/v{v_hash}/...``).
+
+    The version segment changes whenever the assets do, so responses are
+    marked ``Cache-Control: public, max-age=31536000, immutable`` and repeat
+    visits never revalidate. Small files (``bundle.css``, ``bundle.js``,
+    icons) and their precompressed siblings are read once and then served
+    from memory with strong content-hash ETags and no filesystem calls.
+    Single ``Range`` requests are honoured for both in-memory and on-disk
+    files; multi-range requests get the full body.
+
+    With ``immutable=False`` (debug mode, where assets change under the same
+    version) this behaves exactly like :class:`PrecompressedStaticFiles`.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: PathLike | str,
+        immutable: bool = True,
+        max_file_size: int = MEMORY_CACHE_MAX_FILE_SIZE,
+        max_bytes: int = MEMORY_CACHE_MAX_BYTES,
+        **kwargs,
+    ) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self.immutable = immutable
+        self.max_file_size = max_file_size
+        self.max_bytes = max_bytes
+        self._memory: dict[str, _CachedAsset] = {}
+        self._memory_bytes = 0
+
+    def _load_asset(self, path: str) -> _CachedAsset | None:
+        """Read a small file and its fresh siblings, or None if not cacheable."""
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+        if stat_result.st_size > self.max_file_size:
+            return None
+
+        with open(full_path, "rb") as f:
+            body = f.read()
+        variants = {"identity": body}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sibling = full_path + suffix
+            try:
+                sibling_stat = os.stat(sibling)
+            except OSError:
+                continue
+            if (
+                stat.S_ISREG(sibling_stat.st_mode)
+                and sibling_stat.st_mtime >= stat_result.st_mtime
+            ):
+                with open(sibling, "rb") as f:
+                    variants[encoding] = f.read()
+
+        return _CachedAsset(
+            media_type=guess_type(full_path)[0] or "text/plain",
+            last_modified=formatdate(stat_result.st_mtime, usegmt=True),
+            variants={
+                encoding: _CachedVariant(
+                    data, f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+                )
+                for encoding, data in variants.items()
+            },
+        )
+
+    def _memory_response(self, asset: _CachedAsset, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(
+            request_headers.get("accept-encoding", ""),
+            [e for e in ENCODING_PREFERENCE if e in asset.variants],
+        )
+        variant = asset.variants[encoding or "identity"]
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "ETag": variant.etag,
+            "Last-Modified": asset.last_modified,
+            "Vary": "Accept-Encoding",
+            "Accept-Ranges": "bytes",
+        }
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+
+        body = variant.body
+        status_code = 200
+        http_range = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if http_range and (if_range is None or if_range == variant.etag):
+            try:
+                byte_range = _parse_single_range(http_range, len(body))
+            except ValueError:
+                return Response(
+                    status_code=416,
+                    headers={"Content-Range": f"bytes */{len(body)}"},
+                )
+            if byte_range is not None:
+                start, end = byte_range
+                headers["Content-Range"] = f"bytes {start}-{end - 1}/{len(body)}"
+                body = body[start:end]
+                status_code = 206
+
+        headers["Content-Length"] = str(len(body))
+        if scope["method"] == "HEAD":
+            body = b""
+        return Response(
+            body, status_code=status_code, headers=headers, media_type=asset.media_type
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not self.immutable or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        asset = self._memory.get(path)
+        if asset is None and self._memory_bytes < self.max_bytes:
+            try:
+                asset = await anyio.to_thread.run_sync(self._load_asset, path)
+            except OSError:
+                asset = None
+            if asset is not None and self._memory_bytes + asset.size <= self.max_bytes:
+                self._memory[path] = asset
+                self._memory_bytes += asset.size
+        if asset is not None:
+            return self._memory_response(asset, scope)
+
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 206, 304):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+class FingerprintedStaticFiles(VersionedStaticFiles):
+    """Static files addressed by per-file content hash (see ``static_url()``).
+
+    Serves ``/static/h/{kind}/{hash}/{path}``. When ``hash`` matches the
+    file's entry in the asset manifest the response is immutable and served
+    from memory, exactly like :class:`VersionedStaticFiles`. A stale or
+    unknown hash (e.g. a page rendered before a deploy) still gets the
+    current file, but with ``Cache-Control: no-cache`` so it is never cached
+    under a fingerprint that does not match its content.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: PathLike | str,
+        kind: str,
+        manifest: AssetManifest | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self.kind = kind
+        self._manifest = manifest
+        self._hashes: dict[str, str | None] = {}
+
+    @property
+    def manifest(self) -> AssetManifest:
+        return self._manifest or get_asset_manifest()
+
+    async def _hash_for(self, asset: str) -> str | None:
+        """Manifest hash of ``asset``, or None if there is no such file.
+
+        A lookup can resolve paths and hash the file, so it runs in a worker
+        thread and its result, found or not, is remembered.
+        """
+        try:
+            return self._hashes[asset]
+        except KeyError:
+            pass
+        file_hash = await anyio.to_thread.run_sync(self.manifest.hash_for, asset)
+        if len(self._hashes) < HASH_CACHE_MAX_ENTRIES:
+            self._hashes[asset] = file_hash
+        return file_hash
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        file_hash, _, relative = path.partition(os.sep)
+        if not relative:
+            raise HTTPException(status_code=404)
+
+        asset = f"{self.kind}/{relative.replace(os.sep, '/')}"
+        if self.immutable and await self._hash_for(asset) == file_hash:
+            return await super().get_response(relative, scope)
+
+        response = await PrecompressedStaticFiles.get_response(self, relative, scope)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
@@ -11,6 +11,7 @@ from vibetuner.rendering import (
     render_static_template,
     render_template,
     render_template_string,
+    static_url,
     timeago,
     url_for_language,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "render_static_template",
     "render_template",
     "render_template_string",
+    "static_url",
     "timeago",
     "url_for_language",
 ]
@@ -1,11 +1,15 @@
 # ABOUTME: Reusable model mixins for Beanie documents.
-# ABOUTME: Provides timestamp tracking (TimeStampMixin) and at-rest field encryption (EncryptedFieldsMixin).
+# ABOUTME: Provides timestamp tracking (TimeStampMixin), at-rest field encryption (EncryptedFieldsMixin),
+# ABOUTME: and a normalized prefix-search shadow field (PrefixSearchMixin).
 
+import re
+import unicodedata
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from enum import StrEnum
-from typing import Annotated, Self
+from typing import Annotated, Any, ClassVar, Self
 
-from beanie import Insert, Replace, Save, SaveChanges, Update, before_event
+from beanie import Document, Insert, Replace, Save, SaveChanges, Update, before_event
 from pydantic import BaseModel, Field, model_validator
 
 from vibetuner.time import Unit, now
@@ -172,3 +176,118 @@ class EncryptedFieldsMixin(BaseModel):
             value = getattr(self, name)
             if value is not None and not is_encrypted(value):
                 setattr(self, name, encrypt_value(value, key))
+
+
+# ────────────────────────────────────────────────────────────────
+#  Prefix search shadow field
+# ────────────────────────────────────────────────────────────────
+
+# Terms (and prefix queries) are cut to this many characters, which bounds
+# the shadow field's size for long values.
+SEARCH_TERM_MAX_LENGTH = 64
+
+_WORD_START_RE = re.compile(r"(?:^|(?<=\s))\S")
+
+
+def normalize_search_text(text: str) -> str:
+    """Lowercase ``text``, strip accents, and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def search_terms(values: Iterable[Any]) -> list[str]:
+    """Normalized terms under which ``values`` are found by prefix search.
+
+    Each string (or string inside a list) contributes itself and every
+    suffix that starts at a word, so ``"Crème Brûlée"`` is found by
+    ``"cre"``, ``"creme b"`` and ``"brul"``.
+    """
+    terms: dict[str, None] = {}
+    for value in values:
+        for text in value if isinstance(value, list | tuple) else [value]:
+            if not isinstance(text, str):
+                continue
+            normalized = normalize_search_text(text)
+            for match in _WORD_START_RE.finditer(normalized):
+                terms[normalized[match.start() :][:SEARCH_TERM_MAX_LENGTH]] = None
+    return list(terms)
+
+
+class PrefixSearchMixin(BaseModel):
+    """Normalized shadow field for indexed, case- and accent-insensitive prefix search.
+
+    List the source fields in ``search_fields``; ``search_terms`` is rebuilt
+    from them on every insert, save and replace. Used by
+    ``create_crud_routes(search_mode="prefix")``, which indexes the field
+    and keeps it current on partial updates too. Partial updates made
+    elsewhere (``doc.set(...)``) should call :meth:`refresh_search_terms`
+    and save the result. Documents stored before the mixin was added, or
+    before ``search_fields`` changed, are brought up to date with
+    :func:`backfill_search_terms`.
+
+    Example::
+
+        class Product(Document, PrefixSearchMixin):
+            search_fields: ClassVar[tuple[str, ...]] = ("name", "sku")
+
+            name: str
+            sku: str
+    """
+
+    search_fields: ClassVar[tuple[str, ...]] = ()
+
+    search_terms: list[str] = Field(
+        default_factory=list,
+        description="Normalized word-start prefixes of the search fields",
+    )
+
+    def refresh_search_terms(self) -> list[str]:
+        """Recompute ``search_terms`` from the search fields and return them."""
+        self.search_terms = search_terms(
+            getattr(self, name, None) for name in self.search_fields
+        )
+        return self.search_terms
+
+    @before_event(Insert, Save, SaveChanges, Replace)
+    def refresh_search_terms_on_write(self) -> None:
+        self.refresh_search_terms()
+
+
+async def backfill_search_terms(model: type[Document], *, batch_size: int = 500) -> int:
+    """Rebuild the stored ``search_terms`` of every ``model`` document.
+
+    Reads only the search fields and writes unordered ``bulk_write`` batches
+    of ``batch_size`` updates, skipping documents whose terms are already
+    current, so it is safe to re-run. Returns the number of documents updated.
+
+    Raises:
+        TypeError: If ``model`` does not use :class:`PrefixSearchMixin`.
+    """
+    from pymongo import UpdateOne
+
+    if not issubclass(model, PrefixSearchMixin):
+        raise TypeError(f"{model.__name__} does not use PrefixSearchMixin")
+    keys = []
+    for name in model.search_fields:
+        field = model.model_fields.get(name)
+        keys.append(field.alias if field is not None and field.alias else name)
+
+    collection = model.get_pymongo_collection()
+    projection = dict.fromkeys((*keys, "search_terms"), 1)
+    updated = 0
+    batch: list[UpdateOne] = []
+    async for raw in collection.find({}, projection):
+        terms = search_terms(raw.get(key) for key in keys)
+        if terms != raw.get("search_terms"):
+            batch.append(
+                UpdateOne({"_id": raw["_id"]}, {"$set": {"search_terms": terms}})
+            )
+        if len(batch) >= batch_size:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+            batch = []
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        updated += len(batch)
+    return updated
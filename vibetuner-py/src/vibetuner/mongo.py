@@ -111,6 +111,10 @@ async def init_mongodb() -> None:
         )
         raise
 
+    from vibetuner.crud import ensure_crud_indexes
+
+    await ensure_crud_indexes()
+
     logger.info("MongoDB + Beanie initialized successfully.")
 
 
@@ -11,6 +11,7 @@ from starlette.requests import Request
 from starlette.responses import HTMLResponse, Response, StreamingResponse
 from starlette.templating import Jinja2Templates
 
+from vibetuner.asset_manifest import static_url
 from vibetuner.context import ctx as data_ctx
 from vibetuner.loader import load_app_config
 from vibetuner.logging import logger
@@ -32,6 +33,7 @@ __all__ = [
     "lang_url_for",
     "url_for_language",
     "hreflang_tags",
+    "static_url",
 ]
 
 
@@ -891,6 +893,8 @@ from vibetuner.i18n import language_picker as _language_picker  # noqa: E402
 
 _extra_globals: dict[str, Any] = {
     "DEBUG": data_ctx.DEBUG,
+    # Per-file fingerprinted static asset URLs
+    "static_url": static_url,
     # Language URL helpers for SEO
     "lang_url_for": lang_url_for,
     "url_for_language": url_for_language,
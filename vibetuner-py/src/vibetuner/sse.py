@@ -2,17 +2,23 @@
 # ABOUTME: Provides decorator for SSE endpoints, broadcast function, and Redis pub/sub backend.
 import asyncio
 import json
+import math
+import random
 import re
+import time
 import uuid
+import weakref
 from collections import deque
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Hashable, Iterable, Mapping
 from contextlib import suppress
 from functools import wraps
+from itertools import zip_longest
 from typing import Any
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 from fastapi.sse import EventSourceResponse, format_sse_event
 
+from vibetuner.config import SlowConsumerPolicy
 from vibetuner.logging import logger
 from vibetuner.rendering import render_template_string
 
@@ -62,17 +68,17 @@ class _EventBuffer:
     __slots__ = ("_buf", "_next_id")
 
     def __init__(self, maxlen: int = 100) -> None:
-        self._buf: deque[tuple[int, dict[str, str]]] = deque(maxlen=maxlen)
+        self._buf: deque[tuple[int, dict[str, Any]]] = deque(maxlen=maxlen)
         self._next_id = 1
 
-    def append(self, payload: dict[str, str]) -> int:
+    def append(self, payload: dict[str, Any]) -> int:
         """Store an event and return its assigned ID."""
         event_id = self._next_id
         self._next_id += 1
         self._buf.append((event_id, payload))
         return event_id
 
-    def events_after(self, last_id: int) -> list[tuple[int, dict[str, str]]]:
+    def events_after(self, last_id: int) -> list[tuple[int, dict[str, Any]]]:
         """Return all buffered events with ID > last_id."""
         return [(eid, p) for eid, p in self._buf if eid > last_id]
 
@@ -82,7 +88,9 @@ class _EventBuffer:
 # ────────────────────────────────────────────────────────────────
 
 
-def _format_event(payload: dict[str, str], *, event_id: str | None = None) -> bytes:
+def _format_event(
+    payload: Mapping[str, str | None], *, event_id: str | None = None
+) -> bytes:
     """Encode an SSE payload dict into wire-format bytes.
 
     Wraps fastapi.sse.format_sse_event for internal use.
@@ -95,6 +103,56 @@ def _format_event(payload: dict[str, str], *, event_id: str | None = None) -> by
     )
 
 
+# Keepalive comment frame, encoded once and shared by every idle connection.
+_KEEPALIVE_FRAME = _format_event({"comment": "keepalive"})
+
+
+class _DeferredFrame:
+    """An event each subscriber renders from its own request.
+
+    Queued by ``broadcast(..., per_subscriber=True)`` instead of pre-encoded
+    bytes. Rendering happens when a subscriber's stream is about to send the
+    event, and the result is memoized per (language, vary key), so all
+    subscribers that would see the same markup share one rendering.
+    """
+
+    __slots__ = ("ctx", "event", "event_id", "rendered", "template")
+
+    def __init__(self, payload: dict[str, Any], event_id: str | None = None) -> None:
+        self.event = payload.get("event")
+        self.template: str = payload["template"]
+        self.ctx: dict[str, Any] = payload.get("ctx") or {}
+        self.event_id = event_id
+        self.rendered: dict[tuple[Any, Any], bytes] = {}
+
+    def render(self, request: Request, vary: Any = None) -> bytes:
+        """Encoded frame for ``request``; empty if the template failed."""
+        key = (getattr(request.state, "language", None), vary)
+        frame = self.rendered.get(key)
+        if frame is None:
+            try:
+                data = render_template_string(self.template, request, self.ctx)
+                frame = _format_event(
+                    {"event": self.event, "data": data}, event_id=self.event_id
+                )
+            except Exception:
+                logger.exception(
+                    "SSE per-subscriber render of {} failed", self.template
+                )
+                frame = b""
+            self.rendered[key] = frame
+        return frame
+
+
+def _encode_payload(
+    payload: dict[str, Any], event_id: str | None = None
+) -> "bytes | _DeferredFrame":
+    """Encode a payload, deferring rendering for per-subscriber templates."""
+    if "template" in payload:
+        return _DeferredFrame(payload, event_id)
+    return _format_event(payload, event_id=event_id)
+
+
 # Headers that stop reverse proxies and CDNs (Caddy, nginx, Cloudflare) from
 # buffering the event stream. Without them the proxy holds the response, so the
 # client gets a 200 that never delivers any bytes until the connection closes.
@@ -108,42 +166,614 @@ _SSE_HEADERS = {
 #  In-process connection registry
 # ────────────────────────────────────────────────────────────────
 
-_channels: dict[str, set[asyncio.Queue]] = {}
+
+class _ChannelCounters:
+    """Slow-consumer counters for one channel while it has subscribers."""
+
+    __slots__ = ("disconnected", "dropped")
+
+    def __init__(self) -> None:
+        self.dropped = 0
+        self.disconnected = 0
+
+
+_channel_counters: dict[str, _ChannelCounters] = {}
+
+
+class _SSEStats:
+    """Process-wide cumulative SSE counters, read by sse_metrics()."""
+
+    __slots__ = (
+        "bytes_out",
+        "disconnected",
+        "dropped",
+        "events_in",
+        "events_out",
+        "listener_reconnects",
+        "rejected",
+    )
+
+    def __init__(self) -> None:
+        self.events_in = 0
+        self.events_out = 0
+        self.bytes_out = 0
+        self.listener_reconnects = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.disconnected = 0
+
+
+_stats = _SSEStats()
+
+
+def _counters(channel: str) -> _ChannelCounters:
+    counters = _channel_counters.get(channel)
+    if counters is None:
+        counters = _channel_counters[channel] = _ChannelCounters()
+    return counters
+
+
+class _Subscriber:
+    """Bounded queue of pre-encoded frames for one connected client.
+
+    Holds at most ``maxsize`` frames (0 means unbounded). When a frame
+    arrives for a full queue, ``policy`` decides what gives way; see
+    ``SSESettings`` for the available policies. A ``disconnect`` overflow
+    closes the subscriber, and :meth:`get` then returns None so the stream
+    can end and the client can resume via ``Last-Event-ID``.
+    """
+
+    __slots__ = (
+        "_active",
+        "_frames",
+        "_waiter",
+        "channel",
+        "closed",
+        "maxsize",
+        "policy",
+        "replayed_through",
+    )
+
+    def __init__(
+        self, channel: str, maxsize: int = 0, policy: SlowConsumerPolicy = "drop_oldest"
+    ) -> None:
+        self.channel = channel
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+        # Set after a Redis Stream replay: frames for stream IDs up to this one
+        # were already sent and are skipped.
+        self.replayed_through: tuple[int, int] | None = None
+        self._frames: deque[tuple[str | None, bytes | _DeferredFrame, str | None]] = (
+            deque()
+        )
+        self._waiter: asyncio.Future | None = None
+        # Cleared by each keepalive tick, set by every queued frame.
+        self._active = True
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _make_room(self, event: str | None) -> bool:
+        """Free a slot for an incoming frame, or return False to reject it."""
+        counters = _counters(self.channel)
+        if self.policy == "disconnect":
+            self.closed = True
+            self._frames.clear()
+            counters.disconnected += 1
+            _stats.disconnected += 1
+            self._wake()
+            return False
+
+        if self.policy == "coalesce":
+            # Keep the latest pending frame per event name; the incoming
+            # frame supersedes any pending frame with the same name.
+            latest: dict[
+                str | None, tuple[str | None, bytes | _DeferredFrame, str | None]
+            ] = {}
+            for item in self._frames:
+                latest.pop(item[0], None)
+                latest[item[0]] = item
+            latest.pop(event, None)
+            if len(latest) < len(self._frames):
+                dropped = len(self._frames) - len(latest)
+                counters.dropped += dropped
+                _stats.dropped += dropped
+                self._frames = deque(latest.values())
+                return True
+
+        self._frames.popleft()
+        counters.dropped += 1
+        _stats.dropped += 1
+        return True
+
+    def put_nowait(
+        self,
+        frame: bytes | _DeferredFrame,
+        event: str | None = None,
+        event_id: str | None = None,
+    ) -> None:
+        """Queue a frame, applying the overflow policy when full."""
+        if self.closed:
+            return
+        if (
+            self.maxsize > 0
+            and len(self._frames) >= self.maxsize
+            and not self._make_room(event)
+        ):
+            return
+        self._frames.append((event, frame, event_id))
+        self._active = True
+        self._wake()
+
+    def keepalive(self) -> None:
+        """Queue a keepalive if nothing was queued since the previous tick."""
+        if not self._active and not self._frames and not self.closed:
+            self._frames.append((None, _KEEPALIVE_FRAME, None))
+            self._wake()
+        self._active = False
+
+    def _already_replayed(self, event_id: str | None) -> bool:
+        if self.replayed_through is None or event_id is None:
+            return False
+        key = _stream_id_key(event_id)
+        return key is not None and key <= self.replayed_through
+
+    def get_nowait(self) -> bytes | _DeferredFrame:
+        while self._frames:
+            _, frame, event_id = self._frames.popleft()
+            if not self._already_replayed(event_id):
+                return frame
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> bytes | _DeferredFrame | None:
+        """Wait for the next frame; None once the subscriber is closed."""
+        while True:
+            while not self._frames:
+                if self.closed:
+                    return None
+                self._waiter = asyncio.get_running_loop().create_future()
+                try:
+                    await self._waiter
+                finally:
+                    self._waiter = None
+            _, frame, event_id = self._frames.popleft()
+            if not self._already_replayed(event_id):
+                return frame
+
+
+_channels: dict[str, set[_Subscriber]] = {}
 _channel_buffers: dict[str, _EventBuffer] = {}
 
 
-def _subscribe(channel: str) -> asyncio.Queue:
-    """Add a new subscriber queue to a channel."""
-    queue: asyncio.Queue = asyncio.Queue()
-    _channels.setdefault(channel, set()).add(queue)
-    return queue
+def _subscribe(
+    channel: str,
+    *,
+    maxsize: int | None = None,
+    policy: SlowConsumerPolicy | None = None,
+) -> _Subscriber:
+    """Add a new subscriber to a channel.
+
+    The subscriber receives wire-format ``bytes`` frames from _dispatch_local.
+    ``maxsize`` and ``policy`` default to ``settings.sse``.
+    """
+    from vibetuner.config import settings
+
+    subscriber = _Subscriber(
+        channel,
+        settings.sse.queue_size if maxsize is None else maxsize,
+        policy or settings.sse.slow_consumer_policy,
+    )
+    subscribers = _channels.get(channel)
+    if subscribers is None:
+        subscribers = _channels[channel] = set()
+        _request_subscription_sync(channel)
+    subscribers.add(subscriber)
+    _ensure_keepalive_ticker()
+    return subscriber
 
 
-def _unsubscribe(channel: str, queue: asyncio.Queue) -> None:
-    """Remove a subscriber queue from a channel."""
+def _unsubscribe(channel: str, subscriber: _Subscriber) -> None:
+    """Remove a subscriber from a channel."""
     if channel in _channels:
-        _channels[channel].discard(queue)
+        _channels[channel].discard(subscriber)
         if not _channels[channel]:
             del _channels[channel]
+            # Channels are often per user or per resource; keep counters only
+            # for live ones so their number stays bounded. Process-wide
+            # totals live in _stats.
+            _channel_counters.pop(channel, None)
+            _request_subscription_sync(channel)
+
+
+# One timer per process sends keepalives to idle subscribers, instead of a
+# timeout wrapped around every subscriber's wait for its next frame.
+_keepalive_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _ensure_keepalive_ticker() -> None:
+    """Start the keepalive ticker on the running loop if it is not running."""
+    global _keepalive_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if _keepalive_loop is not loop:
+        from vibetuner.config import settings
+
+        _keepalive_loop = loop
+        loop.call_later(settings.sse.keepalive_interval, _keepalive_tick)
+
+
+def _keepalive_tick() -> None:
+    """Keep idle connections alive, then reschedule while any remain."""
+    global _keepalive_loop
+    for subscribers in _channels.values():
+        for subscriber in subscribers:
+            subscriber.keepalive()
+
+    loop = asyncio.get_running_loop()
+    if not _channels or _keepalive_loop is not loop:
+        _keepalive_loop = None
+        return
+
+    from vibetuner.config import settings
+
+    loop.call_later(settings.sse.keepalive_interval, _keepalive_tick)
+
+
+def channel_counters() -> dict[str, dict[str, int]]:
+    """Per-channel slow-consumer counters for channels with subscribers.
+
+    Returns ``{channel: {"dropped": n, "disconnected": m}}`` for every
+    connected channel that has dropped an event or disconnected a subscriber.
+    A channel's counters are discarded when its last subscriber leaves;
+    :func:`sse_metrics` keeps the process-wide totals.
+    """
+    return {
+        channel: {"dropped": c.dropped, "disconnected": c.disconnected}
+        for channel, c in _channel_counters.items()
+    }
+
+
+# (monotonic time, events_in, events_out, bytes_out) taken by sse_metrics();
+# rates are averaged against the oldest sample from the last minute.
+_RATE_WINDOW_SECONDS = 60.0
+_rate_samples: deque[tuple[float, int, int, int]] = deque()
+
+
+def _rates(now: float) -> tuple[float, float, float]:
+    totals = (_stats.events_in, _stats.events_out, _stats.bytes_out)
+    while _rate_samples and now - _rate_samples[0][0] > _RATE_WINDOW_SECONDS:
+        _rate_samples.popleft()
+    if not _rate_samples or now - _rate_samples[-1][0] >= 1.0:
+        _rate_samples.append((now, *totals))
+
+    start, *previous = _rate_samples[0]
+    elapsed = now - start
+    if elapsed <= 0:
+        return 0.0, 0.0, 0.0
+    ev_in, ev_out, bytes_out = (
+        (total - before) / elapsed
+        for total, before in zip(totals, previous, strict=True)
+    )
+    return ev_in, ev_out, bytes_out
+
+
+def sse_metrics() -> dict[str, Any]:
+    """Snapshot of this worker's SSE connections and throughput.
+
+    ``channels`` maps every channel with connected clients to its subscriber
+    count, queued frames, the deepest single queue and its slow-consumer
+    counters, which are discarded once the channel has no subscribers left.
+    The top-level ``dropped`` and ``disconnected`` totals cover every channel.
+    Counters are cumulative since process start; the per-second rates are
+    averaged over up to the last minute of ``sse_metrics()`` calls, so the
+    first call after a quiet period reports rates since that call.
+    """
+    channels: dict[str, dict[str, int]] = {}
+    for channel, subscribers in _channels.items():
+        depths = [s.qsize() for s in subscribers]
+        channels[channel] = {
+            "subscribers": len(depths),
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped": 0,
+            "disconnected": 0,
+        }
+    for channel, counters in _channel_counters.items():
+        entry = channels.setdefault(
+            channel,
+            {"subscribers": 0, "queued": 0, "max_queue_depth": 0},
+        )
+        entry["dropped"] = counters.dropped
+        entry["disconnected"] = counters.disconnected
+
+    events_in_rate, events_out_rate, bytes_out_rate = _rates(time.monotonic())
+    return {
+        "worker_id": _WORKER_ID,
+        "connections": sum(c["subscribers"] for c in channels.values()),
+        "channels": dict(sorted(channels.items())),
+        "events_in": _stats.events_in,
+        "events_out": _stats.events_out,
+        "bytes_out": _stats.bytes_out,
+        "events_in_per_second": round(events_in_rate, 2),
+        "events_out_per_second": round(events_out_rate, 2),
+        "bytes_out_per_second": round(bytes_out_rate, 2),
+        "listener_reconnects": _stats.listener_reconnects,
+        "rejected": _stats.rejected,
+        "dropped": _stats.dropped,
+        "disconnected": _stats.disconnected,
+    }
+
 
+def _prometheus_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
-def _dispatch_local(channel: str, payload: dict[str, str]) -> int | None:
+
+def sse_metrics_prometheus() -> str:
+    """Render :func:`sse_metrics` in the Prometheus text exposition format.
+
+    Per-channel series carry a ``channel`` label; with one channel per user
+    or resource, expect one series per connected channel.
+    """
+    metrics = sse_metrics()
+    lines: list[str] = []
+
+    def metric(name: str, kind: str, help_text: str, samples) -> None:
+        lines.append(f"# HELP vibetuner_sse_{name} {help_text}")
+        lines.append(f"# TYPE vibetuner_sse_{name} {kind}")
+        for labels, value in samples:
+            lines.append(f"vibetuner_sse_{name}{labels} {value}")
+
+    def per_channel(key: str):
+        return [
+            (f'{{channel="{_prometheus_label(ch)}"}}', values[key])
+            for ch, values in metrics["channels"].items()
+        ]
+
+    metric(
+        "connections", "gauge", "Connected SSE clients.", [("", metrics["connections"])]
+    )
+    metric(
+        "channel_subscribers",
+        "gauge",
+        "Connected SSE clients per channel.",
+        per_channel("subscribers"),
+    )
+    metric(
+        "channel_queued_frames",
+        "gauge",
+        "Frames waiting in subscriber queues per channel.",
+        per_channel("queued"),
+    )
+    metric(
+        "channel_dropped_total",
+        "counter",
+        "Frames dropped by the slow-consumer policy per channel.",
+        per_channel("dropped"),
+    )
+    metric(
+        "channel_disconnected_total",
+        "counter",
+        "Subscribers disconnected by the slow-consumer policy per channel.",
+        per_channel("disconnected"),
+    )
+    metric(
+        "dropped_total",
+        "counter",
+        "Frames dropped by the slow-consumer policy.",
+        [("", metrics["dropped"])],
+    )
+    metric(
+        "disconnected_total",
+        "counter",
+        "Subscribers disconnected by the slow-consumer policy.",
+        [("", metrics["disconnected"])],
+    )
+    metric(
+        "events_in_total",
+        "counter",
+        "Events dispatched to local channels.",
+        [("", metrics["events_in"])],
+    )
+    metric(
+        "events_out_total",
+        "counter",
+        "Frames written to SSE clients, keepalives included.",
+        [("", metrics["events_out"])],
+    )
+    metric(
+        "bytes_out_total",
+        "counter",
+        "Bytes of SSE frames written to clients.",
+        [("", metrics["bytes_out"])],
+    )
+    metric(
+        "rejected_total",
+        "counter",
+        "SSE connections refused by connection limits.",
+        [("", metrics["rejected"])],
+    )
+    metric(
+        "listener_reconnects_total",
+        "counter",
+        "Redis pub/sub listener reconnects.",
+        [("", metrics["listener_reconnects"])],
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _dispatch_local(channel: str, payload: dict[str, Any]) -> str | int | None:
     """Dispatch a payload to all local subscribers of a channel.
 
-    Returns the event ID if the channel has a buffer, else None.
+    The wire-format frame (including the event ID) is encoded once and the
+    same immutable ``bytes`` object is queued for every subscriber, so fan-out
+    costs one encode plus one queue put per connection. Per-subscriber
+    template payloads queue one shared :class:`_DeferredFrame` instead.
+
+    Payloads appended to a Redis Stream carry their global stream ID under
+    ``"id"``; otherwise an in-memory buffer assigns one.
+
+    Returns the event ID (the buffer's int, or else the payload's stream ID),
+    or None when the event has neither.
     """
-    event_id: int | None = None
+    _stats.events_in += 1
+    event_id: int | str | None = payload.get("id")
     if channel in _channel_buffers:
         event_id = _channel_buffers[channel].append(payload)
 
-    if channel in _channels:
-        for q in list(_channels[channel]):
-            with suppress(asyncio.QueueFull):
-                q.put_nowait((event_id, payload))
+    subscribers = _channels.get(channel)
+    if subscribers:
+        wire_id = str(event_id) if event_id is not None else None
+        frame = _encode_payload(payload, wire_id)
+        event = payload.get("event")
+        for subscriber in list(subscribers):
+            subscriber.put_nowait(frame, event, wire_id)
 
     return event_id
 
 
+# ────────────────────────────────────────────────────────────────
+#  Admission control (per-worker connection limits)
+# ────────────────────────────────────────────────────────────────
+
+
+class _ConnectionLease:
+    """One admitted SSE connection; released exactly once when it ends."""
+
+    __slots__ = ("channel", "released", "user")
+
+    def __init__(self, user: str | None, channel: str | None) -> None:
+        self.user = user
+        self.channel = channel
+        self.released = False
+
+    def release(self) -> None:
+        if self.released:
+            return
+        self.released = True
+        _connections.total -= 1
+        _decrement(_connections.by_user, self.user)
+        _decrement(_connections.by_channel, self.channel)
+
+
+class _ConnectionAccounting:
+    """Open SSE connections on this worker, in total, per user and per channel."""
+
+    __slots__ = ("by_channel", "by_user", "total")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.by_user: dict[str, int] = {}
+        self.by_channel: dict[str, int] = {}
+
+
+_connections = _ConnectionAccounting()
+
+
+def _decrement(counts: dict[str, int], key: str | None) -> None:
+    if key is None:
+        return
+    remaining = counts.get(key, 0) - 1
+    if remaining > 0:
+        counts[key] = remaining
+    else:
+        counts.pop(key, None)
+
+
+def _connection_user(request: Request) -> str | None:
+    """Authenticated user ID for per-user limits, or None for anonymous."""
+    user = request.scope.get("user")
+    if user is None or not getattr(user, "is_authenticated", False):
+        return None
+    user_id = getattr(user, "id", None)
+    return str(user_id) if user_id is not None else None
+
+
+def _exceeded_limit(
+    user: str | None,
+    channel: str | None,
+    max_per_user: int | None,
+    max_per_channel: int | None,
+) -> str | None:
+    """Name of the first connection limit a new connection would exceed."""
+    from vibetuner.config import settings
+
+    limits = settings.sse
+    max_per_user = (
+        limits.max_connections_per_user if max_per_user is None else max_per_user
+    )
+    max_per_channel = (
+        limits.max_connections_per_channel
+        if max_per_channel is None
+        else max_per_channel
+    )
+    if limits.max_connections and _connections.total >= limits.max_connections:
+        return "worker"
+    if (
+        user is not None
+        and max_per_user
+        and _connections.by_user.get(user, 0) >= max_per_user
+    ):
+        return "user"
+    if (
+        channel is not None
+        and max_per_channel
+        and _connections.by_channel.get(channel, 0) >= max_per_channel
+    ):
+        return "channel"
+    return None
+
+
+def _admit(user: str | None, channel: str | None) -> _ConnectionLease:
+    _connections.total += 1
+    if user is not None:
+        _connections.by_user[user] = _connections.by_user.get(user, 0) + 1
+    if channel is not None:
+        _connections.by_channel[channel] = _connections.by_channel.get(channel, 0) + 1
+    return _ConnectionLease(user, channel)
+
+
+def _over_limit_response(limit: str) -> Response:
+    """Tell an over-limit client to come back later, with jitter."""
+    from vibetuner.config import settings
+
+    _stats.rejected += 1
+    retry_after = settings.sse.over_limit_retry_after * random.uniform(1, 2)  # noqa: S311
+    logger.debug("SSE connection refused: {} connection limit reached", limit)
+    if settings.sse.over_limit_response == "503":
+        return Response(
+            status_code=503, headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+    # EventSource honours ``retry:`` when it reconnects after the stream ends.
+    return Response(
+        f"retry: {int(retry_after * 1000)}\n\n",
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
+def connection_accounting() -> dict[str, int]:
+    """Aggregate SSE connection counts and limits for this worker.
+
+    Safe to expose publicly: no channel names or user IDs, only totals.
+    """
+    from vibetuner.config import settings
+
+    return {
+        "connections": _connections.total,
+        "max_connections": settings.sse.max_connections,
+        "channels": len(_connections.by_channel),
+        "users": len(_connections.by_user),
+        "rejected": _stats.rejected,
+    }
+
+
 # ────────────────────────────────────────────────────────────────
 #  Redis pub/sub bridge (optional, for multi-worker)
 # ────────────────────────────────────────────────────────────────
@@ -164,7 +794,7 @@ def _parse_redis_message(message: dict, prefix: str) -> tuple[str, dict] | None:
     Returns None and logs a warning for malformed messages (invalid JSON,
     missing keys, wrong types) instead of raising.
     """
-    if message["type"] != "pmessage":
+    if message["type"] != "message":
         return None
 
     redis_channel = message["channel"]
@@ -201,10 +831,18 @@ def _parse_redis_message(message: dict, prefix: str) -> tuple[str, dict] | None:
         )
         return None
 
-    return channel, {
+    parsed = {
         "event": payload.get("event", "message"),
         "data": payload.get("data", ""),
     }
+    # Per-subscriber broadcasts carry the template and context to render.
+    if isinstance(payload.get("template"), str):
+        parsed["template"] = payload["template"]
+        parsed["ctx"] = payload.get("ctx") or {}
+    # Stream-backed broadcasts carry the global stream ID for Last-Event-ID.
+    if isinstance(payload.get("id"), str):
+        parsed["id"] = payload["id"]
+    return channel, parsed
 
 
 _LISTENER_RECONNECT_DELAY = 1.0
@@ -224,14 +862,103 @@ async def _close_subscriber(pubsub, client) -> None:
         await client.aclose()
 
 
+# Channels whose Redis subscription may need to change, drained by the
+# listener's _sync_subscriptions task. Only tracked while a listener runs; a
+# (re)connect resyncs every channel in use anyway.
+_pending_subscription_sync: set[str] = set()
+_subscription_wakeup: asyncio.Event | None = None
+
+# Per-worker channel nobody publishes to. Subscribing to it keeps the pub/sub
+# connection in subscribed mode (and listen() running) while no SSE channel has
+# local subscribers.
+_CONTROL_CHANNEL = f"_worker:{_WORKER_ID}"
+
+
+def _wants_subscription(channel: str) -> bool:
+    """Whether this worker needs Redis messages for a channel.
+
+    Channels with local subscribers need them for live delivery; buffered
+    channels need them so Last-Event-ID replay covers other workers' events.
+    """
+    return channel in _channels or channel in _channel_buffers
+
+
+def _request_subscription_sync(channel: str) -> None:
+    """Ask the Redis listener to (un)subscribe a channel whose audience changed."""
+    if _subscription_wakeup is not None:
+        _pending_subscription_sync.add(channel)
+        _subscription_wakeup.set()
+
+
+async def _sync_subscriptions(pubsub, prefix: str) -> None:
+    """Keep the listener's SUBSCRIBEs in line with the channels in use.
+
+    A channel is subscribed when it gains its first local subscriber and
+    unsubscribed when its last one leaves, so each worker only receives
+    (and decodes) messages for its own audience.
+    """
+    global _subscription_wakeup
+    wakeup = _subscription_wakeup = asyncio.Event()
+    subscribed: set[str] = set()
+    _pending_subscription_sync.clear()
+    _pending_subscription_sync.update(_channels, _channel_buffers)
+    try:
+        while True:
+            while _pending_subscription_sync:
+                channel = _pending_subscription_sync.pop()
+                wanted = _wants_subscription(channel)
+                if wanted and channel not in subscribed:
+                    await pubsub.subscribe(f"{prefix}{channel}")
+                    subscribed.add(channel)
+                elif not wanted and channel in subscribed:
+                    await pubsub.unsubscribe(f"{prefix}{channel}")
+                    subscribed.discard(channel)
+            wakeup.clear()
+            await wakeup.wait()
+    finally:
+        if _subscription_wakeup is wakeup:
+            _subscription_wakeup = None
+
+
+async def _relay_messages(pubsub, prefix: str) -> None:
+    """Dispatch every pub/sub message to local subscribers."""
+    from redis.exceptions import RedisError
+
+    async for message in pubsub.listen():
+        parsed = _parse_redis_message(message, prefix)
+        if parsed is not None:
+            _dispatch_local(*parsed)
+    raise RedisError("SSE pub/sub connection is no longer subscribed")
+
+
+async def _run_subscriber(pubsub, prefix: str) -> None:
+    """Relay messages and sync subscriptions until either one fails."""
+    tasks = {
+        asyncio.create_task(_relay_messages(pubsub, prefix)),
+        asyncio.create_task(_sync_subscriptions(pubsub, prefix)),
+    }
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in done:
+        task.result()
+
+
 async def _redis_listen_loop(prefix: str) -> None:
     """Relay Redis pub/sub messages to local queues, reconnecting on failure.
 
+    The worker SUBSCRIBEs only to channels it has local subscribers (or a
+    replay buffer) for, reference-counted through ``_subscribe`` and
+    ``_unsubscribe``, rather than pattern-subscribing to every SSE channel.
+
     The subscriber connection carries no socket read timeout (see
     ``settings.redis_subscriber_kwargs``), so an idle channel never raises. A
     dropped connection or other Redis error closes the subscriber and the loop
     re-subscribes after a short delay rather than exiting and leaving the worker
-    silent (``PUBSUB NUMPAT`` decaying to 0).
+    silent.
     """
     from redis.exceptions import RedisError
 
@@ -245,13 +972,10 @@ async def _redis_listen_loop(prefix: str) -> None:
 
         pubsub = client.pubsub()
         try:
-            await pubsub.psubscribe(f"{prefix}*")
-            logger.debug("SSE Redis pub/sub listener subscribed to {}*", prefix)
+            await pubsub.subscribe(f"{prefix}{_CONTROL_CHANNEL}")
+            logger.debug("SSE Redis pub/sub listener connected for {}", prefix)
             delay = _LISTENER_RECONNECT_DELAY  # reset backoff after successful connect
-            async for message in pubsub.listen():
-                parsed = _parse_redis_message(message, prefix)
-                if parsed is not None:
-                    _dispatch_local(*parsed)
+            await _run_subscriber(pubsub, prefix)
         except asyncio.CancelledError:
             await _close_subscriber(pubsub, client)
             raise
@@ -264,12 +988,13 @@ async def _redis_listen_loop(prefix: str) -> None:
             await _close_subscriber(pubsub, client)
             await asyncio.sleep(delay)
             delay = _next_reconnect_delay(delay)
+            _stats.listener_reconnects += 1
 
 
 async def start_redis_listener() -> None:
     """Start a process-lifetime task relaying Redis pub/sub to local queues.
 
-    Owned by the frontend lifespan so the worker's ``psubscribe`` stays live for
+    Owned by the frontend lifespan so the worker's subscriptions stay live for
     the whole process, not just one request. The loop reconnects on its own, so a
     running task is never duplicated; it is only (re)created when absent or done.
     """
@@ -311,14 +1036,14 @@ async def _get_redis_publish_client():
 
 async def _close_redis_publish_client() -> None:
     """Release the local reference to the shared Redis publish client."""
-    global _redis_publish_client
+    global _redis_publish_client, _stream_publish_script
     # Don't close the shared client — just drop the local reference.
     _redis_publish_client = None
+    _stream_publish_script = None
 
 
-async def _publish_to_redis(channel: str, payload: dict[str, str]) -> None:
+async def _publish_to_redis(channel: str, payload: dict[str, Any]) -> None:
     """Publish a payload to Redis for multi-worker broadcasting (best-effort)."""
-    global _redis_publish_client
     try:
         client = await _get_redis_publish_client()
         if client is None:
@@ -333,18 +1058,272 @@ async def _publish_to_redis(channel: str, payload: dict[str, str]) -> None:
         logger.debug(
             "Redis SSE publish failed due to connection error, resetting client"
         )
-        from vibetuner.redis import reset_redis_client
-
-        _redis_publish_client = None
-        reset_redis_client()
+        _reset_redis_publish_client()
     except Exception:
         logger.debug("Redis SSE publish failed (local dispatch still succeeded)")
 
 
+async def _publish_many(
+    items: list[tuple[str, dict[str, Any]]], *, streams: bool = False
+) -> list[str | None]:
+    """Publish several payloads in one pipelined round trip (best-effort).
+
+    With ``streams``, each payload goes through the stream publish script and
+    the returned list holds the stream IDs; otherwise it is empty.
+    """
+    try:
+        client = await _get_redis_publish_client()
+        if client is None:
+            return []
+
+        from vibetuner.config import settings
+
+        pipe = client.pipeline(transaction=False)
+        for channel, payload in items:
+            if streams:
+                await _run_stream_publish(client, channel, payload, pipe=pipe)
+            else:
+                pipe.publish(
+                    f"{settings.redis_key_prefix}sse:{channel}",
+                    json.dumps({**payload, _ORIGIN_KEY: _WORKER_ID}),
+                )
+        results = await pipe.execute()
+    except (ConnectionError, OSError):
+        logger.debug(
+            "Redis SSE publish failed due to connection error, resetting client"
+        )
+        _reset_redis_publish_client()
+        return []
+    except Exception:
+        logger.debug("Redis SSE batch publish failed (local dispatch still succeeds)")
+        return []
+    return [_decode_stream_id(r) for r in results] if streams else []
+
+
+# ────────────────────────────────────────────────────────────────
+#  Redis Streams replay buffer (optional, SSE_BUFFER_BACKEND=redis)
+# ────────────────────────────────────────────────────────────────
+
+_STREAM_ID_RE = re.compile(r"^(\d+)-(\d+)$")
+
+# Channels this process replays from Redis Streams, with their MAXLEN.
+_stream_channels: dict[str, int] = {}
+
+# Appends the event to the channel's stream only when some worker registered
+# the channel for replay, then publishes it with the assigned stream ID so
+# every worker emits the same Last-Event-ID. One round trip, like PUBLISH.
+_STREAM_PUBLISH_LUA = """
+local maxlen = redis.call('GET', KEYS[1])
+if not maxlen then
+    redis.call('PUBLISH', ARGV[1], ARGV[2])
+    return false
+end
+local fields = {'event', ARGV[3], 'data', ARGV[4]}
+if ARGV[6] ~= '' then
+    table.insert(fields, 'render')
+    table.insert(fields, ARGV[6])
+end
+local id = redis.call('XADD', KEYS[2], 'MAXLEN', '~', maxlen, '*', unpack(fields))
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+local message = cjson.decode(ARGV[2])
+message['id'] = id
+redis.call('PUBLISH', ARGV[1], cjson.encode(message))
+return id
+"""
+_stream_publish_script = None
+
+
+def _stream_id_key(event_id: str) -> tuple[int, int] | None:
+    """Parse a Redis Stream ID (``<ms>-<seq>``) into a sortable tuple."""
+    match = _STREAM_ID_RE.match(event_id)
+    return (int(match[1]), int(match[2])) if match else None
+
+
+def _stream_backend_enabled() -> bool:
+    from vibetuner.config import settings
+
+    return settings.sse.buffer_backend == "redis" and settings.redis_url is not None
+
+
+def _stream_keys(channel: str) -> tuple[str, str]:
+    """Redis keys holding a channel's replay MAXLEN and its stream."""
+    from vibetuner.config import settings
+
+    base = f"{settings.redis_key_prefix}sse-stream"
+    return f"{base}-maxlen:{channel}", f"{base}:{channel}"
+
+
+def _reset_redis_publish_client() -> None:
+    global _redis_publish_client, _stream_publish_script
+    from vibetuner.redis import reset_redis_client
+
+    _redis_publish_client = None
+    _stream_publish_script = None
+    reset_redis_client()
+
+
+async def _register_stream(channel: str, maxlen: int) -> None:
+    """Mark a channel for Redis Stream replay on every worker (best-effort)."""
+    _stream_channels[channel] = maxlen
+    try:
+        client = await _get_redis_publish_client()
+        if client is None:
+            return
+
+        from vibetuner.config import settings
+
+        maxlen_key, _ = _stream_keys(channel)
+        await client.set(maxlen_key, maxlen, ex=settings.sse.stream_ttl)
+    except (ConnectionError, OSError):
+        logger.debug("Redis SSE stream registration failed, resetting client")
+        _reset_redis_publish_client()
+    except Exception:
+        logger.debug("Redis SSE stream registration failed for {}", channel)
+
+
+async def _publish_to_stream(channel: str, payload: dict[str, Any]) -> str | None:
+    """Publish a payload, appending it to the channel's stream if registered.
+
+    Returns the global stream ID, or None when the channel is not replayed
+    from a stream or Redis is unavailable.
+    """
+    try:
+        client = await _get_redis_publish_client()
+        if client is None:
+            return None
+        event_id = await _run_stream_publish(client, channel, payload)
+    except (ConnectionError, OSError):
+        logger.debug(
+            "Redis SSE publish failed due to connection error, resetting client"
+        )
+        _reset_redis_publish_client()
+        return None
+    except Exception:
+        logger.debug("Redis SSE publish failed (local dispatch still succeeds)")
+        return None
+    return _decode_stream_id(event_id)
+
+
+async def _run_stream_publish(client, channel: str, payload: dict[str, Any], pipe=None):
+    """Run the stream publish script, queueing it on ``pipe`` when given."""
+    global _stream_publish_script
+    from vibetuner.config import settings
+
+    if _stream_publish_script is None:
+        _stream_publish_script = client.register_script(_STREAM_PUBLISH_LUA)
+    return await _stream_publish_script(
+        keys=list(_stream_keys(channel)),
+        args=[
+            f"{settings.redis_key_prefix}sse:{channel}",
+            json.dumps({**payload, _ORIGIN_KEY: _WORKER_ID}),
+            payload["event"],
+            payload.get("data", ""),
+            settings.sse.stream_ttl,
+            _render_field(payload),
+        ],
+        client=pipe,
+    )
+
+
+def _render_field(payload: dict[str, Any]) -> str:
+    """Stream entry field holding a per-subscriber payload's template and ctx."""
+    if "template" not in payload:
+        return ""
+    return json.dumps({"template": payload["template"], "ctx": payload.get("ctx")})
+
+
+def _decode_stream_id(event_id: Any) -> str | None:
+    if isinstance(event_id, bytes):
+        event_id = event_id.decode()
+    return event_id or None
+
+
+async def _read_stream_after(
+    channel: str, last_id: str, count: int
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return up to ``count`` stream entries after ``last_id`` (best-effort)."""
+    try:
+        client = await _get_redis_publish_client()
+        if client is None:
+            return []
+        _, stream_key = _stream_keys(channel)
+        entries = await client.xrange(stream_key, min=f"({last_id}", count=count)
+    except (ConnectionError, OSError):
+        logger.debug("Redis SSE stream replay failed, resetting client")
+        _reset_redis_publish_client()
+        return []
+    except Exception:
+        logger.debug("Redis SSE stream replay failed for {}", channel)
+        return []
+
+    replay: list[tuple[str, dict[str, Any]]] = []
+    for entry_id, fields in entries:
+        decoded = {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in fields.items()
+        }
+        payload: dict[str, Any] = {
+            "event": decoded.get("event", "message"),
+            "data": decoded.get("data", ""),
+        }
+        if decoded.get("render"):
+            render = json.loads(decoded["render"])
+            payload["template"] = render["template"]
+            payload["ctx"] = render.get("ctx") or {}
+        replay.append(
+            (entry_id.decode() if isinstance(entry_id, bytes) else entry_id, payload)
+        )
+    return replay
+
+
 # ────────────────────────────────────────────────────────────────
 #  Public API: broadcast()
 # ────────────────────────────────────────────────────────────────
 
+# Latest pending broadcast() arguments per (channel, event) while a
+# coalescing window is open, and the tasks flushing closed windows.
+_coalesced: dict[tuple[str, str], dict[str, Any]] = {}
+_coalesce_tasks: set[asyncio.Task] = set()
+
+
+def _coalesce(channel: str, event: str, kwargs: dict[str, Any], delay: float) -> None:
+    """Hold a broadcast until its window closes, keeping only the latest."""
+    key = (channel, event)
+    window_open = key in _coalesced
+    _coalesced[key] = kwargs
+    if not window_open:
+        asyncio.get_running_loop().call_later(delay, _flush_coalesced, key)
+
+
+def _flush_coalesced(key: tuple[str, str]) -> None:
+    kwargs = _coalesced.pop(key, None)
+    if kwargs is None:
+        return
+    task = asyncio.get_running_loop().create_task(_broadcast_coalesced(key, kwargs))
+    _coalesce_tasks.add(task)
+    task.add_done_callback(_coalesce_tasks.discard)
+
+
+async def _broadcast_coalesced(key: tuple[str, str], kwargs: dict[str, Any]) -> None:
+    channel, event = key
+    try:
+        await broadcast(channel, event, **kwargs)
+    except Exception:
+        logger.exception("Coalesced SSE broadcast to {} failed", channel)
+
+
+def _check_template_args(
+    template: str | None, request: Request | None, per_subscriber: bool
+) -> None:
+    if per_subscriber:
+        if template is None:
+            raise ValueError("per_subscriber broadcasts require a template")
+    elif template is not None and request is None:
+        raise ValueError("request is required when broadcasting with a template")
+
 
 async def broadcast(
     channel: str,
@@ -354,18 +1333,39 @@ async def broadcast(
     template: str | None = None,
     request: Request | None = None,
     ctx: dict[str, Any] | None = None,
+    coalesce_ms: int | None = None,
+    per_subscriber: bool = False,
 ) -> None:
     """Broadcast an SSE event to all subscribers of a channel.
 
     Can broadcast raw data or render a Jinja2 template first.
 
+    With ``coalesce_ms``, the first call for a channel and event name opens a
+    window of that many milliseconds; when it closes, only the latest call's
+    event is rendered and sent, and later calls open a new window. Use it
+    for bursty producers such as progress updates, where clients only need
+    the most recent state.
+
+    With ``per_subscriber=True`` the template is not rendered here: the
+    event carries ``template`` and ``ctx``, and each subscriber renders it
+    with its own request (language, user, context providers) when the event
+    is sent. Renderings are shared by subscribers with the same language and
+    endpoint ``vary`` key, so a channel with thousands of clients in three
+    languages renders three times per worker. ``ctx`` must be
+    JSON-serializable when Redis is configured.
+
     Args:
         channel: Channel name to broadcast to.
         event: SSE event name (default: "message").
         data: Raw string data to send. Ignored if template is set.
         template: Optional Jinja2 template path to render as the data payload.
-        request: Required when using template rendering.
+        request: Required when using template rendering, unless
+            ``per_subscriber`` is set.
         ctx: Template context dict (used with template).
+        coalesce_ms: Merge broadcasts with the same channel and event name
+            within this window, sending only the latest.
+        per_subscriber: Render the template once per distinct subscriber
+            variant instead of once with ``request``.
 
     Example:
         # Raw data
@@ -379,89 +1379,285 @@ async def broadcast(
             request=request,
             ctx={"post": post},
         )
+
+        # At most one update every 250ms, whatever the producer's rate
+        await broadcast(
+            f"job:{job.id}", "progress", data=f"{pct}%", coalesce_ms=250
+        )
+
+        # Localized, per-role markup rendered by each subscriber
+        await broadcast(
+            "orders",
+            "order-updated",
+            template="partials/order_row.html.jinja",
+            ctx={"order": order.model_dump(mode="json")},
+            per_subscriber=True,
+        )
     """
     _validate_channel_name(channel)
+    _check_template_args(template, request, per_subscriber)
+
+    if coalesce_ms:
+        _coalesce(
+            channel,
+            event,
+            {
+                "data": data,
+                "template": template,
+                "request": request,
+                "ctx": ctx,
+                "per_subscriber": per_subscriber,
+            },
+            coalesce_ms / 1000,
+        )
+        return
 
-    if template is not None:
-        if request is None:
-            raise ValueError("request is required when broadcasting with a template")
-        data = render_template_string(template, request, ctx)
+    payload: dict[str, Any]
+    if per_subscriber:
+        payload = {"event": event, "template": template, "ctx": ctx or {}}
+    else:
+        # _check_template_args made sure a template comes with a request.
+        if template is not None and request is not None:
+            data = render_template_string(template, request, ctx)
+        payload = {"event": event, "data": data}
+    if _stream_backend_enabled():
+        # The stream assigns the event ID, so publish first and dispatch
+        # locally with the same ID every other worker will use.
+        event_id = await _publish_to_stream(channel, payload)
+        _dispatch_local(channel, {**payload, "id": event_id} if event_id else payload)
+        return
 
-    payload = {"event": event, "data": data}
     _dispatch_local(channel, payload)
     await _publish_to_redis(channel, payload)
 
 
+async def broadcast_many(
+    events: Iterable[tuple[str, str, str]],
+    *,
+    template: str | None = None,
+    request: Request | None = None,
+    ctx: dict[str, Any] | None = None,
+    per_subscriber: bool = False,
+) -> None:
+    """Broadcast several events at once, with a single Redis round trip.
+
+    Every ``(channel, event, data)`` is dispatched to local subscribers, then
+    all of them are published to Redis in one pipelined call instead of one
+    ``PUBLISH`` round trip per channel.
+
+    Args:
+        events: ``(channel, event, data)`` tuples.
+        template: Optional Jinja2 template rendered once and sent as the data
+            of every event (the tuples' data is then ignored).
+        request: Required when using template rendering, unless
+            ``per_subscriber`` is set.
+        ctx: Template context dict (used with template).
+        per_subscriber: Let each subscriber render the template, as with
+            ``broadcast(..., per_subscriber=True)``.
+
+    Example:
+        await broadcast_many(
+            [(f"user:{member.id}", "team-updated", "") for member in team.members],
+            template="partials/team_badge.html.jinja",
+            request=request,
+            ctx={"team": team},
+        )
+    """
+    events = list(events)
+    for channel, _, _ in events:
+        _validate_channel_name(channel)
+
+    _check_template_args(template, request, per_subscriber)
+    shared: dict[str, Any] | None = None
+    if per_subscriber:
+        shared = {"template": template, "ctx": ctx or {}}
+    elif template is not None and request is not None:
+        shared = {"data": render_template_string(template, request, ctx)}
+
+    items = [
+        (channel, {"event": event, **(shared or {"data": data})})
+        for channel, event, data in events
+    ]
+    if not items:
+        return
+
+    if _stream_backend_enabled():
+        event_ids = await _publish_many(items, streams=True)
+        for (channel, payload), event_id in zip_longest(items, event_ids):
+            _dispatch_local(
+                channel, {**payload, "id": event_id} if event_id else payload
+            )
+        return
+
+    for channel, payload in items:
+        _dispatch_local(channel, payload)
+    await _publish_many(items)
+
+
 # ────────────────────────────────────────────────────────────────
 #  Public API: sse_endpoint() decorator
 # ────────────────────────────────────────────────────────────────
 
 
 async def _stream_from_generator(
-    result: AsyncGenerator, template: str | None, request: Request
+    result: AsyncGenerator,
+    template: str | None,
+    request: Request,
+    lease: _ConnectionLease | None = None,
 ) -> AsyncGenerator[bytes, None]:
     """Yield SSE wire-format bytes from a user-provided async generator."""
-    async for event in result:
-        if isinstance(event, dict):
-            data = event.get("data", "")
-            if template and not data:
-                data = render_template_string(template, request, event.get("ctx"))
-                event = {**event, "data": data}
-            yield _format_event(event)
-        else:
-            yield _format_event({"data": str(event)})
+    try:
+        async for event in result:
+            if isinstance(event, dict):
+                data = event.get("data", "")
+                if template and not data:
+                    data = render_template_string(template, request, event.get("ctx"))
+                    event = {**event, "data": data}
+                yield _format_event(event)
+            else:
+                yield _format_event({"data": str(event)})
+    finally:
+        if lease is not None:
+            lease.release()
+
+
+def _resolve_frame(
+    frame: bytes | _DeferredFrame, request: Request | None, vary: Any
+) -> bytes:
+    """Bytes to send for a queued frame, rendering deferred ones for ``request``."""
+    if isinstance(frame, _DeferredFrame):
+        return frame.render(request, vary) if request is not None else b""
+    return frame
+
+
+def _replay_frames(
+    replay: list[tuple[str, dict[str, Any]]], request: Request | None, vary: Any
+) -> list[bytes]:
+    """Encode replayed ``(event_id, payload)`` pairs for one subscriber."""
+    frames = []
+    for event_id, payload in replay:
+        frame = _resolve_frame(_encode_payload(payload, event_id), request, vary)
+        if frame:
+            _stats.events_out += 1
+            _stats.bytes_out += len(frame)
+            frames.append(frame)
+    return frames
+
+
+async def _replay_stream(
+    subscriber: _Subscriber, last_id: str, request: Request | None, vary: Any
+) -> list[bytes]:
+    """Frames after ``last_id`` from the channel's Redis Stream.
+
+    Runs after subscribing, so nothing published meanwhile is lost; live
+    frames the replay already covered are skipped by the subscriber.
+    """
+    ch = subscriber.channel
+    replay = await _read_stream_after(ch, last_id, _stream_channels[ch])
+    if replay:
+        subscriber.replayed_through = _stream_id_key(replay[-1][0])
+    return _replay_frames(replay, request, vary)
 
 
 async def _stream_from_channel(
-    ch: str, *, last_event_id: int | None = None
+    ch: str,
+    *,
+    request: Request | None = None,
+    vary: Any = None,
+    last_event_id: int | str | None = None,
+    queue_size: int | None = None,
+    slow_consumer_policy: SlowConsumerPolicy | None = None,
+    lease: _ConnectionLease | None = None,
 ) -> AsyncGenerator[bytes, None]:
     """Subscribe to a channel and yield SSE wire-format bytes with keepalive.
 
     If last_event_id is set and the channel has a buffer, replays missed
-    events before switching to live streaming.
+    events before switching to live streaming: integer IDs from the
+    in-memory buffer, stream IDs from the channel's Redis Stream. The stream
+    ends when the ``disconnect`` slow-consumer policy closes the subscriber.
+
+    Per-subscriber template events are rendered for ``request``, sharing
+    renderings with other subscribers of the same language and ``vary`` key.
     """
     # Replay buffered events if resuming
-    if last_event_id is not None and ch in _channel_buffers:
-        for eid, payload in _channel_buffers[ch].events_after(last_event_id):
-            yield _format_event(payload, event_id=str(eid))
-
-    queue = _subscribe(ch)
+    if isinstance(last_event_id, int) and ch in _channel_buffers:
+        buffered = _channel_buffers[ch].events_after(last_event_id)
+        for frame in _replay_frames(
+            [(str(eid), payload) for eid, payload in buffered], request, vary
+        ):
+            yield frame
+
+    subscriber = _subscribe(ch, maxsize=queue_size, policy=slow_consumer_policy)
     try:
+        if isinstance(last_event_id, str) and ch in _stream_channels:
+            for frame in await _replay_stream(subscriber, last_event_id, request, vary):
+                yield frame
+
         while True:
-            try:
-                event_id, payload = await asyncio.wait_for(queue.get(), timeout=30)
-                yield _format_event(
-                    payload,
-                    event_id=str(event_id) if event_id is not None else None,
-                )
-            except asyncio.TimeoutError:
-                yield _format_event({"comment": "keepalive"})
+            # Frames arrive pre-encoded (or deferred, for per-subscriber
+            # templates) from _dispatch_local; keepalives are queued by the
+            # shared ticker when the connection is idle.
+            queued = await subscriber.get()
+            if queued is None:
+                logger.debug("SSE subscriber on {} fell behind, disconnecting", ch)
+                return
+            frame = _resolve_frame(queued, request, vary)
+            if not frame:
+                continue
+            _stats.events_out += 1
+            _stats.bytes_out += len(frame)
+            yield frame
     except asyncio.CancelledError:
         pass
     finally:
-        _unsubscribe(ch, queue)
+        _unsubscribe(ch, subscriber)
+        if lease is not None:
+            lease.release()
 
 
 async def _resolve_channel_or_generator(
     func: Callable, kwargs: dict, static_channel: str | None
-) -> tuple[str | None, AsyncGenerator | None]:
-    """Call the decorated function and determine if it returns a channel name or generator."""
+) -> str | AsyncGenerator:
+    """Call the decorated function and determine if it returns a channel name or generator.
+
+    Returns a validated channel name or a generator.
+    """
     result = func(**kwargs)
     if asyncio.iscoroutine(result):
         result = await result
 
-    if isinstance(result, str):
-        return result, None
     if hasattr(result, "__aiter__"):
-        return None, result
-    return static_channel, None
+        return result
+
+    ch = result if isinstance(result, str) else static_channel
+    if ch is None:
+        raise ValueError(
+            "sse_endpoint requires either a 'channel' argument, "
+            "the decorated function to return a channel name, "
+            "or the function to be an async generator."
+        )
+    _validate_channel_name(ch)
+    return ch
+
+
+async def _ensure_replay_buffer(channel: str, buffer_size: int | None) -> None:
+    """Make sure a connecting client's channel keeps events for replay."""
+    if buffer_size is None:
+        return
+    if _stream_backend_enabled():
+        # Refreshes the registration's TTL on every connection
+        await _register_stream(channel, buffer_size)
+    elif channel not in _channel_buffers:
+        # Register buffer for dynamic channels on first connection
+        _channel_buffers[channel] = _EventBuffer(maxlen=buffer_size)
+        _request_subscription_sync(channel)
 
 
-def _parse_last_event_id(request: Request) -> int | None:
+def _parse_last_event_id(request: Request) -> int | str | None:
     """Extract and parse the Last-Event-ID header from a request.
 
-    Returns the integer event ID, or None if the header is absent or not a
-    valid integer.
+    Returns the integer event ID of an in-memory buffer, the ``<ms>-<seq>``
+    ID of a Redis Stream, or None if the header is absent or malformed.
     """
     raw = request.headers.get("last-event-id")
     if raw is not None:
@@ -469,6 +1665,9 @@ def _parse_last_event_id(request: Request) -> int | None:
             return int(raw)
         except (ValueError, TypeError):
             pass
+        raw = raw.strip()
+        if _stream_id_key(raw) is not None:
+            return raw
     return None
 
 
@@ -480,6 +1679,11 @@ def sse_endpoint(
     router: APIRouter | None = None,
     name: str | None = None,
     buffer_size: int | None = None,
+    queue_size: int | None = None,
+    slow_consumer_policy: SlowConsumerPolicy | None = None,
+    max_connections_per_user: int | None = None,
+    max_connections_per_channel: int | None = None,
+    vary: Callable[[Request], Hashable] | None = None,
 ) -> Callable:
     """Decorator that creates an SSE endpoint with automatic connection management.
 
@@ -500,7 +1704,29 @@ def sse_endpoint(
         name: Optional route name.
         buffer_size: If set, enables a ring buffer of this size for the channel.
             When a client reconnects with a ``Last-Event-ID`` header, missed
-            events are replayed before switching to live streaming.
+            events are replayed before switching to live streaming. With
+            ``SSE_BUFFER_BACKEND=redis`` the buffer is a Redis Stream capped
+            at about this many entries, shared by all workers.
+        queue_size: Maximum pending events per connected client (0 means
+            unbounded). Defaults to ``SSE_QUEUE_SIZE``.
+        slow_consumer_policy: What to do when a client's queue is full:
+            ``"drop_oldest"``, ``"coalesce"`` (latest event per event name)
+            or ``"disconnect"`` (the client reconnects and resumes via
+            ``Last-Event-ID``; pair it with ``buffer_size``). Defaults to
+            ``SSE_SLOW_CONSUMER_POLICY``.
+        max_connections_per_user: Streams one authenticated user may hold
+            open on this worker (0 means unlimited). Defaults to
+            ``SSE_MAX_CONNECTIONS_PER_USER``.
+        max_connections_per_channel: Streams one channel may have on this
+            worker (0 means unlimited). Defaults to
+            ``SSE_MAX_CONNECTIONS_PER_CHANNEL``. ``SSE_MAX_CONNECTIONS`` caps
+            all streams on the worker; over-limit requests get
+            ``SSE_OVER_LIMIT_RESPONSE``.
+        vary: Called once per connection with its request. Subscribers
+            with the same language and vary key share each rendering of a
+            ``broadcast(..., per_subscriber=True)`` event. Return whatever the
+            template output depends on besides language (a role, a timezone,
+            a user ID).
 
     Returns:
         Decorator that wraps a function into an SSE endpoint.
@@ -527,8 +1753,13 @@ def sse_endpoint(
     """
 
     def decorator(func: Callable) -> Callable:
-        # Register buffer for static channels at decoration time
-        if buffer_size is not None and channel is not None:
+        # Register buffer for static channels at decoration time (stream-backed
+        # channels register in Redis on first connection instead)
+        if (
+            buffer_size is not None
+            and channel is not None
+            and not _stream_backend_enabled()
+        ):
             _channel_buffers[channel] = _EventBuffer(maxlen=buffer_size)
 
         @wraps(func)
@@ -538,31 +1769,45 @@ def sse_endpoint(
             # for contexts that serve SSE without it. It no-ops if already running.
             await start_redis_listener()
 
-            ch, gen = await _resolve_channel_or_generator(func, kwargs, channel)
-
-            if gen is not None:
-                return EventSourceResponse(
-                    _stream_from_generator(gen, template, request),
-                    headers=_SSE_HEADERS,
-                )
-
-            if ch is None:
-                raise ValueError(
-                    "sse_endpoint requires either a 'channel' argument, "
-                    "the decorated function to return a channel name, "
-                    "or the function to be an async generator."
-                )
-
-            _validate_channel_name(ch)
-
-            # Register buffer for dynamic channels on first connection
-            if buffer_size is not None and ch not in _channel_buffers:
-                _channel_buffers[ch] = _EventBuffer(maxlen=buffer_size)
+            source = await _resolve_channel_or_generator(func, kwargs, channel)
 
-            return EventSourceResponse(
-                _stream_from_channel(ch, last_event_id=_parse_last_event_id(request)),
-                headers=_SSE_HEADERS,
+            user = _connection_user(request)
+            limited_channel = source if isinstance(source, str) else None
+            limit = _exceeded_limit(
+                user,
+                limited_channel,
+                max_connections_per_user,
+                max_connections_per_channel,
             )
+            if limit is not None:
+                if not isinstance(source, str):
+                    await source.aclose()
+                return _over_limit_response(limit)
+            # Admit before any await so concurrent connects cannot all pass
+            # the check above; give the slot back if setup then fails.
+            lease = _admit(user, limited_channel)
+
+            try:
+                if isinstance(source, str):
+                    await _ensure_replay_buffer(source, buffer_size)
+                    stream = _stream_from_channel(
+                        source,
+                        request=request,
+                        vary=vary(request) if vary is not None else None,
+                        last_event_id=_parse_last_event_id(request),
+                        queue_size=queue_size,
+                        slow_consumer_policy=slow_consumer_policy,
+                        lease=lease,
+                    )
+                else:
+                    stream = _stream_from_generator(source, template, request, lease)
+            except BaseException:
+                lease.release()
+                raise
+            # Release the connection even if the response ends before the
+            # stream is first iterated (its finally block would never run).
+            weakref.finalize(stream, lease.release)
+            return EventSourceResponse(stream, headers=_SSE_HEADERS)
 
         if router is not None:
             if router.prefix and path.startswith(router.prefix):
@@ -0,0 +1,372 @@
+# ABOUTME: Offline SSE fan-out benchmark: N in-process streams driven by broadcast().
+# ABOUTME: Reports delivery latency percentiles, CPU per event, and memory per connection.
+"""SSE fan-out benchmark.
+
+Builds a FastAPI app with one ``sse_endpoint`` channel, opens ``--streams``
+concurrent connections by calling the ASGI app directly (no sockets, no
+server), then calls ``broadcast()`` ``--rate`` times per second for
+``--duration`` seconds. Every event carries its send timestamp, so each
+stream records how long the frame took to reach the ASGI ``send()``.
+
+Redis modes (``--redis``):
+
+- ``off`` (default): local-only dispatch, as with no ``REDIS_URL``.
+- ``standin``: an in-process pub/sub stand-in replaces Redis, so publishes,
+  the listener and subscription syncing run without a server.
+- any ``redis://`` URL: a real server.
+
+With ``--remote`` (Redis modes only) events are published as if from another
+worker, so they reach the streams through the pub/sub listener.
+
+Run from ``vibetuner-py``::
+
+    uv run python -m tests.benchmarks.sse_fanout --streams 2000 --rate 50
+
+``--max-p99-ms`` and ``--max-cpu-us`` turn the run into a regression check
+that exits non-zero when either budget is exceeded.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+from fastapi import APIRouter, FastAPI, Request
+
+
+CHANNEL = "bench"
+EVENT = "tick"
+
+
+@dataclass
+class BenchResult:
+    streams: int
+    events: int
+    delivered: int
+    expected: int
+    latency_p50_ms: float
+    latency_p90_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    cpu_us_per_event: float
+    cpu_us_per_frame: float
+    memory_bytes_per_connection: float
+
+
+# ────────────────────────────────────────────────────────────────
+#  In-process Redis stand-in
+# ────────────────────────────────────────────────────────────────
+
+
+class _StandinPubSub:
+    def __init__(self, bus: "_StandinRedis") -> None:
+        self._bus = bus
+        self._messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._bus.subscribers[channel].add(self)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self._bus.subscribers[channel].discard(self)
+
+    async def listen(self):
+        while True:
+            yield await self._messages.get()
+
+    async def aclose(self) -> None:
+        for subscribers in self._bus.subscribers.values():
+            subscribers.discard(self)
+
+
+class _StandinPipeline:
+    def __init__(self, bus: "_StandinRedis") -> None:
+        self._bus = bus
+        self._queued: list[tuple[str, str]] = []
+
+    def publish(self, channel: str, data: str) -> "_StandinPipeline":
+        self._queued.append((channel, data))
+        return self
+
+    async def execute(self) -> list[int]:
+        return [
+            await self._bus.publish(channel, data) for channel, data in self._queued
+        ]
+
+
+class _StandinRedis:
+    """Just enough of redis.asyncio.Redis for vibetuner.sse's pub/sub bridge."""
+
+    def __init__(self) -> None:
+        self.subscribers: dict[str, set[_StandinPubSub]] = defaultdict(set)
+
+    async def publish(self, channel: str, data: str) -> int:
+        message = {
+            "type": "message",
+            "pattern": None,
+            "channel": channel.encode(),
+            "data": data.encode(),
+        }
+        for pubsub in self.subscribers[channel]:
+            pubsub._messages.put_nowait(message)
+        return len(self.subscribers[channel])
+
+    def pubsub(self) -> _StandinPubSub:
+        return _StandinPubSub(self)
+
+    def pipeline(self, transaction: bool = True) -> _StandinPipeline:
+        return _StandinPipeline(self)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _configure_redis(mode: str) -> _StandinRedis | None:
+    import vibetuner.redis
+    from vibetuner.config import settings
+
+    if mode == "off":
+        settings.redis_url = None
+        return None
+    if mode != "standin":
+        settings.redis_url = mode
+        return None
+
+    standin = _StandinRedis()
+    settings.redis_url = "redis://standin"
+
+    async def get_client():
+        return standin
+
+    vibetuner.redis.create_redis_client = lambda: standin
+    vibetuner.redis.get_redis_client = get_client
+    return standin
+
+
+# ────────────────────────────────────────────────────────────────
+#  In-process streams
+# ────────────────────────────────────────────────────────────────
+
+
+def _build_app() -> FastAPI:
+    from vibetuner.sse import sse_endpoint
+
+    router = APIRouter()
+
+    @sse_endpoint("/bench/events", channel=CHANNEL, router=router)
+    async def bench_events(request: Request):
+        pass
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+class _Stream:
+    """One SSE client driving the ASGI app directly and timing each frame."""
+
+    def __init__(self, app: FastAPI, index: int, latencies: list[int]) -> None:
+        self._app = app
+        self._index = index
+        self._latencies = latencies
+        self._requested = False
+        self.disconnected = asyncio.Event()
+        self.received = 0
+
+    async def _receive(self) -> dict:
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message: dict) -> None:
+        if message["type"] != "http.response.body":
+            return
+        now = time.perf_counter_ns()
+        for line in message.get("body", b"").splitlines():
+            if line.startswith(b"data: "):
+                self._latencies.append(now - int(line[6:]))
+                self.received += 1
+
+    async def run(self) -> None:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/bench/events",
+            "raw_path": b"/bench/events",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"bench"), (b"accept", b"text/event-stream")],
+            "client": ("127.0.0.1", 10000 + self._index),
+            "server": ("bench", 80),
+        }
+        await self._app(scope, self._receive, self._send)
+
+
+async def _wait_until(predicate, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+def _percentile(sorted_values: list[int], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index] / 1e6
+
+
+async def run_benchmark(
+    *,
+    streams: int = 100,
+    rate: float = 20,
+    duration: float = 2,
+    redis: str = "off",
+    remote: bool = False,
+) -> BenchResult:
+    """Open ``streams`` connections, broadcast for ``duration`` seconds, measure."""
+    from vibetuner import sse
+
+    standin = _configure_redis(redis)
+    if remote and redis == "off":
+        raise ValueError("--remote needs a Redis mode (standin or a URL)")
+
+    app = _build_app()
+    latencies: list[int] = []
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    clients = [_Stream(app, i, latencies) for i in range(streams)]
+    tasks = [asyncio.create_task(c.run()) for c in clients]
+    subscribed = await _wait_until(
+        lambda: len(sse._channels.get(CHANNEL, ())) == streams, timeout=60
+    )
+    memory = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    if not subscribed:
+        raise RuntimeError("streams did not subscribe in time")
+
+    from vibetuner.config import settings
+
+    sse_prefix = f"{settings.redis_key_prefix}sse:"
+
+    async def publish(data: str) -> None:
+        if not remote:
+            await sse.broadcast(CHANNEL, EVENT, data=data)
+            return
+        message = json.dumps({"event": EVENT, "data": data, "_origin": "bench"})
+        if standin is not None:
+            await standin.publish(f"{sse_prefix}{CHANNEL}", message)
+        else:
+            client = await sse._get_redis_publish_client()
+            await client.publish(f"{sse_prefix}{CHANNEL}", message)
+
+    if redis != "off":
+        await sse.start_redis_listener()
+        # Let the listener subscribe to the channel before publishing.
+        await asyncio.sleep(0.2)
+
+    events = max(1, int(rate * duration))
+    expected = events * streams
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for i in range(events):
+        delay = wall_start + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await publish(str(time.perf_counter_ns()))
+    await _wait_until(lambda: sum(c.received for c in clients) >= expected, timeout=30)
+    cpu = time.process_time() - cpu_start
+
+    for client in clients:
+        client.disconnected.set()
+    await asyncio.wait(tasks, timeout=10)
+    await sse.stop_redis_listener()
+
+    delivered = sum(c.received for c in clients)
+    ordered = sorted(latencies)
+    return BenchResult(
+        streams=streams,
+        events=events,
+        delivered=delivered,
+        expected=expected,
+        latency_p50_ms=round(_percentile(ordered, 50), 3),
+        latency_p90_ms=round(_percentile(ordered, 90), 3),
+        latency_p99_ms=round(_percentile(ordered, 99), 3),
+        latency_max_ms=round(ordered[-1] / 1e6 if ordered else 0.0, 3),
+        cpu_us_per_event=round(cpu / events * 1e6, 1),
+        cpu_us_per_frame=round(cpu / max(delivered, 1) * 1e6, 2),
+        memory_bytes_per_connection=round(memory / streams),
+    )
+
+
+def _print_result(result: BenchResult) -> None:
+    print(f"streams            {result.streams}")
+    print(f"events broadcast   {result.events}")
+    print(f"frames delivered   {result.delivered}/{result.expected}")
+    print(
+        "latency ms         "
+        f"p50 {result.latency_p50_ms}  p90 {result.latency_p90_ms}  "
+        f"p99 {result.latency_p99_ms}  max {result.latency_max_ms}"
+    )
+    print(
+        f"cpu                {result.cpu_us_per_event} us/event, "
+        f"{result.cpu_us_per_frame} us/frame"
+    )
+    print(f"memory             {result.memory_bytes_per_connection} B/connection")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--streams", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=20, help="broadcasts/second")
+    parser.add_argument("--duration", type=float, default=5, help="seconds")
+    parser.add_argument("--redis", default="off", help="off, standin or a URL")
+    parser.add_argument(
+        "--remote", action="store_true", help="publish as another worker"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    parser.add_argument("--max-p99-ms", type=float, default=None)
+    parser.add_argument("--max-cpu-us", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(
+        run_benchmark(
+            streams=args.streams,
+            rate=args.rate,
+            duration=args.duration,
+            redis=args.redis,
+            remote=args.remote,
+        )
+    )
+    if args.json:
+        print(json.dumps(asdict(result)))
+    else:
+        _print_result(result)
+
+    failures = []
+    if args.max_p99_ms is not None and result.latency_p99_ms > args.max_p99_ms:
+        failures.append(f"p99 {result.latency_p99_ms} ms > {args.max_p99_ms} ms")
+    if args.max_cpu_us is not None and result.cpu_us_per_event > args.max_cpu_us:
+        failures.append(
+            f"cpu {result.cpu_us_per_event} us/event > {args.max_cpu_us} us"
+        )
+    if result.delivered < result.expected:
+        failures.append(f"only {result.delivered}/{result.expected} frames delivered")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# ABOUTME: Smoke test keeping the SSE fan-out benchmark runnable.
+# ABOUTME: Runs a tiny benchmark in each Redis mode and checks every frame arrives.
+# ruff: noqa: S101
+
+import pytest
+
+from tests.benchmarks.sse_fanout import run_benchmark
+
+
+@pytest.fixture(autouse=True)
+def _restore_redis(monkeypatch):
+    # run_benchmark() reconfigures Redis globally; monkeypatch puts it back.
+    import vibetuner.redis
+
+    monkeypatch.setattr("vibetuner.config.settings.redis_url", None)
+    monkeypatch.setattr(
+        vibetuner.redis, "create_redis_client", vibetuner.redis.create_redis_client
+    )
+    monkeypatch.setattr(
+        vibetuner.redis, "get_redis_client", vibetuner.redis.get_redis_client
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("redis", "remote"), [("off", False), ("standin", False), ("standin", True)]
+)
+async def test_benchmark_delivers_every_frame(redis, remote):
+    result = await run_benchmark(
+        streams=20, rate=50, duration=0.2, redis=redis, remote=remote
+    )
+    assert result.delivered == result.expected == 20 * 10
+    assert 0 < result.latency_p50_ms <= result.latency_p99_ms
+    assert result.memory_bytes_per_connection > 0
@@ -0,0 +1,129 @@
+# ABOUTME: Tests for per-file asset fingerprints, static_url(), and the fingerprinted mount.
+# ABOUTME: Covers manifest building, lazy hashing, and stale-fingerprint handling.
+# ruff: noqa: S101
+
+import gzip
+import json
+import threading
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+from vibetuner.asset_manifest import (
+    AssetManifest,
+    build_manifest,
+    hash_file,
+    static_url,
+    write_manifest,
+)
+from vibetuner.frontend.staticfiles import (
+    IMMUTABLE_CACHE_CONTROL,
+    FingerprintedStaticFiles,
+)
+
+
+@pytest.fixture
+def statics(tmp_path):
+    css = tmp_path / "css"
+    js = tmp_path / "js"
+    css.mkdir()
+    js.mkdir()
+    (css / "bundle.css").write_text("body{}")
+    (css / "bundle.css.gz").write_bytes(gzip.compress(b"body{}"))
+    (css / ".gitkeep").write_text("")
+    (js / "bundle.js").write_text("console.log(1)")
+    return tmp_path
+
+
+def test_build_manifest_hashes_each_file(statics):
+    manifest = build_manifest({"css": statics / "css", "js": statics / "js"})
+    assert manifest == {
+        "css/bundle.css": hash_file(statics / "css" / "bundle.css"),
+        "js/bundle.js": hash_file(statics / "js" / "bundle.js"),
+    }
+
+
+def test_hash_only_changes_with_content(statics):
+    before = build_manifest({"css": statics / "css", "js": statics / "js"})
+    (statics / "js" / "bundle.js").write_text("console.log(2)")
+    after = build_manifest({"css": statics / "css", "js": statics / "js"})
+    assert after["css/bundle.css"] == before["css/bundle.css"]
+    assert after["js/bundle.js"] != before["js/bundle.js"]
+
+
+def test_manifest_file_is_preferred(statics):
+    manifest_path = statics / "asset-manifest.json"
+    write_manifest(manifest_path, {"css/bundle.css": "fromfile"})
+    manifest = AssetManifest({"css": statics / "css"}, manifest_path)
+    assert manifest.url("css/bundle.css") == "/static/h/css/fromfile/bundle.css"
+    assert json.loads(manifest_path.read_text()) == {"css/bundle.css": "fromfile"}
+
+
+def test_missing_manifest_hashes_on_first_use(statics):
+    manifest = AssetManifest({"css": statics / "css"}, statics / "missing.json")
+    file_hash = hash_file(statics / "css" / "bundle.css")
+    assert manifest.url("css/bundle.css") == f"/static/h/css/{file_hash}/bundle.css"
+    assert manifest.url("css/nope.css") is None
+    assert manifest.url("css/../js/bundle.js") is None
+
+
+def test_static_url_falls_back_in_debug(monkeypatch):
+    monkeypatch.setattr("vibetuner.config.settings.debug", True)
+    from vibetuner.config import settings
+
+    assert static_url("css/bundle.css") == f"/static/v{settings.v_hash}/css/bundle.css"
+
+
+def test_static_url_uses_fingerprint(monkeypatch, statics):
+    monkeypatch.setattr("vibetuner.config.settings.debug", False)
+    manifest = AssetManifest({"css": statics / "css"})
+    monkeypatch.setattr("vibetuner.asset_manifest.get_asset_manifest", lambda: manifest)
+    file_hash = hash_file(statics / "css" / "bundle.css")
+    assert static_url("/css/bundle.css") == f"/static/h/css/{file_hash}/bundle.css"
+
+
+class TestFingerprintedStaticFiles:
+    def _client(self, statics) -> TestClient:
+        manifest = AssetManifest({"css": statics / "css"})
+        mount = FingerprintedStaticFiles(
+            directory=statics / "css", kind="css", manifest=manifest
+        )
+        return TestClient(Starlette(routes=[Mount("/static/h/css", app=mount)]))
+
+    def test_matching_fingerprint_is_immutable(self, statics):
+        file_hash = hash_file(statics / "css" / "bundle.css")
+        response = self._client(statics).get(f"/static/h/css/{file_hash}/bundle.css")
+        assert response.status_code == 200
+        assert response.text == "body{}"
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_stale_fingerprint_is_not_cached(self, statics):
+        response = self._client(statics).get("/static/h/css/deadbeef/bundle.css")
+        assert response.status_code == 200
+        assert response.text == "body{}"
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_missing_fingerprint_is_404(self, statics):
+        response = self._client(statics).get("/static/h/css/bundle.css")
+        assert response.status_code == 404
+
+    def test_lookups_run_off_the_loop_and_cache_misses(self, statics):
+        manifest = AssetManifest({"css": statics / "css"})
+        threads: list[str] = []
+        hash_for = manifest.hash_for
+
+        def recording_hash_for(asset):
+            threads.append(threading.current_thread().name)
+            return hash_for(asset)
+
+        manifest.hash_for = recording_hash_for
+        mount = FingerprintedStaticFiles(
+            directory=statics / "css", kind="css", manifest=manifest
+        )
+        client = TestClient(Starlette(routes=[Mount("/static/h/css", app=mount)]))
+        for _ in range(2):
+            response = client.get("/static/h/css/deadbeef/missing.css")
+            assert response.status_code == 404
+        assert len(threads) == 1
+        assert threads[0].startswith("AnyIO worker thread")
@@ -129,6 +129,7 @@ def _make_env() -> Environment:
         undefined=ChainableUndefined,
     )
     env.globals["url_for"] = _stub_url_for
+    env.globals["static_url"] = lambda asset: f"/static/{asset}"
     env.globals["DEBUG"] = False
     env.globals["BODY_CLASS"] = ""
     env.globals["SKIP_HEADER"] = True
@@ -176,6 +177,7 @@ def _render_meta(name: str, brand: BrandSettings) -> str:
         autoescape=False,  # noqa: S701 — output is JSON/XML, not HTML; matches production rendering
     )
     env.globals["url_for"] = _stub_url_for
+    env.globals["static_url"] = lambda asset: f"/static/{asset}"
     return env.get_template(name).render(
         project_name="TestApp", project_slug="test_app", brand=brand
     )
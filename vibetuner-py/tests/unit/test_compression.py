@@ -0,0 +1,222 @@
+# ABOUTME: Tests for response compression and precompressed static file serving.
+# ABOUTME: Covers Accept-Encoding negotiation, the ASGI middleware, and build-time siblings.
+# ruff: noqa: S101
+
+import gzip
+import os
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import (
+    FileResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+from vibetuner.compression import (
+    available_encodings,
+    compress,
+    negotiate_encoding,
+    precompress_directory,
+)
+from vibetuner.frontend.middleware import CompressionMiddleware
+from vibetuner.frontend.staticfiles import PrecompressedStaticFiles
+
+
+BIG_TEXT = "hello compression " * 200
+
+
+async def _big(request):
+    return PlainTextResponse(BIG_TEXT)
+
+
+async def _small(request):
+    return PlainTextResponse("tiny")
+
+
+async def _stream(request):
+    async def chunks():
+        for _ in range(3):
+            yield BIG_TEXT
+
+    return StreamingResponse(chunks(), media_type="text/html")
+
+
+async def _already_encoded(request):
+    return Response(
+        gzip.compress(BIG_TEXT.encode()),
+        media_type="text/plain",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+async def _binary(request):
+    return Response(b"\x00" * 4096, media_type="application/octet-stream")
+
+
+async def _etag(request):
+    return PlainTextResponse(BIG_TEXT, headers={"ETag": '"abc"'})
+
+
+def _client() -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/big", _big),
+            Route("/small", _small),
+            Route("/stream", _stream),
+            Route("/encoded", _already_encoded),
+            Route("/binary", _binary),
+            Route("/etag", _etag),
+        ]
+    )
+    return TestClient(CompressionMiddleware(app, minimum_size=500))
+
+
+class TestNegotiateEncoding:
+    def test_empty_header_means_identity(self):
+        assert negotiate_encoding("", ("zstd", "gzip")) is None
+
+    def test_server_preference_breaks_ties(self):
+        assert negotiate_encoding("gzip, zstd", ("zstd", "gzip")) == "zstd"
+
+    def test_client_q_values_win(self):
+        assert negotiate_encoding("zstd;q=0.5, gzip", ("zstd", "gzip")) == "gzip"
+
+    def test_q_zero_refuses(self):
+        assert negotiate_encoding("gzip;q=0", ("gzip",)) is None
+
+    def test_wildcard_matches_unlisted(self):
+        assert negotiate_encoding("*, zstd;q=0", ("zstd", "gzip")) == "gzip"
+
+
+class TestCompressionMiddleware:
+    def test_gzip_response(self):
+        response = _client().get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == BIG_TEXT
+
+    @pytest.mark.skipif(
+        "zstd" not in available_encodings(), reason="zstd codec not available"
+    )
+    def test_zstd_preferred_when_available(self):
+        response = _client().get("/big", headers={"Accept-Encoding": "gzip, zstd"})
+        assert response.headers["content-encoding"] == "zstd"
+        assert int(response.headers["content-length"]) < len(BIG_TEXT)
+
+    def test_identity_when_not_accepted(self):
+        response = _client().get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_small_bodies_are_not_compressed(self):
+        response = _client().get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.text == "tiny"
+
+    def test_streamed_bodies_are_compressed(self):
+        response = _client().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == BIG_TEXT * 3
+
+    def test_already_encoded_passes_through(self):
+        response = _client().get("/encoded", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == BIG_TEXT
+
+    def test_unlisted_media_types_pass_through(self):
+        response = _client().get("/binary", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+
+    def test_strong_etag_is_weakened(self):
+        response = _client().get("/etag", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["etag"] == 'W/"abc"'
+
+
+class TestPrecompressedStatics:
+    @pytest.fixture
+    def static_dir(self, tmp_path):
+        (tmp_path / "app.css").write_text(BIG_TEXT)
+        (tmp_path / "small.css").write_text("a{}")
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG" + b"\x00" * 2048)
+        return tmp_path
+
+    def _client(self, directory) -> TestClient:
+        app = Starlette(
+            routes=[Mount("/static", app=PrecompressedStaticFiles(directory=directory))]
+        )
+        return TestClient(app)
+
+    def test_precompress_writes_siblings(self, static_dir):
+        written = precompress_directory(static_dir, encodings=["gzip"])
+        assert written == [static_dir / "app.css.gz"]
+        assert gzip.decompress(written[0].read_bytes()).decode() == BIG_TEXT
+
+    def test_precompress_skips_fresh_siblings(self, static_dir):
+        precompress_directory(static_dir, encodings=["gzip"])
+        assert precompress_directory(static_dir, encodings=["gzip"]) == []
+
+    def test_serves_sibling_with_original_media_type(self, static_dir):
+        precompress_directory(static_dir, encodings=["gzip"])
+        response = self._client(static_dir).get(
+            "/static/app.css", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == BIG_TEXT
+
+    def test_serves_plain_file_without_accept_encoding(self, static_dir):
+        precompress_directory(static_dir, encodings=["gzip"])
+        response = self._client(static_dir).get(
+            "/static/app.css", headers={"Accept-Encoding": "identity"}
+        )
+        assert "content-encoding" not in response.headers
+        assert response.text == BIG_TEXT
+
+    def test_stale_sibling_is_ignored(self, static_dir):
+        sibling = static_dir / "app.css.gz"
+        sibling.write_bytes(compress(b"stale", "gzip", 6))
+        source_mtime = os.stat(static_dir / "app.css").st_mtime
+        os.utime(sibling, (source_mtime - 60, source_mtime - 60))
+
+        response = self._client(static_dir).get(
+            "/static/app.css", headers={"Accept-Encoding": "gzip"}
+        )
+        assert "content-encoding" not in response.headers
+        assert response.text == BIG_TEXT
+
+
+@pytest.mark.asyncio
+async def test_pathsend_file_response_passes_through(tmp_path):
+    path = tmp_path / "app.css"
+    path.write_text(BIG_TEXT)
+    app = CompressionMiddleware(FileResponse(path), minimum_size=500)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/app.css",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "extensions": {"http.response.pathsend": {}},
+    }
+    sent: list[dict] = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+
+    assert [m["type"] for m in sent] == [
+        "http.response.start",
+        "http.response.pathsend",
+    ]
+    headers = dict(sent[0]["headers"])
+    assert b"content-encoding" not in headers
+    assert headers[b"content-length"] == str(len(BIG_TEXT)).encode()
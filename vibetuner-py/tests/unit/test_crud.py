@@ -0,0 +1,1242 @@
+# ABOUTME: Tests for the CRUD route factory's query helpers and search modes.
+# ABOUTME: Covers keyset cursors, totals, field projections, and raw JSON list serialization.
+# ruff: noqa: S101
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+import pytest
+from beanie import Document, PydanticObjectId
+from beanie.odm.actions import ActionDirections, EventTypes
+from beanie.odm.utils.dump import get_dict
+from bson import Binary
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ConfigDict, Field
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from vibetuner.crud import (
+    _VERSION_PROJECTION,
+    Operation,
+    _apply_search,
+    _count_total,
+    _decode_cursor,
+    _encode_cursor,
+    _facet_page,
+    _index_covers,
+    _IndexSpec,
+    _keyset_filter,
+    _keyset_sort,
+    _list_etag,
+    _projection,
+    _projection_model,
+    _raw_json_response,
+    _select_fields,
+    _update_needs_document,
+    _version_token,
+    _with_search_terms,
+    create_crud_routes,
+    ensure_crud_indexes,
+)
+from vibetuner.models.mixins import PrefixSearchMixin, TimeStampMixin
+
+
+class CrudArticle(Document):
+    """Test model for CRUD helpers."""
+
+    title: str
+    published_at: datetime
+
+    class Settings:
+        name = "test_crud_articles"
+
+
+def _article(title: str = "Hello") -> CrudArticle:
+    return CrudArticle.model_construct(
+        id=PydanticObjectId(),
+        title=title,
+        published_at=datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+    )
+
+
+class TestKeysetCursor:
+    def test_sort_ends_with_id_in_leading_direction(self):
+        sortable = ["published_at", "title"]
+        assert _keyset_sort(None, sortable) == ["+_id"]
+        assert _keyset_sort("-published_at,title", sortable) == [
+            "-published_at",
+            "+title",
+            "-_id",
+        ]
+        assert _keyset_sort("secret", sortable) == ["+_id"]
+
+    def test_cursor_round_trips_sort_values(self):
+        doc = _article()
+        sort_parts = ["-published_at", "-_id"]
+        cursor = _encode_cursor(sort_parts, doc)
+        assert "=" not in cursor
+        values = _decode_cursor(cursor, sort_parts)
+        assert values[0] == datetime(2024, 5, 1, 12, 30)
+        assert values[1] == doc.id
+
+    def test_cursor_for_other_sort_is_rejected(self):
+        cursor = _encode_cursor(["+title", "+_id"], _article())
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor(cursor, ["-title", "-_id"])
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "e30", "W10"])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor(cursor, ["+_id"])
+        assert exc_info.value.detail == "Invalid cursor"
+
+
+class TestKeysetFilter:
+    def test_single_field(self):
+        oid = PydanticObjectId()
+        assert _keyset_filter(["+_id"], [oid]) == {"_id": {"$gt": oid}}
+
+    def test_compound_sort_expands_to_or(self):
+        oid = PydanticObjectId()
+        assert _keyset_filter(["-published_at", "+title", "-_id"], [1, "b", oid]) == {
+            "$or": [
+                {"$or": [{"published_at": {"$lt": 1}}, {"published_at": None}]},
+                {"published_at": 1, "title": {"$gt": "b"}},
+                {"published_at": 1, "title": "b", "_id": {"$lt": oid}},
+            ]
+        }
+
+    def test_null_boundary_ascending(self):
+        oid = PydanticObjectId()
+        assert _keyset_filter(["+rank", "+_id"], [None, oid]) == {
+            "$or": [
+                {"rank": {"$ne": None}},
+                {"rank": None, "_id": {"$gt": oid}},
+            ]
+        }
+
+    def test_null_boundary_descending(self):
+        oid = PydanticObjectId()
+        assert _keyset_filter(["-rank", "-_id"], [None, oid]) == {
+            "rank": None,
+            "_id": {"$lt": oid},
+        }
+        assert _keyset_filter(["-rank", "-_id"], [2, oid]) == {
+            "$or": [
+                {"$or": [{"rank": {"$lt": 2}}, {"rank": None}]},
+                {"rank": 2, "_id": {"$lt": oid}},
+            ]
+        }
+
+
+class _FakeCursor:
+    def __init__(self, results) -> None:
+        self.results = results
+
+    async def to_list(self, length=None):
+        return self.results
+
+
+class _FakeCollection:
+    def __init__(self, documents: int) -> None:
+        self.documents = documents
+        self.calls: list[tuple] = []
+
+    async def aggregate(self, pipeline):
+        self.calls.append(("aggregate", pipeline))
+        return _FakeCursor(
+            [{"items": [{"title": "a"}], "total": [{"n": self.documents}]}]
+        )
+
+    async def estimated_document_count(self):
+        self.calls.append(("estimated",))
+        return self.documents
+
+    async def count_documents(self, filter_query, limit=0):
+        self.calls.append(("count", filter_query, limit))
+        return min(self.documents, limit) if limit else self.documents
+
+
+class _FakeQuery:
+    def __init__(self, filter_query) -> None:
+        self.filter_query = filter_query
+
+    def get_filter_query(self):
+        return self.filter_query
+
+
+def _fake_model(collection: _FakeCollection):
+    class FakeModel:
+        @staticmethod
+        def get_pymongo_collection():
+            return collection
+
+        @staticmethod
+        def model_validate(raw):
+            return raw
+
+    return FakeModel
+
+
+class TestListTotals:
+    @pytest.mark.asyncio
+    async def test_facet_returns_page_and_total_in_one_call(self):
+        collection = _FakeCollection(42)
+        items, total = await _facet_page(
+            _fake_model(collection), _FakeQuery({"status": "x"}), ["-title"], 20, 10
+        )
+        assert (items, total) == ([{"title": "a"}], 42)
+        assert collection.calls == [
+            (
+                "aggregate",
+                [
+                    {"$match": {"status": "x"}},
+                    {"$sort": {"title": -1}},
+                    {
+                        "$facet": {
+                            "items": [{"$skip": 20}, {"$limit": 10}],
+                            "total": [{"$count": "n"}],
+                        }
+                    },
+                ],
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_estimated_only_without_filters(self):
+        collection = _FakeCollection(7)
+        model = _fake_model(collection)
+        assert await _count_total(model, _FakeQuery({}), "estimated", 10) == (7, False)
+        assert await _count_total(model, _FakeQuery({"a": 1}), "estimated", 10) == (
+            7,
+            False,
+        )
+        assert [call[0] for call in collection.calls] == ["estimated", "count"]
+
+    @pytest.mark.asyncio
+    async def test_capped_count_stops_at_cap(self):
+        collection = _FakeCollection(50_000)
+        model = _fake_model(collection)
+        assert await _count_total(model, _FakeQuery({}), "capped", 10_000) == (
+            10_000,
+            True,
+        )
+        assert collection.calls == [("count", {}, 10_001)]
+
+    @pytest.mark.asyncio
+    async def test_none_skips_counting(self):
+        collection = _FakeCollection(3)
+        assert await _count_total(
+            _fake_model(collection), _FakeQuery({}), "none", 10
+        ) == (None, False)
+        assert collection.calls == []
+
+
+class TestProjection:
+    def test_projection_model_only_holds_selected_fields(self):
+        projected = _projection_model(CrudArticle, frozenset({"title", "bogus"}))
+        assert set(projected.model_fields) == {"id", "title"}
+        assert _projection(projected) == {"_id": 1, "title": 1}
+        assert _projection_model(CrudArticle, frozenset({"title"})) is not projected
+        assert (
+            _projection_model(CrudArticle, frozenset({"title", "bogus"})) is projected
+        )
+
+    def test_raw_document_selects_fields(self):
+        oid = PydanticObjectId()
+        projected = _projection_model(CrudArticle, frozenset({"title"}))
+        item = projected.model_validate({"_id": oid, "title": "Hi"})
+        assert _select_fields(item, {"title"}) == {"id": str(oid), "title": "Hi"}
+
+    @pytest.mark.asyncio
+    async def test_facet_pushes_projection_into_items(self):
+        collection = _FakeCollection(1)
+        projected = _projection_model(CrudArticle, frozenset({"title"}))
+        items, _ = await _facet_page(
+            _fake_model(collection), _FakeQuery({}), [], 0, 5, projected
+        )
+        facet = collection.calls[0][1][-1]["$facet"]
+        assert facet["items"][-1] == {"$project": {"_id": 1, "title": 1}}
+        assert isinstance(items[0], projected)
+
+
+class ArticleOut(BaseModel):
+    id: str
+    title: str
+    published_at: datetime
+
+
+class TestRawJson:
+    def test_matches_schema_serialization(self):
+        oid = PydanticObjectId()
+        raw = {
+            "_id": oid,
+            "title": "Hi",
+            "published_at": datetime(2024, 5, 1),
+            "body": "x" * 100,
+        }
+        response = _raw_json_response(
+            [raw], CrudArticle, ArticleOut, {"total": 1, "total_capped": False}
+        )
+        assert response.media_type == "application/json"
+        expected = ArticleOut.model_validate(
+            {"id": str(oid), "title": "Hi", "published_at": "2024-05-01T00:00:00"}
+        )
+        assert json.loads(response.body) == {
+            "items": [expected.model_dump(mode="json")],
+            "total": 1,
+            "total_capped": False,
+        }
+
+    def test_cursor_from_raw_document(self):
+        oid = PydanticObjectId()
+        raw = {"_id": oid, "title": "Hi"}
+        cursor = _encode_cursor(["+title", "+_id"], raw)
+        assert _decode_cursor(cursor, ["+title", "+_id"]) == ["Hi", oid]
+
+
+class _RecordingQuery:
+    def __init__(self) -> None:
+        self.filters: list[dict] = []
+
+    def find(self, filter_query):
+        self.filters.append(filter_query)
+        return self
+
+
+class CrudProduct(Document, PrefixSearchMixin):
+    """Test model for prefix search."""
+
+    search_fields: ClassVar[tuple[str, ...]] = ("name",)
+
+    name: str
+    price: float = 0
+
+    class Settings:
+        name = "test_crud_products"
+
+
+class TestSearchModes:
+    def test_regex_is_the_default(self):
+        query = _apply_search(_RecordingQuery(), "a.b", ["title", "body"])
+        assert query.filters == [
+            {
+                "$or": [
+                    {"title": {"$regex": r"a\.b", "$options": "i"}},
+                    {"body": {"$regex": r"a\.b", "$options": "i"}},
+                ]
+            }
+        ]
+
+    def test_text_mode(self):
+        query = _apply_search(_RecordingQuery(), "green tea", ["title"], "text")
+        assert query.filters == [{"$text": {"$search": "green tea"}}]
+
+    def test_prefix_mode_is_anchored_and_normalized(self):
+        query = _apply_search(_RecordingQuery(), " Crème B", ["name"], "prefix")
+        assert query.filters == [{"search_terms": {"$regex": "^creme\\ b"}}]
+
+    def test_prefix_mode_requires_mixin(self):
+        with pytest.raises(TypeError, match="PrefixSearchMixin"):
+            create_crud_routes(CrudArticle, search_mode="prefix")
+
+    def test_modes_register_indexes(self, monkeypatch):
+        monkeypatch.setattr("vibetuner.crud._required_indexes", {})
+        create_crud_routes(CrudProduct, search_mode="prefix")
+        create_crud_routes(CrudArticle, searchable_fields=["title"], search_mode="text")
+        from vibetuner.crud import _required_indexes
+
+        assert _required_indexes == {
+            (CrudProduct, "search_terms_1"): _IndexSpec([("search_terms", 1)]),
+            (CrudArticle, "test_crud_articles_crud_text"): _IndexSpec(
+                [("title", "text")]
+            ),
+        }
+
+    def test_update_rebuilds_terms_from_merged_document(self):
+        doc = CrudProduct.model_construct(
+            id=PydanticObjectId(), name="Old", price=1, search_terms=["old"]
+        )
+        assert _with_search_terms(doc, {"name": "New Name"}) == {
+            "name": "New Name",
+            "search_terms": ["new name", "name"],
+        }
+        assert _with_search_terms(doc, {"price": 2}) == {"price": 2}
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_logs_failures(self, monkeypatch):
+        created: list[tuple] = []
+
+        class Collection:
+            async def create_index(self, keys, name):
+                if name == "broken":
+                    raise RuntimeError("only one text index per collection")
+                created.append((keys, name))
+
+        class Model:
+            __name__ = "Model"
+
+            @staticmethod
+            def get_pymongo_collection():
+                return Collection()
+
+        monkeypatch.setattr(
+            "vibetuner.crud._required_indexes",
+            {
+                (Model, "broken"): _IndexSpec([("a", "text")]),
+                (Model, "b_1"): _IndexSpec([("b", 1)]),
+            },
+        )
+        await ensure_crud_indexes()
+        assert created == [([("b", 1)], "b_1")]
+
+
+class _IndexedCollection:
+    name = "things"
+
+    def __init__(self, existing: dict[str, list], stage: str = "COLLSCAN") -> None:
+        self.existing = existing
+        self.stage = stage
+        self.created: list[tuple] = []
+        self.explained: list[dict] = []
+        self.database = self
+
+    async def index_information(self):
+        return {name: {"key": keys} for name, keys in self.existing.items()}
+
+    async def create_index(self, keys, name):
+        self.created.append((keys, name))
+
+    async def command(self, command):
+        self.explained.append(command)
+        plan = {"stage": "LIMIT", "inputStage": {"stage": self.stage}}
+        return {"queryPlanner": {"winningPlan": plan}}
+
+
+class TestIndexProvisioning:
+    def test_list_fields_register_indexes(self, monkeypatch):
+        monkeypatch.setattr("vibetuner.crud._required_indexes", {})
+        create_crud_routes(
+            CrudArticle,
+            filterable_fields=["status"],
+            sortable_fields=["title"],
+            indexes="create",
+        )
+        create_crud_routes(CrudProduct, sortable_fields=["price"], pagination="cursor")
+        create_crud_routes(CrudArticle, sortable_fields=["views"], indexes="off")
+        from vibetuner.crud import _required_indexes
+
+        assert _required_indexes == {
+            (CrudArticle, "status_1"): _IndexSpec([("status", 1)], True, "filter"),
+            (CrudArticle, "title_1"): _IndexSpec([("title", 1)], True, "sort"),
+            (CrudProduct, "price_1__id_1"): _IndexSpec(
+                [("price", 1), ("_id", 1)], False, "sort"
+            ),
+        }
+
+    def test_compound_pairs_register_filter_then_sort_keys(self, monkeypatch):
+        monkeypatch.setattr("vibetuner.crud._required_indexes", {})
+        create_crud_routes(
+            CrudArticle,
+            filterable_fields=["status"],
+            sortable_fields=["views"],
+            compound_indexes=[("status", "views")],
+            pagination="cursor",
+        )
+        from vibetuner.crud import _required_indexes
+
+        assert _required_indexes[(CrudArticle, "status_1_views_1__id_1")] == (
+            _IndexSpec([("status", 1), ("views", 1), ("_id", 1)], False, "filter_sort")
+        )
+
+    def test_compound_pairs_must_name_list_fields(self):
+        with pytest.raises(ValueError, match="compound_indexes"):
+            create_crud_routes(
+                CrudArticle,
+                filterable_fields=["status"],
+                compound_indexes=[("status", "views")],
+            )
+
+    def test_no_list_route_registers_nothing(self, monkeypatch):
+        monkeypatch.setattr("vibetuner.crud._required_indexes", {})
+        create_crud_routes(
+            CrudArticle, operations={Operation.READ}, sortable_fields=["title"]
+        )
+        from vibetuner.crud import _required_indexes
+
+        assert _required_indexes == {}
+
+    def test_existing_index_covers_prefix_in_either_direction(self):
+        keys = [("price", 1), ("_id", 1)]
+        assert _index_covers([("price", 1), ("_id", 1), ("x", 1)], keys)
+        assert _index_covers([("price", -1), ("_id", -1)], keys)
+        assert not _index_covers([("price", -1), ("_id", 1)], keys)
+        assert not _index_covers([("price", 1)], keys)
+        assert not _index_covers([("_fts", "text"), ("_ftsx", 1)], [("_fts", -1)])
+
+    @pytest.mark.asyncio
+    async def test_create_skips_covered_indexes(self, monkeypatch):
+        collection = _IndexedCollection({"title_-1": [("title", -1)]})
+        monkeypatch.setattr(
+            "vibetuner.crud._required_indexes",
+            {
+                (_fake_model(collection), "title_1"): _IndexSpec(
+                    [("title", 1)], True, "sort"
+                ),
+                (_fake_model(collection), "status_1"): _IndexSpec(
+                    [("status", 1)], True, "filter"
+                ),
+            },
+        )
+        await ensure_crud_indexes()
+        assert collection.created == [([("status", 1)], "status_1")]
+
+    @pytest.mark.asyncio
+    async def test_warn_explains_uncovered_queries(self, monkeypatch):
+        warnings: list[str] = []
+        monkeypatch.setattr(
+            "vibetuner.crud.logger.warning",
+            lambda message, *args: warnings.append(message.format(*args)),
+        )
+        scanned = _IndexedCollection({})
+        indexed = _IndexedCollection({}, stage="IXSCAN")
+        monkeypatch.setattr(
+            "vibetuner.crud._required_indexes",
+            {
+                (_fake_model(scanned), "price_1__id_1"): _IndexSpec(
+                    [("price", 1), ("_id", 1)], False, "sort"
+                ),
+                (_fake_model(indexed), "status_1"): _IndexSpec(
+                    [("status", 1)], False, "filter"
+                ),
+            },
+        )
+        await ensure_crud_indexes()
+
+        assert scanned.created == indexed.created == []
+        assert scanned.explained == [
+            {
+                "explain": {
+                    "find": "things",
+                    "limit": 1,
+                    "sort": {"price": 1, "_id": 1},
+                },
+                "verbosity": "queryPlanner",
+            }
+        ]
+        assert indexed.explained[0]["explain"]["filter"] == {"status": None}
+        assert len(warnings) == 1
+        assert "LIMIT <- COLLSCAN" in warnings[0]
+        assert "price" in warnings[0]
+
+    @pytest.mark.asyncio
+    async def test_warn_explains_filter_with_sort(self, monkeypatch):
+        warnings: list[str] = []
+        monkeypatch.setattr(
+            "vibetuner.crud.logger.warning",
+            lambda message, *args: warnings.append(message.format(*args)),
+        )
+        collection = _IndexedCollection({"status_1": [("status", 1)]})
+        monkeypatch.setattr(
+            "vibetuner.crud._required_indexes",
+            {
+                (_fake_model(collection), "status_1_views_1"): _IndexSpec(
+                    [("status", 1), ("views", 1)], False, "filter_sort"
+                ),
+            },
+        )
+        await ensure_crud_indexes()
+
+        assert collection.explained[0]["explain"] == {
+            "find": "things",
+            "limit": 1,
+            "filter": {"status": None},
+            "sort": {"views": 1},
+        }
+        assert "filter_sort on FakeModel.status,views" in warnings[0]
+
+
+class _MemoryCursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+
+    def sort(self, keys):
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length=None):
+        return self.docs
+
+
+def _field_matches(value, expected) -> bool:
+    if not isinstance(expected, dict):
+        return value == expected
+    for op, operand in expected.items():
+        if op == "$in":
+            matched = value in operand
+        elif op == "$ne":
+            matched = value != operand
+        elif value is None or operand is None:
+            # Like MongoDB, range operators never match across types.
+            matched = False
+        else:
+            matched = value > operand if op == "$gt" else value < operand
+        if not matched:
+            return False
+    return True
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for key, expected in query.items():
+        if key == "$or":
+            matched = any(_matches(doc, q) for q in expected)
+        elif key == "$and":
+            matched = all(_matches(doc, q) for q in expected)
+        else:
+            matched = _field_matches(doc.get(key), expected)
+        if not matched:
+            return False
+    return True
+
+
+class _MemoryCollection:
+    """In-memory stand-in for the pymongo collection behind ``_Thing``.
+
+    Filters support equality, ``$in``, ``$ne``, ``$gt``/``$lt`` and
+    ``$or``/``$and``; ``name`` is unique, as if indexed. Every call is
+    recorded in ``calls``.
+    """
+
+    def __init__(self, *docs: dict) -> None:
+        self.docs = {doc["_id"]: dict(doc) for doc in docs}
+        self.calls: list[tuple] = []
+
+    def _matching(self, query) -> list[dict]:
+        return [doc for doc in self.docs.values() if _matches(doc, query)]
+
+    def find(self, query, projection=None):
+        self.calls.append(("find", query, projection))
+        return _MemoryCursor(
+            [_projected(doc, projection) for doc in self._matching(query)]
+        )
+
+    async def find_one(self, query, projection=None):
+        self.calls.append(("find_one", query, projection))
+        found = self._matching(query)
+        return _projected(found[0], projection) if found else None
+
+    async def count_documents(self, query, limit=0):
+        self.calls.append(("count_documents", query))
+        return len(self._matching(query))
+
+    async def insert_many(self, docs, ordered=True):
+        self.calls.append(("insert_many", [doc["name"] for doc in docs]))
+        names = {doc["name"] for doc in self.docs.values()}
+        errors = []
+        for index, doc in enumerate(docs):
+            if doc["name"] in names:
+                errors.append(
+                    {"index": index, "code": 11000, "errmsg": "duplicate key"}
+                )
+                if ordered:
+                    break
+                continue
+            names.add(doc["name"])
+            self.docs[doc["_id"]] = doc
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+    async def find_one_and_update(self, query, update, return_document):
+        self.calls.append(("find_one_and_update", query, update))
+        found = self._matching(query)
+        if not found:
+            return None
+        found[0].update(update["$set"])
+        return dict(found[0])
+
+    async def find_one_and_delete(self, query):
+        self.calls.append(("find_one_and_delete", query))
+        found = self._matching(query)
+        return self.docs.pop(found[0]["_id"]) if found else None
+
+    async def delete_one(self, query):
+        self.calls.append(("delete_one", query))
+        found = self._matching(query)
+        for doc in found[:1]:
+            del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(found[:1]))
+
+    async def delete_many(self, query):
+        self.calls.append(("delete_many", query))
+        found = self._matching(query)
+        for doc in found:
+            del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(found))
+
+    async def bulk_write(self, operations, ordered=True):
+        self.calls.append(("bulk_write", operations))
+        for operation in operations:
+            for doc in self._matching(operation._filter):
+                doc.update(operation._doc["$set"])
+
+
+def _projected(doc: dict, projection: dict | None) -> dict:
+    if not projection:
+        return dict(doc)
+    return {k: v for k, v in doc.items() if k in projection}
+
+
+class _MemoryQuery(_FakeQuery):
+    def __init__(self, model, filter_query) -> None:
+        super().__init__(filter_query)
+        self.model = model
+        self.window = slice(None)
+        self.sort_parts: list[str] = []
+
+    def find(self, filter_query):
+        return _MemoryQuery(self.model, {"$and": [self.filter_query, filter_query]})
+
+    def sort(self, keys):
+        self.sort_parts = list(keys)
+        return self
+
+    def skip(self, n):
+        self.window = slice(n, None)
+        return self
+
+    def limit(self, n):
+        self.window = slice(self.window.start, (self.window.start or 0) + n)
+        return self
+
+    async def to_list(self):
+        raw = await self.model.collection.find(self.filter_query).to_list()
+        for part in reversed(self.sort_parts):
+            # MongoDB sorts null and missing values first.
+            raw.sort(
+                key=lambda doc, f=part[1:]: (doc.get(f) is not None, doc.get(f)),
+                reverse=part[0] == "-",
+            )
+        return [self.model.model_validate(doc) for doc in raw[self.window]]
+
+
+class _Thing(BaseModel):
+    """Stands in for a Document whose collection is a ``_MemoryCollection``."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: PydanticObjectId | None = Field(default=None, alias="_id")
+    name: str
+    rank: int | None = None
+    revision_id: UUID | None = Field(default=None, exclude=True)
+
+    collection: ClassVar[_MemoryCollection]
+
+    class Settings:
+        use_revision = False
+
+    @classmethod
+    def get_settings(cls):
+        return cls.Settings
+
+    @classmethod
+    def get_pymongo_collection(cls):
+        return cls.collection
+
+    @classmethod
+    def find(cls, filter_query=None):
+        return _MemoryQuery(cls, filter_query or {})
+
+    @classmethod
+    async def get(cls, item_id):
+        raw = await cls.collection.find_one({"_id": item_id})
+        return cls.model_validate(raw) if raw else None
+
+    @classmethod
+    async def insert_many(cls, docs, ordered=True):
+        await cls.collection.insert_many(
+            [get_dict(doc, to_db=True) for doc in docs], ordered=ordered
+        )
+
+
+class _Name(BaseModel):
+    name: str | None = None
+
+
+@pytest.fixture
+def crud():
+    """Build a ``/things`` router over ``_Thing`` documents held in memory.
+
+    Returns the test client and the collection the routes write to.
+    """
+
+    def build(
+        *docs: dict, use_revision: bool = False, **kwargs
+    ) -> tuple[TestClient, _MemoryCollection]:
+        collection = _MemoryCollection(*docs)
+        model = type("Thing", (_Thing,), {})
+        model.collection = collection
+        model.Settings = type("Settings", (), {"use_revision": use_revision})
+        app = FastAPI()
+        app.include_router(
+            create_crud_routes(model, prefix="/things", update_schema=_Name, **kwargs)
+        )
+        return TestClient(app), collection
+
+    return build
+
+
+def _calls(collection: _MemoryCollection, name: str) -> list[tuple]:
+    return [call for call in collection.calls if call[0] == name]
+
+
+def _revisioned(name: str = "old") -> dict:
+    return {
+        "_id": PydanticObjectId(),
+        "name": name,
+        "revision_id": Binary.from_uuid(uuid4()),
+    }
+
+
+class TestBulkRoutes:
+    def test_ordered_create_stops_at_first_failure(self, crud):
+        client, collection = crud(
+            {"_id": PydanticObjectId(), "name": "dup"},
+            operations={Operation.CREATE},
+            bulk=True,
+        )
+        response = client.post(
+            "/things/bulk",
+            json=[{"name": "a"}, {"name": "dup"}, {"name": "b"}, {"nope": 1}],
+        )
+        body = response.json()
+        assert response.status_code == 200
+        assert sorted(doc["name"] for doc in collection.docs.values()) == ["a", "dup"]
+        assert body["succeeded"] == 1
+        assert body["skipped"] == 2
+        assert body["errors"] == [
+            {"index": 1, "status": 409, "detail": "duplicate key"}
+        ]
+
+    def test_unordered_create_reports_every_failure(self, crud):
+        chunks: list[int] = []
+
+        async def post_bulk_create(docs, request):
+            chunks.append(len(docs))
+
+        client, collection = crud(
+            {"_id": PydanticObjectId(), "name": "dup"},
+            operations={Operation.CREATE},
+            bulk=True,
+            bulk_chunk_size=2,
+            post_bulk_create=post_bulk_create,
+        )
+        response = client.post(
+            "/things/bulk?ordered=false",
+            json=[{"name": "a"}, {"nope": 1}, {"name": "dup"}, {"name": "b"}],
+        )
+        body = response.json()
+        assert _calls(collection, "insert_many") == [
+            ("insert_many", ["a"]),
+            ("insert_many", ["dup", "b"]),
+        ]
+        assert chunks == [1, 1]
+        assert body["succeeded"] == 2
+        assert len(body["ids"]) == 2
+        assert body["skipped"] == 0
+        assert [(e["index"], e["status"]) for e in body["errors"]] == [
+            (1, 422),
+            (2, 409),
+        ]
+
+    def test_oversized_request_is_rejected(self, crud):
+        client, _ = crud(operations={Operation.CREATE}, bulk=True, max_bulk_items=2)
+        response = client.post("/things/bulk", json=[{"name": "a"}] * 3)
+        assert response.status_code == 413
+
+    def test_bulk_routes_come_before_item_routes(self, crud):
+        stored = {"_id": PydanticObjectId(), "name": "a"}
+        missing = PydanticObjectId()
+        client, collection = crud(
+            stored, operations={Operation.READ, Operation.DELETE}, bulk=True
+        )
+        response = client.request(
+            "DELETE",
+            "/things/bulk?ordered=false",
+            json=[str(stored["_id"]), str(missing)],
+        )
+        assert response.status_code == 200
+        assert response.json()["ids"] == [str(stored["_id"])]
+        assert response.json()["errors"] == [
+            {"index": 1, "status": 404, "detail": "Not found"}
+        ]
+        assert _calls(collection, "delete_many") == [
+            ("delete_many", {"_id": {"$in": [stored["_id"]]}})
+        ]
+        assert collection.docs == {}
+
+    def test_bulk_delete_reports_repeated_ids(self, crud):
+        stored = {"_id": PydanticObjectId(), "name": "a"}
+        client, collection = crud(stored, operations={Operation.DELETE}, bulk=True)
+        response = client.request(
+            "DELETE",
+            "/things/bulk?ordered=false",
+            json=[str(stored["_id"])] * 2,
+        )
+        body = response.json()
+        assert body["succeeded"] == 1
+        assert body["errors"] == [{"index": 1, "status": 400, "detail": "Duplicate id"}]
+        assert _calls(collection, "delete_many") == [
+            ("delete_many", {"_id": {"$in": [stored["_id"]]}})
+        ]
+
+    def test_bulk_delete_does_not_claim_concurrent_deletes(self, crud):
+        first = {"_id": PydanticObjectId(), "name": "a"}
+        second = {"_id": PydanticObjectId(), "name": "b"}
+        deleted: list = []
+
+        async def pre_bulk_delete(docs, request):
+            # Another request deletes one document after the lookup.
+            collection.docs.pop(second["_id"])
+
+        async def post_bulk_delete(docs, request):
+            deleted.extend(docs)
+
+        client, collection = crud(
+            first,
+            second,
+            operations={Operation.DELETE},
+            bulk=True,
+            pre_bulk_delete=pre_bulk_delete,
+            post_bulk_delete=post_bulk_delete,
+        )
+        body = client.request(
+            "DELETE",
+            "/things/bulk?ordered=false",
+            json=[str(first["_id"]), str(second["_id"])],
+        ).json()
+        assert body["succeeded"] == 0
+        assert [(e["index"], e["status"]) for e in body["errors"]] == [
+            (0, 409),
+            (1, 409),
+        ]
+        assert deleted == []
+
+    def test_pre_bulk_create_must_keep_one_item_per_item(self, crud):
+        async def pre_bulk_create(items, request):
+            return [item for item in items if item.name != "b"]
+
+        client, collection = crud(
+            operations={Operation.CREATE},
+            bulk=True,
+            pre_bulk_create=pre_bulk_create,
+        )
+        response = client.post("/things/bulk", json=[{"name": "a"}, {"name": "b"}])
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Hook execution failed: pre_bulk_create"
+        assert collection.docs == {}
+
+    def test_pre_bulk_update_must_keep_one_update_per_doc(self, crud):
+        stored = {"_id": PydanticObjectId(), "name": "old"}
+
+        async def pre_bulk_update(docs, updates, request):
+            return []
+
+        client, collection = crud(
+            stored,
+            operations={Operation.UPDATE},
+            bulk=True,
+            pre_bulk_update=pre_bulk_update,
+        )
+        response = client.patch(
+            "/things/bulk", json=[{"id": str(stored["_id"]), "name": "new"}]
+        )
+        assert response.status_code == 500
+        assert collection.docs[stored["_id"]]["name"] == "old"
+
+    def test_bulk_update_writes_only_changed_documents(self, crud):
+        changed = {"_id": PydanticObjectId(), "name": "same"}
+        unchanged = {"_id": PydanticObjectId(), "name": "same"}
+        client, collection = crud(
+            changed, unchanged, operations={Operation.UPDATE}, bulk=True
+        )
+        response = client.patch(
+            "/things/bulk",
+            json=[
+                {"id": str(changed["_id"]), "name": "new"},
+                {"id": str(unchanged["_id"]), "name": "same"},
+            ],
+        )
+        assert response.json()["ids"] == [str(changed["_id"]), str(unchanged["_id"])]
+        assert _calls(collection, "bulk_write") == [
+            (
+                "bulk_write",
+                [UpdateOne({"_id": changed["_id"]}, {"$set": {"name": "new"}})],
+            )
+        ]
+        assert collection.docs[changed["_id"]]["name"] == "new"
+
+    def test_bulk_update_rotates_revisions_of_changed_documents(self, crud):
+        changed, unchanged = _revisioned(), _revisioned("same")
+        before = {doc["_id"]: doc["revision_id"] for doc in (changed, unchanged)}
+        client, collection = crud(
+            changed,
+            unchanged,
+            use_revision=True,
+            operations={Operation.UPDATE},
+            bulk=True,
+        )
+        client.patch(
+            "/things/bulk",
+            json=[
+                {"id": str(changed["_id"]), "name": "new"},
+                {"id": str(unchanged["_id"]), "name": "same"},
+            ],
+        )
+        [(_, [operation])] = _calls(collection, "bulk_write")
+        assert set(operation._doc["$set"]) == {"name", "revision_id"}
+        assert collection.docs[changed["_id"]]["revision_id"] != before[changed["_id"]]
+        assert (
+            collection.docs[unchanged["_id"]]["revision_id"] == before[unchanged["_id"]]
+        )
+
+
+class TestCursorPages:
+    @staticmethod
+    def _walk(client: TestClient, sort: str) -> list[str]:
+        names, cursor = [], None
+        while True:
+            params = {"limit": 2, "sort": sort}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/things", params=params).json()
+            names += [item["name"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return names
+
+    def test_pages_walk_past_null_sort_values(self, crud):
+        ranks = [None, 2, None, 1, 3]
+        client, _ = crud(
+            *(
+                {"_id": PydanticObjectId(), "name": f"t{i}", "rank": rank}
+                for i, rank in enumerate(ranks)
+            ),
+            pagination="cursor",
+            sortable_fields=["rank"],
+        )
+        assert self._walk(client, "rank") == ["t0", "t2", "t3", "t1", "t4"]
+        assert self._walk(client, "-rank") == ["t4", "t1", "t3", "t2", "t0"]
+
+
+class TestSingleTripWrites:
+    def test_update_is_one_find_one_and_update(self, crud):
+        stored = {"_id": PydanticObjectId(), "name": "old"}
+        client, collection = crud(stored, operations={Operation.UPDATE})
+        response = client.patch(f"/things/{stored['_id']}", json={"name": "new"})
+        assert response.status_code == 200
+        assert response.json()["name"] == "new"
+        assert collection.calls == [
+            ("find_one_and_update", {"_id": stored["_id"]}, {"$set": {"name": "new"}})
+        ]
+
+    def test_update_of_missing_document_is_404(self, crud):
+        client, _ = crud(operations={Operation.UPDATE})
+        response = client.patch(f"/things/{PydanticObjectId()}", json={"name": "new"})
+        assert response.status_code == 404
+
+    def test_timestamp_action_is_folded_into_the_update(self, crud, monkeypatch):
+        stored = {"_id": PydanticObjectId(), "name": "old"}
+        client, collection = crud(stored, operations={Operation.UPDATE})
+        monkeypatch.setattr(
+            "vibetuner.crud.ActionRegistry.get_action_list",
+            lambda model, event, direction: (
+                [TimeStampMixin.touch_on_update]
+                if (event, direction) == (EventTypes.UPDATE, ActionDirections.BEFORE)
+                else []
+            ),
+        )
+        client.patch(f"/things/{stored['_id']}", json={"name": "new"})
+        [(_, _, update)] = collection.calls
+        assert set(update["$set"]) == {"name", "db_update_dt"}
+
+    def test_stateful_actions_and_search_fields_need_the_document(self, monkeypatch):
+        assert _update_needs_document(CrudProduct, {"name": "x"})
+        assert not _update_needs_document(CrudProduct, {"price": 2})
+        monkeypatch.setattr(
+            "vibetuner.crud.ActionRegistry.get_action_list",
+            lambda model, event, direction: [lambda doc: None],
+        )
+        assert _update_needs_document(CrudArticle, {"title": "x"})
+
+    def test_delete_is_one_delete_one(self, crud):
+        stored = {"_id": PydanticObjectId(), "name": "old"}
+        client, collection = crud(stored, operations={Operation.DELETE})
+        assert client.delete(f"/things/{stored['_id']}").status_code == 204
+        assert client.delete(f"/things/{PydanticObjectId()}").status_code == 404
+        assert collection.calls[0] == ("delete_one", {"_id": stored["_id"]})
+
+    def test_delete_returns_document_to_post_hook(self, crud):
+        stored = {"_id": PydanticObjectId(), "name": "old"}
+        deleted: list = []
+
+        async def post_delete(doc, request):
+            deleted.append(doc)
+
+        client, collection = crud(
+            stored, operations={Operation.DELETE}, post_delete=post_delete
+        )
+        assert client.delete(f"/things/{stored['_id']}").status_code == 204
+        assert collection.calls == [("find_one_and_delete", {"_id": stored["_id"]})]
+        assert [(doc.id, doc.name) for doc in deleted] == [(stored["_id"], "old")]
+
+
+class TestOptimisticConcurrency:
+    def test_requires_use_revision(self):
+        with pytest.raises(TypeError, match="use_revision"):
+            create_crud_routes(CrudArticle, optimistic_concurrency=True)
+
+    def test_if_match_guards_the_update(self, crud):
+        stored = _revisioned()
+        revision = stored["revision_id"].as_uuid()
+        client, collection = crud(
+            stored,
+            use_revision=True,
+            operations={Operation.UPDATE},
+            optimistic_concurrency=True,
+        )
+
+        stale = client.patch(
+            f"/things/{stored['_id']}",
+            json={"name": "new"},
+            headers={"If-Match": f'"{uuid4()}"'},
+        )
+        assert stale.status_code == 412
+
+        fresh = client.patch(
+            f"/things/{stored['_id']}",
+            json={"name": "new"},
+            headers={"If-Match": f'"{revision}"'},
+        )
+        assert fresh.status_code == 200
+        [_, (_, query, update)] = _calls(collection, "find_one_and_update")
+        assert query == {
+            "_id": stored["_id"],
+            "revision_id": Binary.from_uuid(revision),
+        }
+        new_revision = update["$set"]["revision_id"].as_uuid()
+        assert new_revision != revision
+        assert fresh.headers["etag"] == f'"{new_revision}"'
+
+    def test_if_match_guards_the_delete(self, crud):
+        stored = _revisioned()
+        client, _ = crud(
+            stored,
+            use_revision=True,
+            operations={Operation.DELETE},
+            optimistic_concurrency=True,
+        )
+        assert (
+            client.delete(f"/things/{stored['_id']}", headers={"If-Match": '"nope"'})
+        ).status_code == 412
+        assert (
+            client.delete(f"/things/{stored['_id']}", headers={"If-Match": "*"})
+        ).status_code == 204
+
+
+class TestConditionalGet:
+    def test_version_token_matches_across_raw_and_loaded(self):
+        revision = uuid4()
+        assert _version_token({"revision_id": Binary.from_uuid(revision)}) == str(
+            revision
+        )
+        stored = datetime(2024, 5, 1, 12, 30, 0, 123000)
+        loaded = datetime(2024, 5, 1, 12, 30, 0, 123456, tzinfo=UTC)
+        assert _version_token({"db_update_dt": stored}) == _version_token(
+            SimpleNamespace(revision_id=None, db_update_dt=loaded)
+        )
+        assert _version_token({}) is None
+
+    def test_list_etag_changes_with_any_version(self):
+        docs = [{"_id": 1, "revision_id": "a"}, {"_id": 2, "revision_id": "b"}]
+        tag = _list_etag(docs, [2, False])
+        assert tag == _list_etag([dict(d) for d in docs], [2, False])
+        assert tag != _list_etag([docs[0], {**docs[1], "revision_id": "c"}], [2, False])
+        assert tag != _list_etag(docs, [3, False])
+
+    def test_requires_versioned_model(self):
+        with pytest.raises(TypeError, match="etags"):
+            create_crud_routes(CrudArticle, etags=True)
+
+    def test_read_answers_304_from_version_projection(self, crud):
+        stored = _revisioned()
+        revision = stored["revision_id"].as_uuid()
+        client, collection = crud(
+            stored,
+            use_revision=True,
+            operations={Operation.LIST, Operation.READ},
+            etags=True,
+        )
+
+        response = client.get(
+            f"/things/{stored['_id']}", headers={"If-None-Match": f'W/"{revision}"'}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == f'"{revision}"'
+        assert collection.calls == [
+            ("find_one", {"_id": stored["_id"]}, _VERSION_PROJECTION)
+        ]
+        missing = client.get(
+            f"/things/{PydanticObjectId()}", headers={"If-None-Match": '"x"'}
+        )
+        assert missing.status_code == 404
+
+    def test_list_answers_304_from_version_projection(self, crud):
+        docs = [_revisioned(name) for name in "abc"]
+        client, collection = crud(
+            *docs,
+            use_revision=True,
+            operations={Operation.LIST, Operation.READ},
+            etags=True,
+        )
+        etag = _list_etag(docs[:2], [3, False])
+
+        response = client.get(
+            "/things?limit=2", headers={"If-None-Match": f'"other", {etag}'}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert _calls(collection, "find") == [("find", {}, _VERSION_PROJECTION)]
+
+    def test_bulk_update_changes_the_etags(self, crud):
+        stored = _revisioned()
+        client, _ = crud(
+            stored,
+            use_revision=True,
+            operations={Operation.LIST, Operation.READ, Operation.UPDATE},
+            bulk=True,
+            etags=True,
+        )
+        item_etag = client.get(f"/things/{stored['_id']}").headers["etag"]
+        list_etag = client.get("/things").headers["etag"]
+
+        client.patch("/things/bulk", json=[{"id": str(stored["_id"]), "name": "new"}])
+
+        item = client.get(
+            f"/things/{stored['_id']}", headers={"If-None-Match": item_etag}
+        )
+        assert item.status_code == 200
+        assert item.headers["etag"] != item_etag
+        page = client.get("/things", headers={"If-None-Match": list_etag})
+        assert page.status_code == 200
+        assert page.headers["etag"] != list_etag
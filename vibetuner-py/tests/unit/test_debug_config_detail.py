@@ -44,6 +44,7 @@ def _make_env() -> Environment:
             return ""
 
     env.globals["url_for"] = _stub_url_for
+    env.globals["static_url"] = lambda asset: f"/static/{asset}"
     env.globals["DEBUG"] = True
     env.globals["BODY_CLASS"] = ""
     env.globals["SKIP_HEADER"] = True
@@ -1,4 +1,4 @@
-# ABOUTME: Regression tests for /health/ready service detection logic.
+# ABOUTME: Tests for /health routes: /health/ready service detection and SSE metrics.
 # ABOUTME: Pins the email-provider check after the settings.mailjet_api_key bug.
 # ruff: noqa: S101
 
@@ -107,3 +107,29 @@ async def test_check_all_services_skips_email_when_provider_set_without_creds():
         services = await _check_all_services()
 
     assert "email" not in services
+
+
+def test_sse_metrics_endpoint_requires_configured_token(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from pydantic import SecretStr
+    from vibetuner.config import settings
+    from vibetuner.frontend.routes.health import router
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    monkeypatch.setattr(settings.sse, "metrics_token", None)
+    assert client.get("/health/sse/metrics").status_code == 404
+
+    monkeypatch.setattr(settings.sse, "metrics_token", SecretStr("scrape-me"))
+    assert client.get("/health/sse/metrics").status_code == 401
+    wrong = client.get("/health/sse/metrics", headers={"Authorization": "Bearer nope"})
+    assert wrong.status_code == 401
+
+    response = client.get(
+        "/health/sse/metrics", headers={"Authorization": "Bearer scrape-me"}
+    )
+    assert response.status_code == 200
+    assert "# TYPE vibetuner_sse_connections gauge" in response.text
@@ -1,18 +1,25 @@
 # ABOUTME: Unit tests for vibetuner.models.mixins module.
-# ABOUTME: Tests TimeStampMixin and EncryptedFieldsMixin functionality.
+# ABOUTME: Tests TimeStampMixin, EncryptedFieldsMixin and PrefixSearchMixin functionality.
 # ruff: noqa: S101, S105, S106
 
 from datetime import UTC, datetime, timedelta
+from typing import ClassVar
 from unittest.mock import patch
 
+import pytest
+from beanie import Document
 from pydantic import Field
 from vibetuner.config import settings
 from vibetuner.models.mixins import (
     EncryptedFieldsMixin,
     EncryptedStr,
+    PrefixSearchMixin,
     Since,
     TimeStampMixin,
     _encrypted_field_names,
+    backfill_search_terms,
+    normalize_search_text,
+    search_terms,
 )
 from vibetuner.time import Unit
 
@@ -466,3 +473,87 @@ class TestEncryptedFieldsMixin:
         monkeypatch.setattr(settings, "field_encryption_key", "wrong-key")
         model = SecretModel(api_key=ciphertext)
         assert model.api_key == ciphertext
+
+
+class SearchableModel(PrefixSearchMixin):
+    """Sample model for PrefixSearchMixin tests."""
+
+    search_fields: ClassVar[tuple[str, ...]] = ("name", "tags")
+
+    name: str
+    tags: list[str] = Field(default_factory=list)
+    notes: str = ""
+
+
+class TestPrefixSearchMixin:
+    def test_normalize_strips_case_accents_and_spacing(self):
+        assert normalize_search_text("  Crème   BRÛLÉE ") == "creme brulee"
+
+    def test_terms_start_at_each_word(self):
+        assert search_terms(["Crème Brûlée", ["Dessert"], None, 3]) == [
+            "creme brulee",
+            "brulee",
+            "dessert",
+        ]
+
+    def test_terms_are_truncated(self):
+        assert search_terms(["x" * 100]) == ["x" * 64]
+
+    def test_refresh_uses_search_fields_only(self):
+        doc = SearchableModel(name="Green Tea", tags=["Hot"], notes="ignored")
+        assert doc.search_terms == []
+        assert doc.refresh_search_terms() == ["green tea", "tea", "hot"]
+        assert doc.search_terms == ["green tea", "tea", "hot"]
+
+
+class SearchableDocument(Document, PrefixSearchMixin):
+    """Stored model for backfill_search_terms tests."""
+
+    search_fields: ClassVar[tuple[str, ...]] = ("name",)
+
+    name: str
+
+
+class _BackfillCollection:
+    def __init__(self, *docs: dict) -> None:
+        self.docs = docs
+        self.projections: list[dict] = []
+        self.batches: list[list] = []
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+    def find(self, query, projection):
+        self.projections.append(projection)
+        return self._iterate()
+
+    async def bulk_write(self, operations, ordered=True):
+        self.batches.append(operations)
+
+
+class TestBackfillSearchTerms:
+    @pytest.mark.asyncio
+    async def test_updates_only_stale_documents_in_batches(self, monkeypatch):
+        collection = _BackfillCollection(
+            {"_id": 1, "name": "Green Tea"},
+            {"_id": 2, "name": "Hot", "search_terms": ["hot"]},
+            {"_id": 3, "name": "Café", "search_terms": ["old"]},
+        )
+        monkeypatch.setattr(
+            SearchableDocument, "get_pymongo_collection", lambda: collection
+        )
+
+        assert await backfill_search_terms(SearchableDocument, batch_size=1) == 2
+        assert collection.projections == [{"name": 1, "search_terms": 1}]
+        assert [
+            (op._filter, op._doc) for batch in collection.batches for op in batch
+        ] == [
+            ({"_id": 1}, {"$set": {"search_terms": ["green tea", "tea"]}}),
+            ({"_id": 3}, {"$set": {"search_terms": ["cafe"]}}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_requires_the_mixin(self):
+        with pytest.raises(TypeError, match="PrefixSearchMixin"):
+            await backfill_search_terms(Document)
@@ -0,0 +1,234 @@
+# ABOUTME: Tests for the Redis-backed server-side session middleware.
+# ABOUTME: Covers lazy decoding, dirty tracking, ID rotation, and graceful degradation.
+# ruff: noqa: S101
+
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from vibetuner.frontend.sessions import RedisSession, RedisSessionMiddleware
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list = []
+
+    def set(self, key, value, ex=None):
+        self._ops.append(("set", key, value, ex))
+
+    def unlink(self, key):
+        self._ops.append(("unlink", key))
+
+    async def execute(self):
+        for op in self._ops:
+            if op[0] == "set":
+                await self._redis.set(op[1], op[2], ex=op[3])
+            else:
+                await self._redis.unlink(op[1])
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.calls: list[str] = []
+
+    async def getex(self, key, ex=None):
+        self.calls.append("getex")
+        value = self.data.get(key)
+        return value.encode() if value is not None else None
+
+    async def set(self, key, value, ex=None):
+        self.calls.append("set")
+        self.data[key] = value
+
+    async def unlink(self, key):
+        self.calls.append("unlink")
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+
+    async def get_client():
+        return redis
+
+    monkeypatch.setattr("vibetuner.redis.get_redis_client", get_client)
+    monkeypatch.setattr("vibetuner.config.settings.redis_key_prefix", "test:")
+    return redis
+
+
+async def _login(request: Request):
+    request.session["user"] = {"id": request.query_params.get("id", "u1")}
+    return PlainTextResponse("ok")
+
+
+async def _whoami(request: Request):
+    user = request.session.get("user")
+    return PlainTextResponse(user["id"] if user else "anon")
+
+
+async def _untouched(request: Request):
+    return PlainTextResponse("ok")
+
+
+async def _set_language(request: Request):
+    request.session["user"]["settings"]["language"] = "ca"
+    return PlainTextResponse("ok")
+
+
+async def _logout(request: Request):
+    request.session.clear()
+    return PlainTextResponse("ok")
+
+
+def _client() -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/login", _login),
+            Route("/whoami", _whoami),
+            Route("/untouched", _untouched),
+            Route("/language", _set_language),
+            Route("/logout", _logout),
+            Route("/static/app.css", _whoami),
+        ]
+    )
+    return TestClient(RedisSessionMiddleware(app))
+
+
+class TestRedisSession:
+    def test_decodes_only_on_first_access(self):
+        session = RedisSession("not json")
+        assert repr(session) == "RedisSession(<not loaded>)"
+        assert session.dirty is False
+
+    def test_reading_does_not_mark_dirty(self):
+        session = RedisSession(json.dumps({"a": 1}, separators=(",", ":")))
+        assert session["a"] == 1
+        assert session.dirty is False
+
+    def test_setting_marks_dirty(self):
+        session = RedisSession()
+        session["a"] = 1
+        assert session.dirty is True
+
+    def test_nested_mutation_marks_dirty(self):
+        session = RedisSession('{"user":{"settings":{"language":"en"}}}')
+        session["user"]["settings"]["language"] = "ca"
+        assert session.dirty is True
+
+    def test_malformed_payload_is_reset(self):
+        session = RedisSession("[1, 2]")
+        assert dict(session) == {}
+        assert session.dirty is True
+
+
+class TestRedisSessionMiddleware:
+    def test_no_cookie_means_no_redis_calls(self, fake_redis):
+        client = _client()
+        response = client.get("/whoami")
+        assert response.text == "anon"
+        assert fake_redis.calls == []
+        assert "set-cookie" not in response.headers
+
+    def test_cookie_holds_only_an_opaque_id(self, fake_redis):
+        client = _client()
+        response = client.get("/login")
+        session_id = response.cookies["session"]
+        assert "u1" not in session_id
+        assert json.loads(fake_redis.data[f"test:session:{session_id}"]) == {
+            "user": {"id": "u1"}
+        }
+        assert client.get("/whoami").text == "u1"
+
+    def test_unmodified_session_is_not_written_back(self, fake_redis):
+        client = _client()
+        session_id = client.get("/login").cookies["session"]
+        fake_redis.calls.clear()
+
+        response = client.get("/whoami")
+        assert fake_redis.calls == ["getex"]
+        assert response.cookies["session"] == session_id
+
+        response = client.get("/untouched")
+        assert fake_redis.calls == ["getex", "getex"]
+        assert response.cookies["session"] == session_id
+
+    def test_cookie_max_age_slides_with_ttl(self, fake_redis):
+        client = _client()
+        client.get("/login")
+        response = client.get("/untouched")
+        assert f"Max-Age={14 * 24 * 60 * 60}" in response.headers["set-cookie"]
+
+    def test_unknown_session_cookie_is_cleared(self, fake_redis):
+        client = _client()
+        client.cookies.set("session", "expired-id")
+        response = client.get("/whoami")
+        assert response.text == "anon"
+        assert "Max-Age=0" in response.headers["set-cookie"]
+        assert fake_redis.calls == ["getex"]
+
+    def test_nested_mutation_is_written_back(self, fake_redis):
+        client = _client()
+        client.get("/login")
+        key = next(iter(fake_redis.data))
+        fake_redis.data[key] = json.dumps(
+            {"user": {"id": "u1", "settings": {"language": "en"}}},
+            separators=(",", ":"),
+        )
+
+        client.get("/language")
+        assert json.loads(fake_redis.data[key])["user"]["settings"] == {
+            "language": "ca"
+        }
+
+    def test_bypass_prefixes_skip_redis(self, fake_redis):
+        client = _client()
+        client.get("/login")
+        fake_redis.calls.clear()
+
+        response = client.get("/static/app.css")
+        assert response.text == "anon"
+        assert fake_redis.calls == []
+
+    def test_unknown_session_id_is_not_adopted(self, fake_redis):
+        client = _client()
+        client.cookies.set("session", "attacker-chosen")
+        response = client.get("/login")
+        assert response.cookies["session"] != "attacker-chosen"
+        assert "test:session:attacker-chosen" not in fake_redis.data
+
+    def test_id_rotates_when_user_changes(self, fake_redis):
+        client = _client()
+        first = client.get("/login?id=u1").cookies["session"]
+        second = client.get("/login?id=u2").cookies["session"]
+        assert first != second
+        assert f"test:session:{first}" not in fake_redis.data
+        assert client.get("/whoami").text == "u2"
+
+    def test_clearing_deletes_key_and_cookie(self, fake_redis):
+        client = _client()
+        client.get("/login")
+        response = client.get("/logout")
+        assert fake_redis.data == {}
+        assert "Max-Age=0" in response.headers["set-cookie"]
+
+    def test_redis_outage_degrades_to_empty_session(self, monkeypatch):
+        async def get_client():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr("vibetuner.redis.get_redis_client", get_client)
+        client = _client()
+        client.cookies.set("session", "some-id")
+        assert client.get("/whoami").text == "anon"
+        response = client.get("/login")
+        assert response.status_code == 200
+        assert "set-cookie" not in response.headers
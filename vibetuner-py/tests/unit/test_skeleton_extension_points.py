@@ -55,6 +55,7 @@ def _make_env(child_body: str = "") -> Environment:
         undefined=ChainableUndefined,
     )
     env.globals["url_for"] = _stub_url_for
+    env.globals["static_url"] = lambda asset: f"/static/{asset}"
     env.globals["DEBUG"] = False
     env.globals["BODY_CLASS"] = ""
     env.globals["SKIP_HEADER"] = True
@@ -10,12 +10,15 @@ from unittest.mock import patch
 import pytest
 import pytest_asyncio
 from fastapi import APIRouter, Request
+from fastapi.sse import EventSourceResponse
 from starlette.requests import Request as StarletteRequest
 from vibetuner.sse import (
     _LISTENER_RECONNECT_CAP_DELAY,
     _LISTENER_RECONNECT_DELAY,
     _WORKER_ID,
     _channel_buffers,
+    _channel_counters,
+    _channels,
     _dispatch_local,
     _EventBuffer,
     _format_event,
@@ -23,7 +26,11 @@ from vibetuner.sse import (
     _parse_redis_message,
     _publish_to_redis,
     _stream_from_channel,
+    _subscribe,
+    _unsubscribe,
+    channel_counters,
     sse_endpoint,
+    sse_metrics,
     start_redis_listener,
 )
 
@@ -176,6 +183,344 @@ class TestStreamFromChannelResumption:
             _channel_buffers.pop(ch, None)
 
 
+class TestDispatchLocal:
+    def test_frame_is_encoded_once_and_shared(self):
+        ch = "test-shared-frame"
+        first = _subscribe(ch)
+        second = _subscribe(ch)
+        try:
+            with patch("vibetuner.sse._format_event", wraps=_format_event) as fmt:
+                _dispatch_local(ch, {"event": "msg", "data": "hi"})
+            assert fmt.call_count == 1
+            frame = first.get_nowait()
+            assert frame is second.get_nowait()
+            assert frame == b"event: msg\ndata: hi\n\n"
+        finally:
+            _unsubscribe(ch, first)
+            _unsubscribe(ch, second)
+
+    def test_frame_carries_buffered_event_id(self):
+        ch = "test-frame-id"
+        _channel_buffers[ch] = _EventBuffer(maxlen=10)
+        queue = _subscribe(ch)
+        try:
+            assert _dispatch_local(ch, {"event": "msg", "data": "hi"}) == 1
+            frame = queue.get_nowait()
+            assert isinstance(frame, bytes)
+            assert b"id: 1\n" in frame
+        finally:
+            _unsubscribe(ch, queue)
+            _channel_buffers.pop(ch, None)
+
+    def test_no_subscribers_skips_encoding(self):
+        with patch("vibetuner.sse._format_event") as fmt:
+            _dispatch_local("test-nobody", {"event": "msg", "data": "hi"})
+        fmt.assert_not_called()
+
+
+class TestKeepaliveTicker:
+    def test_only_idle_subscribers_get_keepalive(self):
+        from vibetuner.sse import _KEEPALIVE_FRAME, _keepalive_tick
+
+        idle = _subscribe("test-keepalive")
+        busy = _subscribe("test-keepalive-busy")
+        try:
+            # The first tick only marks subscribers as idle.
+            _dispatch_local("test-keepalive-busy", {"event": "msg", "data": "1"})
+            with patch("asyncio.get_running_loop"):
+                _keepalive_tick()
+                _dispatch_local("test-keepalive-busy", {"event": "msg", "data": "2"})
+                _keepalive_tick()
+                _keepalive_tick()
+
+            assert idle.get_nowait() is _KEEPALIVE_FRAME
+            assert idle.qsize() == 0
+            assert [busy.get_nowait() for _ in range(busy.qsize())] == [
+                b"event: msg\ndata: 1\n\n",
+                b"event: msg\ndata: 2\n\n",
+            ]
+        finally:
+            _unsubscribe("test-keepalive", idle)
+            _unsubscribe("test-keepalive-busy", busy)
+
+    @pytest.mark.asyncio
+    async def test_ticker_wakes_idle_stream(self, monkeypatch):
+        from vibetuner.sse import _KEEPALIVE_FRAME
+
+        monkeypatch.setattr("vibetuner.config.settings.sse.keepalive_interval", 0.01)
+        gen = _stream_from_channel("test-keepalive-stream")
+        try:
+            assert await asyncio.wait_for(anext(gen), timeout=1) == _KEEPALIVE_FRAME
+        finally:
+            await gen.aclose()
+
+
+class TestBroadcastCoalescing:
+    @pytest.mark.asyncio
+    async def test_only_latest_event_in_window_is_sent(self):
+        from vibetuner.sse import broadcast
+
+        sub = _subscribe("test-coalesce")
+        try:
+            for pct in range(1, 101):
+                await broadcast(
+                    "test-coalesce", "progress", data=f"{pct}%", coalesce_ms=10
+                )
+            await broadcast("test-coalesce", "done", data="ok", coalesce_ms=10)
+            assert sub.qsize() == 0
+
+            await asyncio.sleep(0.05)
+            frames = {sub.get_nowait() for _ in range(sub.qsize())}
+            assert frames == {
+                b"event: progress\ndata: 100%\n\n",
+                b"event: done\ndata: ok\n\n",
+            }
+        finally:
+            _unsubscribe("test-coalesce", sub)
+
+    @pytest.mark.asyncio
+    async def test_template_is_rendered_once_per_window(self):
+        from vibetuner.sse import broadcast
+
+        sub = _subscribe("test-coalesce-tpl")
+        try:
+            with patch(
+                "vibetuner.sse.render_template_string", return_value="<p>3</p>"
+            ) as render:
+                for n in range(3):
+                    await broadcast(
+                        "test-coalesce-tpl",
+                        "count",
+                        template="count.html.jinja",
+                        request=_make_request(),
+                        ctx={"n": n},
+                        coalesce_ms=10,
+                    )
+                await asyncio.sleep(0.05)
+            render.assert_called_once()
+            assert render.call_args.args[2] == {"n": 2}
+            assert sub.get_nowait() == b"event: count\ndata: <p>3</p>\n\n"
+        finally:
+            _unsubscribe("test-coalesce-tpl", sub)
+
+
+class TestBroadcastMany:
+    @pytest.mark.asyncio
+    async def test_dispatches_and_publishes_in_one_pipeline(self, monkeypatch):
+        import vibetuner.sse as sse
+        from vibetuner.sse import broadcast_many
+
+        pipe = _FakePipeline()
+
+        class _Client:
+            def pipeline(self, transaction=True):
+                return pipe
+
+        monkeypatch.setattr(sse, "_redis_publish_client", _Client())
+        monkeypatch.setattr("vibetuner.config.settings.redis_key_prefix", "app:")
+        subs = {ch: _subscribe(ch) for ch in ("user:1", "user:2")}
+        try:
+            await broadcast_many([("user:1", "ping", "a"), ("user:2", "ping", "b")])
+            assert subs["user:1"].get_nowait() == b"event: ping\ndata: a\n\n"
+            assert subs["user:2"].get_nowait() == b"event: ping\ndata: b\n\n"
+        finally:
+            for ch, sub in subs.items():
+                _unsubscribe(ch, sub)
+
+        assert pipe.executed == 1
+        assert [ch for ch, _ in pipe.published] == ["app:sse:user:1", "app:sse:user:2"]
+        assert json.loads(pipe.published[0][1])["_origin"] == _WORKER_ID
+
+    @pytest.mark.asyncio
+    async def test_shared_template_is_rendered_once(self):
+        from vibetuner.sse import broadcast_many
+
+        subs = {ch: _subscribe(ch) for ch in ("user:3", "user:4")}
+        try:
+            with patch(
+                "vibetuner.sse.render_template_string", return_value="<b>team</b>"
+            ) as render:
+                await broadcast_many(
+                    [("user:3", "team", ""), ("user:4", "team", "")],
+                    template="team.html.jinja",
+                    request=_make_request(),
+                )
+            render.assert_called_once()
+            for sub in subs.values():
+                assert sub.get_nowait() == b"event: team\ndata: <b>team</b>\n\n"
+        finally:
+            for ch, sub in subs.items():
+                _unsubscribe(ch, sub)
+
+    @pytest.mark.asyncio
+    async def test_invalid_channel_rejects_whole_batch(self):
+        from vibetuner.sse import broadcast_many
+
+        sub = _subscribe("user:5")
+        try:
+            with pytest.raises(ValueError):
+                await broadcast_many([("user:5", "x", "1"), ("bad channel", "x", "2")])
+            assert sub.qsize() == 0
+        finally:
+            _unsubscribe("user:5", sub)
+
+
+class TestSseMetrics:
+    @pytest.mark.asyncio
+    async def test_reports_subscribers_queues_and_throughput(self):
+        from vibetuner.sse import sse_metrics
+
+        before = sse_metrics()
+        idle = _subscribe("test-metrics")
+        reader = _subscribe("test-metrics")
+        gen = _stream_from_channel("test-metrics-out")
+        try:
+            _dispatch_local("test-metrics", {"event": "msg", "data": "a"})
+            _dispatch_local("test-metrics", {"event": "msg", "data": "b"})
+            reader.get_nowait()
+            task = asyncio.ensure_future(anext(gen))
+            await asyncio.sleep(0)
+            _dispatch_local("test-metrics-out", {"event": "msg", "data": "c"})
+            frame = await asyncio.wait_for(task, timeout=1)
+
+            metrics = sse_metrics()
+            assert metrics["channels"]["test-metrics"] == {
+                "subscribers": 2,
+                "queued": 3,
+                "max_queue_depth": 2,
+                "dropped": 0,
+                "disconnected": 0,
+            }
+            assert metrics["connections"] == before["connections"] + 3
+            assert metrics["events_in"] == before["events_in"] + 3
+            assert metrics["events_out"] == before["events_out"] + 1
+            assert metrics["bytes_out"] == before["bytes_out"] + len(frame)
+        finally:
+            await gen.aclose()
+            _unsubscribe("test-metrics", idle)
+            _unsubscribe("test-metrics", reader)
+
+    def test_prometheus_exposition(self):
+        from vibetuner.sse import sse_metrics_prometheus
+
+        sub = _subscribe('test-"prom"')
+        try:
+            text = sse_metrics_prometheus()
+        finally:
+            _unsubscribe('test-"prom"', sub)
+        assert "# TYPE vibetuner_sse_connections gauge" in text
+        assert 'vibetuner_sse_channel_subscribers{channel="test-\\"prom\\""} 1' in text
+        assert "# TYPE vibetuner_sse_listener_reconnects_total counter" in text
+        assert "# TYPE vibetuner_sse_dropped_total counter" in text
+        assert "\nvibetuner_sse_disconnected_total " in text
+        assert text.endswith("\n")
+
+
+class TestSlowConsumerPolicies:
+    @staticmethod
+    def _fill(ch: str, events: list[tuple[str, str]]) -> None:
+        for event, data in events:
+            _dispatch_local(ch, {"event": event, "data": data})
+
+    @staticmethod
+    def _drain(sub) -> list[bytes]:
+        frames = []
+        while sub.qsize():
+            frames.append(sub.get_nowait())
+        return frames
+
+    def test_drop_oldest_keeps_newest_frames(self):
+        ch = "test-drop-oldest"
+        sub = _subscribe(ch, maxsize=2, policy="drop_oldest")
+        try:
+            self._fill(ch, [("msg", "1"), ("msg", "2"), ("msg", "3")])
+            assert self._drain(sub) == [
+                b"event: msg\ndata: 2\n\n",
+                b"event: msg\ndata: 3\n\n",
+            ]
+            assert channel_counters()[ch] == {"dropped": 1, "disconnected": 0}
+        finally:
+            _unsubscribe(ch, sub)
+            _channel_counters.pop(ch, None)
+
+    def test_coalesce_keeps_latest_per_event_name(self):
+        ch = "test-coalesce"
+        sub = _subscribe(ch, maxsize=3, policy="coalesce")
+        try:
+            self._fill(
+                ch,
+                [
+                    ("progress", "1"),
+                    ("status", "a"),
+                    ("progress", "2"),
+                    ("progress", "3"),
+                ],
+            )
+            assert self._drain(sub) == [
+                b"event: status\ndata: a\n\n",
+                b"event: progress\ndata: 3\n\n",
+            ]
+            assert channel_counters()[ch]["dropped"] == 2
+        finally:
+            _unsubscribe(ch, sub)
+            _channel_counters.pop(ch, None)
+
+    def test_coalesce_falls_back_to_dropping_oldest(self):
+        ch = "test-coalesce-distinct"
+        sub = _subscribe(ch, maxsize=2, policy="coalesce")
+        try:
+            self._fill(ch, [("a", "1"), ("b", "2"), ("c", "3")])
+            assert self._drain(sub) == [
+                b"event: b\ndata: 2\n\n",
+                b"event: c\ndata: 3\n\n",
+            ]
+        finally:
+            _unsubscribe(ch, sub)
+            _channel_counters.pop(ch, None)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_ends_the_stream(self):
+        ch = "test-disconnect"
+        before = sse_metrics()["disconnected"]
+        gen = _stream_from_channel(ch, queue_size=1, slow_consumer_policy="disconnect")
+        first = asyncio.ensure_future(gen.__anext__())
+        await asyncio.sleep(0.01)
+        try:
+            self._fill(ch, [("msg", "1")])
+            assert await asyncio.wait_for(first, 1.0) == b"event: msg\ndata: 1\n\n"
+            # The client is now behind by more than one event.
+            self._fill(ch, [("msg", "2"), ("msg", "3")])
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(gen.__anext__(), 1.0)
+            # The channel's own counters leave with its last subscriber.
+            assert ch not in _channels
+            assert ch not in channel_counters()
+            assert sse_metrics()["disconnected"] == before + 1
+        finally:
+            await gen.aclose()
+            _channel_counters.pop(ch, None)
+
+    def test_counters_are_pruned_with_the_channel(self):
+        ch = "test-prune"
+        before = sse_metrics()["dropped"]
+        sub = _subscribe(ch, maxsize=1, policy="drop_oldest")
+        self._fill(ch, [("msg", "1"), ("msg", "2")])
+        assert channel_counters()[ch]["dropped"] == 1
+        _unsubscribe(ch, sub)
+        assert ch not in channel_counters()
+        assert sse_metrics()["dropped"] == before + 1
+
+    def test_unbounded_when_size_is_zero(self):
+        ch = "test-unbounded"
+        sub = _subscribe(ch, maxsize=0)
+        try:
+            self._fill(ch, [("msg", str(i)) for i in range(500)])
+            assert sub.qsize() == 500
+            assert ch not in channel_counters()
+        finally:
+            _unsubscribe(ch, sub)
+
+
 class TestSseEndpointBuffering:
     def test_sse_endpoint_with_buffer_size_creates_buffer(self):
         router = APIRouter()
@@ -200,6 +545,150 @@ class TestSseEndpointBuffering:
         assert "no-buf-test" not in _channel_buffers
 
 
+class _User:
+    is_authenticated = True
+
+    def __init__(self, user_id: str) -> None:
+        self.id = user_id
+
+
+def _user_request(user_id: str) -> StarletteRequest:
+    request = _make_request()
+    request.scope["user"] = _User(user_id)
+    return request
+
+
+class TestConnectionLimits:
+    @pytest.mark.asyncio
+    async def test_channel_limit_sends_retry_hint(self, monkeypatch):
+        from vibetuner.sse import connection_accounting
+
+        monkeypatch.setattr("vibetuner.config.settings.sse.over_limit_retry_after", 2)
+
+        @sse_endpoint("/limited", channel="limited", max_connections_per_channel=1)
+        async def stream(request: Request):
+            pass
+
+        before = connection_accounting()
+        first = await stream(request=_make_request())
+        refused = await stream(request=_make_request())
+        assert refused.status_code == 200
+        retry_ms = int(refused.body.decode().removeprefix("retry: "))
+        assert 2000 <= retry_ms <= 4000
+        assert connection_accounting()["connections"] == before["connections"] + 1
+        assert connection_accounting()["rejected"] == before["rejected"] + 1
+
+        # Dropping a response that never streamed still frees its slot.
+        del first
+        second = await stream(request=_make_request())
+        assert isinstance(second, EventSourceResponse)
+        await second.body_iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_user_limit_answers_503(self, monkeypatch):
+        monkeypatch.setattr("vibetuner.config.settings.sse.max_connections_per_user", 1)
+        monkeypatch.setattr("vibetuner.config.settings.sse.over_limit_response", "503")
+
+        @sse_endpoint("/per-user", channel="per-user")
+        async def stream(request: Request):
+            pass
+
+        mine = await stream(request=_user_request("u1"))
+        refused = await stream(request=_user_request("u1"))
+        other = await stream(request=_user_request("u2"))
+        anonymous = await stream(request=_make_request())
+        try:
+            assert refused.status_code == 503
+            assert int(refused.headers["retry-after"]) >= 5
+            assert isinstance(other, EventSourceResponse)
+            assert isinstance(anonymous, EventSourceResponse)
+        finally:
+            for response in (mine, other, anonymous):
+                await response.body_iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_worker_limit_covers_generator_endpoints(self, monkeypatch):
+        from vibetuner.sse import connection_accounting
+
+        monkeypatch.setattr(
+            "vibetuner.config.settings.sse.max_connections",
+            connection_accounting()["connections"] + 1,
+        )
+
+        @sse_endpoint("/gen-limited")
+        async def stream(request: Request):
+            yield {"event": "tick", "data": "1"}
+
+        first = await stream(request=_make_request())
+        refused = await stream(request=_make_request())
+        assert refused.body.startswith(b"retry: ")
+
+        assert [chunk async for chunk in first.body_iterator]
+        second = await stream(request=_make_request())
+        assert isinstance(second, EventSourceResponse)
+        await second.body_iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_cannot_overshoot_limit(self, monkeypatch):
+        async def slow_buffer(channel, buffer_size):
+            await asyncio.sleep(0)
+
+        monkeypatch.setattr("vibetuner.sse._ensure_replay_buffer", slow_buffer)
+
+        @sse_endpoint(
+            "/racy",
+            channel="racy",
+            buffer_size=10,
+            max_connections_per_channel=1,
+        )
+        async def stream(request: Request):
+            pass
+
+        try:
+            responses = await asyncio.gather(
+                stream(request=_make_request()), stream(request=_make_request())
+            )
+            admitted = [r for r in responses if isinstance(r, EventSourceResponse)]
+            assert len(admitted) == 1
+            await admitted[0].body_iterator.aclose()
+        finally:
+            _channel_buffers.pop("racy", None)
+
+    @pytest.mark.asyncio
+    async def test_failed_setup_releases_slot(self, monkeypatch):
+        from vibetuner.sse import connection_accounting
+
+        async def broken_buffer(channel, buffer_size):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr("vibetuner.sse._ensure_replay_buffer", broken_buffer)
+
+        @sse_endpoint("/broken", channel="broken", buffer_size=10)
+        async def stream(request: Request):
+            pass
+
+        before = connection_accounting()["connections"]
+        try:
+            with pytest.raises(ConnectionError):
+                await stream(request=_make_request())
+            assert connection_accounting()["connections"] == before
+        finally:
+            _channel_buffers.pop("broken", None)
+
+    @pytest.mark.asyncio
+    async def test_health_reports_connection_accounting(self):
+        from vibetuner.frontend.routes.health import health_check
+
+        body = await health_check()
+        assert set(body["sse"]) == {
+            "connections",
+            "max_connections",
+            "channels",
+            "users",
+            "rejected",
+        }
+
+
 class TestSseAntiBufferingHeaders:
     """SSE responses must defeat proxy/CDN buffering (Caddy, nginx, Cloudflare).
 
@@ -234,11 +723,11 @@ class TestSseAntiBufferingHeaders:
             await response.body_iterator.aclose()
 
 
-def _redis_pmessage(prefix: str, channel: str, payload: dict) -> dict:
-    """Build a Redis pmessage dict as redis-py delivers it to the listen loop."""
+def _redis_message(prefix: str, channel: str, payload: dict) -> dict:
+    """Build a Redis message dict as redis-py delivers it to the listen loop."""
     return {
-        "type": "pmessage",
-        "pattern": f"{prefix}*".encode(),
+        "type": "message",
+        "pattern": None,
         "channel": f"{prefix}{channel}".encode(),
         "data": json.dumps(payload).encode(),
     }
@@ -253,7 +742,7 @@ class TestRedisLoopbackDedup:
     """
 
     def test_parse_skips_own_published_message(self):
-        msg = _redis_pmessage(
+        msg = _redis_message(
             "app:sse:",
             "room",
             {"event": "update", "data": "1", "_origin": _WORKER_ID},
@@ -261,7 +750,7 @@ class TestRedisLoopbackDedup:
         assert _parse_redis_message(msg, "app:sse:") is None
 
     def test_parse_dispatches_foreign_message(self):
-        msg = _redis_pmessage(
+        msg = _redis_message(
             "app:sse:",
             "room",
             {"event": "update", "data": "1", "_origin": "some-other-worker"},
@@ -274,7 +763,7 @@ class TestRedisLoopbackDedup:
 
     def test_parse_dispatches_message_without_origin(self):
         # Messages from a publisher that predates origin tagging must still flow.
-        msg = _redis_pmessage("app:sse:", "room", {"event": "update", "data": "1"})
+        msg = _redis_message("app:sse:", "room", {"event": "update", "data": "1"})
         parsed = _parse_redis_message(msg, "app:sse:")
         assert parsed is not None
         _, payload = parsed
@@ -303,13 +792,13 @@ class TestRedisLoopbackDedup:
 
 class _FakePubSub:
     def __init__(self) -> None:
-        self.patterns: list[str] = []
+        self.channels: list[str] = []
 
-    async def psubscribe(self, pattern: str) -> None:
-        self.patterns.append(pattern)
+    async def subscribe(self, channel: str) -> None:
+        self.channels.append(channel)
 
-    async def punsubscribe(self) -> None:
-        pass
+    async def unsubscribe(self, channel: str) -> None:
+        self.channels.remove(channel)
 
     async def listen(self):
         while True:
@@ -336,12 +825,12 @@ class _FlakyPubSub:
         self._subscribed = subscribed
         self._reconnected = reconnected
 
-    async def psubscribe(self, pattern: str) -> None:
-        self._subscribed.append(pattern)
+    async def subscribe(self, channel: str) -> None:
+        self._subscribed.append(channel)
         if len(self._subscribed) >= 2:
             self._reconnected.set()
 
-    async def punsubscribe(self) -> None:
+    async def unsubscribe(self, channel: str) -> None:
         pass
 
     async def aclose(self) -> None:
@@ -472,8 +961,233 @@ class TestRedisListenerLifecycle:
         assert len(subscribed) >= 2
 
 
-class _PsubFailPubSub:
-    """Fake pub/sub whose psubscribe raises RedisError until `fail_until` phases have passed."""
+class TestRedisSubscriptionRefCounting:
+    """Workers SUBSCRIBE only to channels with local subscribers."""
+
+    @staticmethod
+    async def _settle() -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_first_and_last_subscriber_drive_subscriptions(
+        self, sse_module, monkeypatch
+    ):
+        sse = sse_module
+        _enable_redis(monkeypatch)
+        monkeypatch.setattr("vibetuner.config.settings.redis_key_prefix", "app:")
+        client = _FakeClient()
+        monkeypatch.setattr("vibetuner.redis.create_redis_client", lambda: client)
+        pubsub = client.pubsub()
+
+        await start_redis_listener()
+        await self._settle()
+        assert pubsub.channels == [f"app:sse:{sse._CONTROL_CHANNEL}"]
+
+        first = _subscribe("room:1")
+        second = _subscribe("room:1")
+        await self._settle()
+        assert pubsub.channels.count("app:sse:room:1") == 1
+
+        _unsubscribe("room:1", first)
+        await self._settle()
+        assert "app:sse:room:1" in pubsub.channels
+
+        _unsubscribe("room:1", second)
+        await self._settle()
+        assert "app:sse:room:1" not in pubsub.channels
+
+    @pytest.mark.asyncio
+    async def test_existing_channels_are_subscribed_on_connect(
+        self, sse_module, monkeypatch
+    ):
+        _enable_redis(monkeypatch)
+        monkeypatch.setattr("vibetuner.config.settings.redis_key_prefix", "app:")
+        client = _FakeClient()
+        monkeypatch.setattr("vibetuner.redis.create_redis_client", lambda: client)
+
+        sub = _subscribe("room:early")
+        try:
+            await start_redis_listener()
+            await self._settle()
+            assert "app:sse:room:early" in client.pubsub().channels
+        finally:
+            _unsubscribe("room:early", sub)
+
+    def test_pattern_messages_are_ignored(self):
+        msg = _redis_message("app:sse:", "room", {"event": "update", "data": "1"})
+        msg["type"] = "pmessage"
+        assert _parse_redis_message(msg, "app:sse:") is None
+
+
+class _FakePipeline:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str]] = []
+        self.results: list = []
+        self.executed = 0
+
+    def publish(self, channel: str, data: str):
+        self.published.append((channel, data))
+        self.results.append(0)
+        return self
+
+    async def execute(self):
+        self.executed += 1
+        return self.results
+
+
+class _FakeStreamClient:
+    """Publish client exposing the Redis Streams calls used for replay."""
+
+    def __init__(self, entries=()) -> None:
+        self.entries = list(entries)
+        self.script_calls: list[tuple[list, list]] = []
+        self.xrange_calls: list[tuple[str, str, int]] = []
+        self.sets: dict[str, tuple] = {}
+
+    def register_script(self, script: str):
+        async def run(keys, args, client=None):
+            self.script_calls.append((keys, args))
+            if client is not None:
+                client.results.append(b"1700000000000-%d" % len(client.results))
+                return client
+            return b"1700000000000-0"
+
+        return run
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline()
+
+    async def xrange(self, name, min="-", max="+", count=None):
+        self.xrange_calls.append((name, min, count))
+        return self.entries
+
+    async def set(self, key, value, ex=None):
+        self.sets[key] = (value, ex)
+
+
+class TestRedisStreamReplay:
+    """SSE_BUFFER_BACKEND=redis keeps replay buffers in Redis Streams."""
+
+    @pytest.fixture
+    def stream_client(self, monkeypatch):
+        import vibetuner.sse as sse
+
+        _enable_redis(monkeypatch)
+        monkeypatch.setattr("vibetuner.config.settings.redis_key_prefix", "app:")
+        monkeypatch.setattr("vibetuner.config.settings.sse.buffer_backend", "redis")
+        client = _FakeStreamClient(
+            [
+                (b"1700000000000-1", {b"event": b"msg", b"data": b"b"}),
+                (b"1700000000000-2", {b"event": b"msg", b"data": b"c"}),
+            ]
+        )
+        monkeypatch.setattr(sse, "_redis_publish_client", client)
+        monkeypatch.setattr(sse, "_stream_publish_script", None)
+        yield client
+        sse._stream_channels.clear()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_uses_stream_id(self, stream_client):
+        from vibetuner.sse import broadcast
+
+        sub = _subscribe("room")
+        try:
+            await broadcast("room", "msg", data="hi")
+            frame = sub.get_nowait()
+            assert isinstance(frame, bytes)
+            assert b"id: 1700000000000-0\n" in frame
+        finally:
+            _unsubscribe("room", sub)
+
+        keys, args = stream_client.script_calls[0]
+        assert keys == ["app:sse-stream-maxlen:room", "app:sse-stream:room"]
+        assert args[0] == "app:sse:room"
+        assert json.loads(args[1])["_origin"] == _WORKER_ID
+
+    @pytest.mark.asyncio
+    async def test_endpoint_registers_stream_instead_of_memory_buffer(
+        self, stream_client
+    ):
+        router = APIRouter()
+
+        @sse_endpoint("/stream", channel="streamed", buffer_size=20, router=router)
+        async def stream(request: Request):
+            pass
+
+        assert "streamed" not in _channel_buffers
+        response = await stream(request=_make_request("/stream"))
+        await response.body_iterator.aclose()
+        assert stream_client.sets["app:sse-stream-maxlen:streamed"] == (20, 86400)
+
+    @pytest.mark.asyncio
+    async def test_replays_entries_after_last_event_id(self, stream_client):
+        import vibetuner.sse as sse
+
+        sse._stream_channels["room"] = 20
+        gen = _stream_from_channel("room", last_event_id="1700000000000-0")
+        first = await anext(gen)
+        second = await anext(gen)
+        try:
+            assert first == b"event: msg\ndata: b\nid: 1700000000000-1\n\n"
+            assert b"id: 1700000000000-2\n" in second
+            assert stream_client.xrange_calls == [
+                ("app:sse-stream:room", "(1700000000000-0", 20)
+            ]
+
+            # Live copies of replayed entries are skipped, newer ones flow.
+            _dispatch_local(
+                "room", {"event": "msg", "data": "c", "id": "1700000000000-2"}
+            )
+            _dispatch_local(
+                "room", {"event": "msg", "data": "d", "id": "1700000000000-3"}
+            )
+            assert b"data: d\n" in await anext(gen)
+        finally:
+            await gen.aclose()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_many_pipelines_stream_publishes(self, stream_client):
+        from vibetuner.sse import broadcast_many
+
+        first, second = _subscribe("team:a"), _subscribe("team:b")
+        try:
+            await broadcast_many([("team:a", "msg", "1"), ("team:b", "msg", "2")])
+            first_frame, second_frame = first.get_nowait(), second.get_nowait()
+            assert isinstance(first_frame, bytes)
+            assert isinstance(second_frame, bytes)
+            assert b"id: 1700000000000-0\n" in first_frame
+            assert b"id: 1700000000000-1\n" in second_frame
+        finally:
+            _unsubscribe("team:a", first)
+            _unsubscribe("team:b", second)
+        assert [keys[1] for keys, _ in stream_client.script_calls] == [
+            "app:sse-stream:team:a",
+            "app:sse-stream:team:b",
+        ]
+
+    def test_last_event_id_accepts_stream_ids(self):
+        from vibetuner.sse import _parse_last_event_id
+
+        def parse(value: str):
+            request = StarletteRequest(
+                {
+                    "type": "http",
+                    "method": "GET",
+                    "path": "/events",
+                    "headers": [(b"last-event-id", value.encode())],
+                    "query_string": b"",
+                }
+            )
+            return _parse_last_event_id(request)
+
+        assert parse("42") == 42
+        assert parse("1700000000000-5") == "1700000000000-5"
+        assert parse("nope") is None
+
+
+class _SubFailPubSub:
+    """Fake pub/sub whose subscribe raises RedisError until `fail_until` phases have passed."""
 
     def __init__(
         self, phase: int, done: asyncio.Event, real_sleep, fail_until: int
@@ -483,11 +1197,11 @@ class _PsubFailPubSub:
         self._real_sleep = real_sleep
         self._fail_until = fail_until
 
-    async def psubscribe(self, _pattern: str) -> None:
+    async def subscribe(self, _channel: str) -> None:
         from redis.exceptions import RedisError
 
         if self._phase < self._fail_until:
-            raise RedisError(f"psubscribe failure phase {self._phase}")
+            raise RedisError(f"subscribe failure phase {self._phase}")
 
     async def aclose(self) -> None:
         pass
@@ -501,8 +1215,8 @@ class _PsubFailPubSub:
             yield {}  # pragma: no cover
 
 
-class _PsubFailClient:
-    """Fake Redis client that pairs with _PsubFailPubSub."""
+class _SubFailClient:
+    """Fake Redis client that pairs with _SubFailPubSub."""
 
     def __init__(
         self, phase: int, done: asyncio.Event, real_sleep, fail_until: int
@@ -512,8 +1226,8 @@ class _PsubFailClient:
         self._real_sleep = real_sleep
         self._fail_until = fail_until
 
-    def pubsub(self) -> _PsubFailPubSub:
-        return _PsubFailPubSub(
+    def pubsub(self) -> _SubFailPubSub:
+        return _SubFailPubSub(
             self._phase, self._done, self._real_sleep, self._fail_until
         )
 
@@ -522,18 +1236,18 @@ class _PsubFailClient:
 
 
 class _MixedPhasePubSub:
-    """Fake pub/sub: psubscribe fails in phase 0, listen fails in phase 1, stable in phase 2+."""
+    """Fake pub/sub: subscribe fails in phase 0, listen fails in phase 1, stable in phase 2+."""
 
     def __init__(self, phase: int, done: asyncio.Event, real_sleep) -> None:
         self._phase = phase
         self._done = done
         self._real_sleep = real_sleep
 
-    async def psubscribe(self, _pattern: str) -> None:
+    async def subscribe(self, _channel: str) -> None:
         from redis.exceptions import RedisError
 
         if self._phase == 0:
-            raise RedisError("phase 0: psubscribe fails, delay grows")
+            raise RedisError("phase 0: subscribe fails, delay grows")
 
     async def aclose(self) -> None:
         pass
@@ -542,7 +1256,7 @@ class _MixedPhasePubSub:
         from redis.exceptions import RedisError
 
         if self._phase == 1:
-            raise RedisError("phase 1: listen fails after psubscribe recovery")
+            raise RedisError("phase 1: listen fails after subscribe recovery")
         self._done.set()
         while True:
             await self._real_sleep(3600)
@@ -618,12 +1332,12 @@ class TestRedisListenerBackoff:
         assert "lost connection" in warning_call
 
     @pytest.mark.asyncio
-    async def test_backoff_delay_grows_when_psubscribe_fails(
+    async def test_backoff_delay_grows_when_subscribe_fails(
         self, sse_module, monkeypatch
     ):
-        """When psubscribe itself keeps failing (Redis stays down), sleep grows each attempt.
+        """When subscribe itself keeps failing (Redis stays down), sleep grows each attempt.
 
-        The delay resets only after psubscribe succeeds, so consecutive psubscribe
+        The delay resets only after subscribe succeeds, so consecutive subscribe
         failures accumulate backoff rather than starting over.
         """
         _enable_redis(monkeypatch)
@@ -639,31 +1353,31 @@ class TestRedisListenerBackoff:
         done = asyncio.Event()
         call_count = [0]
 
-        def make_client() -> _PsubFailClient:
+        def make_client() -> _SubFailClient:
             n = call_count[0]
             call_count[0] += 1
-            return _PsubFailClient(n, done, real_sleep, fail_until=2)
+            return _SubFailClient(n, done, real_sleep, fail_until=2)
 
         monkeypatch.setattr("vibetuner.redis.create_redis_client", make_client)
 
         await start_redis_listener()
         await asyncio.wait_for(done.wait(), timeout=2)
 
-        # Phase 0 psubscribe fails → sleep(1.0) → delay=2.0
-        # Phase 1 psubscribe fails → sleep(2.0) → delay=4.0
-        # Phase 2 psubscribe succeeds → stable (sets done)
+        # Phase 0 subscribe fails → sleep(1.0) → delay=2.0
+        # Phase 1 subscribe fails → sleep(2.0) → delay=4.0
+        # Phase 2 subscribe succeeds → stable (sets done)
         assert len(sleep_calls) >= 2
         assert sleep_calls[0] == _LISTENER_RECONNECT_DELAY
         assert sleep_calls[1] == _next_reconnect_delay(_LISTENER_RECONNECT_DELAY)
         assert sleep_calls[1] > sleep_calls[0]
 
     @pytest.mark.asyncio
-    async def test_backoff_resets_after_successful_psubscribe(
+    async def test_backoff_resets_after_successful_subscribe(
         self, sse_module, monkeypatch
     ):
-        """Once psubscribe succeeds (Redis is back), delay resets so the next failure starts fresh.
+        """Once subscribe succeeds (Redis is back), delay resets so the next failure starts fresh.
 
-        Scenario: psubscribe fails once (delay grows to 2s), then psubscribe succeeds
+        Scenario: subscribe fails once (delay grows to 2s), then subscribe succeeds
         but listen drops the connection. The sleep before the third attempt is back
         at base (1s) rather than the accumulated 2s.
         """
@@ -690,9 +1404,120 @@ class TestRedisListenerBackoff:
         await start_redis_listener()
         await asyncio.wait_for(done.wait(), timeout=2)
 
-        # Phase 0: psubscribe fails → sleep(1.0) → delay becomes 2.0
-        # Phase 1: psubscribe succeeds → delay resets to 1.0 → listen fails → sleep(1.0)
+        # Phase 0: subscribe fails → sleep(1.0) → delay becomes 2.0
+        # Phase 1: subscribe succeeds → delay resets to 1.0 → listen fails → sleep(1.0)
         # Without the reset the second sleep would be 2.0 (accumulated backoff).
         assert len(sleep_calls) >= 2
         assert sleep_calls[0] == _LISTENER_RECONNECT_DELAY
         assert sleep_calls[1] == _LISTENER_RECONNECT_DELAY  # reset, not doubled
+
+
+def _request_in(language: str) -> StarletteRequest:
+    request = _make_request()
+    request.state.language = language
+    return request
+
+
+class TestPerSubscriberRendering:
+    """broadcast(per_subscriber=True) renders once per distinct variant."""
+
+    @pytest.fixture
+    def renders(self, monkeypatch):
+        calls: list[tuple[str, str]] = []
+
+        def fake_render(template, request, ctx):
+            calls.append((template, request.state.language))
+            return f"{request.state.language}:{ctx['n']}"
+
+        monkeypatch.setattr("vibetuner.sse.render_template_string", fake_render)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_renders_once_per_language(self, renders):
+        from vibetuner.sse import broadcast
+
+        requests = [_request_in(lang) for lang in ("en", "ca", "en", "en")]
+        streams = [
+            _stream_from_channel("orders", request=request) for request in requests
+        ]
+        pending = [asyncio.ensure_future(anext(stream)) for stream in streams]
+        await asyncio.sleep(0)
+        try:
+            await broadcast(
+                "orders",
+                "row",
+                template="row.html.jinja",
+                ctx={"n": 7},
+                per_subscriber=True,
+            )
+            frames = await asyncio.gather(*pending)
+        finally:
+            for stream in streams:
+                await stream.aclose()
+
+        assert frames[0] == frames[2] == frames[3] == b"event: row\ndata: en:7\n\n"
+        assert frames[1] == b"event: row\ndata: ca:7\n\n"
+        assert sorted(renders) == [("row.html.jinja", "ca"), ("row.html.jinja", "en")]
+
+    @pytest.mark.asyncio
+    async def test_vary_key_splits_renderings(self, renders):
+        sub = _subscribe("orders")
+        _dispatch_local(
+            "orders", {"event": "row", "template": "row.html.jinja", "ctx": {"n": 2}}
+        )
+        try:
+            deferred = sub.get_nowait()
+        finally:
+            _unsubscribe("orders", sub)
+
+        request = _request_in("en")
+        assert deferred.render(request, "admin") == deferred.render(request, "admin")
+        deferred.render(request, "viewer")
+        assert len(renders) == 2
+
+    @pytest.mark.asyncio
+    async def test_endpoint_vary_and_buffered_replay(self, renders):
+        calls: list[str] = []
+
+        def role(request):
+            calls.append("vary")
+            return "admin"
+
+        @sse_endpoint("/orders", channel="orders-replay", buffer_size=5, vary=role)
+        async def stream(request: Request):
+            pass
+
+        try:
+            _dispatch_local(
+                "orders-replay",
+                {"event": "row", "template": "row.html.jinja", "ctx": {"n": 3}},
+            )
+            request = _request_in("es")
+            request.scope["headers"] = [(b"last-event-id", b"0")]
+            response = await stream(request=request)
+            first = await anext(response.body_iterator)
+            await response.body_iterator.aclose()
+        finally:
+            _channel_buffers.pop("orders-replay", None)
+
+        assert first == b"event: row\ndata: es:3\nid: 1\n\n"
+        assert calls == ["vary"]
+
+    @pytest.mark.asyncio
+    async def test_requires_template_but_not_request(self):
+        from vibetuner.sse import broadcast
+
+        with pytest.raises(ValueError, match="require a template"):
+            await broadcast("orders", "row", per_subscriber=True)
+        await broadcast("orders", "row", template="row.html.jinja", per_subscriber=True)
+
+    def test_redis_message_keeps_template_and_ctx(self):
+        msg = _redis_message(
+            "app:sse:",
+            "orders",
+            {"event": "row", "template": "row.html.jinja", "ctx": {"n": 1}},
+        )
+        assert _parse_redis_message(msg, "app:sse:") == (
+            "orders",
+            {"event": "row", "data": "", "template": "row.html.jinja", "ctx": {"n": 1}},
+        )
@@ -0,0 +1,120 @@
+# ABOUTME: Tests for the versioned static files mount.
+# ABOUTME: Covers immutable caching, in-memory serving, strong ETags, and Range requests.
+# ruff: noqa: S101
+
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+from vibetuner.frontend.staticfiles import (
+    IMMUTABLE_CACHE_CONTROL,
+    VersionedStaticFiles,
+)
+
+
+CSS = "body { color: red; }\n" * 100
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "bundle.css").write_text(CSS)
+    (tmp_path / "big.js").write_text("x" * 4096)
+    return tmp_path
+
+
+def _client(directory, **kwargs) -> tuple[TestClient, VersionedStaticFiles]:
+    statics = VersionedStaticFiles(directory=directory, **kwargs)
+    app = Starlette(routes=[Mount("/static/v1/css", app=statics)])
+    return TestClient(app), statics
+
+
+def test_responses_are_immutable(static_dir):
+    client, _ = _client(static_dir)
+    response = client.get("/static/v1/css/bundle.css")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.text == CSS
+
+
+def test_small_files_are_served_from_memory(static_dir):
+    client, statics = _client(static_dir)
+    first = client.get("/static/v1/css/bundle.css")
+    (static_dir / "bundle.css").unlink()
+
+    second = client.get("/static/v1/css/bundle.css")
+    assert second.status_code == 200
+    assert second.text == CSS
+    assert second.headers["etag"] == first.headers["etag"]
+    assert "bundle.css" in statics._memory
+
+
+def test_etag_is_strong_and_revalidates(static_dir):
+    client, _ = _client(static_dir)
+    etag = client.get("/static/v1/css/bundle.css").headers["etag"]
+    assert not etag.startswith("W/")
+
+    response = client.get("/static/v1/css/bundle.css", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_precompressed_sibling_is_cached(static_dir):
+    (static_dir / "bundle.css.gz").write_bytes(gzip.compress(CSS.encode()))
+    client, _ = _client(static_dir)
+    response = client.get(
+        "/static/v1/css/bundle.css", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == CSS
+
+
+def test_range_request_from_memory(static_dir):
+    client, _ = _client(static_dir)
+    response = client.get(
+        "/static/v1/css/bundle.css",
+        headers={"Range": "bytes=0-3", "Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 206
+    assert response.content == b"body"
+    assert response.headers["content-range"] == f"bytes 0-3/{len(CSS)}"
+
+
+def test_suffix_range_request(static_dir):
+    client, _ = _client(static_dir)
+    response = client.get(
+        "/static/v1/css/bundle.css",
+        headers={"Range": "bytes=-2", "Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 206
+    assert response.content == b"}\n"
+
+
+def test_unsatisfiable_range(static_dir):
+    client, _ = _client(static_dir)
+    response = client.get(
+        "/static/v1/css/bundle.css",
+        headers={"Range": f"bytes={len(CSS)}-", "Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CSS)}"
+
+
+def test_large_files_are_served_from_disk(static_dir):
+    client, statics = _client(static_dir, max_file_size=1024)
+    response = client.get("/static/v1/css/big.js", headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206
+    assert response.content == b"x" * 10
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert "big.js" not in statics._memory
+
+
+def test_mutable_mode_skips_caching(static_dir):
+    client, statics = _client(static_dir, immutable=False)
+    response = client.get("/static/v1/css/bundle.css")
+    assert response.status_code == 200
+    assert "cache-control" not in response.headers
+    assert statics._memory == {}
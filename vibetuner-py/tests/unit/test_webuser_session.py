@@ -72,3 +72,40 @@ async def test_auth_backend_logs_warning_when_session_invalid(log_sink):
     assert any(
         "Clearing invalid session user data" in message for message in log_sink
     ), log_sink
+
+
+@pytest.mark.asyncio
+async def test_auth_backend_reuses_validated_user_for_same_payload():
+    """Repeat requests with the same session user skip pydantic validation."""
+    from vibetuner.frontend.middleware import _validate_session_user
+
+    _validate_session_user.cache_clear()
+    payload = {"id": "u1", "email": "ada@example.com", "language": "ca"}
+
+    first_result = await AuthBackend().authenticate(
+        _make_conn_with_session_user(payload)
+    )
+    second_result = await AuthBackend().authenticate(
+        _make_conn_with_session_user(dict(reversed(payload.items())))
+    )
+    assert first_result is not None
+    assert second_result is not None
+    _, first = first_result
+    _, second = second_result
+
+    info = _validate_session_user.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    assert first == second
+    # Each request gets its own instance so mutations don't leak across requests.
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_auth_backend_does_not_cache_invalid_user():
+    from vibetuner.frontend.middleware import _validate_session_user
+
+    _validate_session_user.cache_clear()
+    conn = _make_conn_with_session_user({"id": "u1"})
+
+    assert await AuthBackend().authenticate(conn) is None
+    assert _validate_session_user.cache_info().currsize == 0